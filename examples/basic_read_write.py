@@ -8,8 +8,9 @@ This script demonstrates basic methods for reading and writing PLC device data u
 
 import sys
 import time
+import struct
 import logging
-from mcplcwatch import PlcClient, PlcError, PlcCommunicationError, PlcTimeoutError, PlcDeviceError
+from mcplcwatch import PlcClientPool, PlcError, PlcCommunicationError, PlcTimeoutError, PlcDeviceError
 
 # ロギングの設定 (Logging configuration)
 logging.basicConfig(
@@ -30,22 +31,28 @@ def read_data_example(plc):
     try:
         # 単一デバイスの読み取り (Read a single device)
         d_value = plc.read_device('D', 100)
-        logger.info(f"D100 value: {d_value}")
-        
-        # 複数デバイスの読み取り (Read multiple devices)
+        logger.info("D100 value: %s", d_value)
+
+        # 複数デバイスの読み取り (1回のログ呼び出しにまとめる)
+        # (Read multiple devices (batched into one log call))
         d_values = plc.read_devices('D', 200, 10)  # D200からD209まで10点読み取り (Read 10 points from D200 to D209)
-        for i, value in enumerate(d_values):
-            logger.info(f"D{200 + i} value: {value}")
-        
+        logger.info("%s", "\n".join(f"D{200 + i} value: {value}" for i, value in enumerate(d_values)))
+
         # ビットデバイスの読み取り (Read bit devices)
         m_value = plc.read_bits('M', 100, 8)  # M100からM107まで8点読み取り (Read 8 points from M100 to M107)
-        for i, value in enumerate(m_value):
-            logger.info(f"M{100 + i} value: {value}")
-        
+        logger.info("%s", "\n".join(f"M{100 + i} value: {value}" for i, value in enumerate(m_value)))
+
         # 文字列の読み取り (Read string)
         str_value = plc.read_string('D', 300, max_length=20)
-        logger.info(f"String from D300: {str_value}")
-        
+        logger.info("String from D300: %s", str_value)
+
+        # 事前確保したバッファへの読み取り (ループで再利用すれば割り当てが発生しません)
+        # (Read into a preallocated buffer (reusing it in a loop avoids allocation))
+        buf = bytearray(10 * 2)
+        plc.read_devices_into('D', 200, 10, buf)
+        words = struct.unpack('<10H', buf)
+        logger.info("D200-D209 via read_devices_into: %s", list(words))
+
     except PlcCommunicationError as e:
         logger.error(f"Communication error: {e}")
     except PlcTimeoutError as e:
@@ -108,10 +115,13 @@ def main():
     host = sys.argv[1]
     port = int(sys.argv[2])
     
+    # クライアントプールの作成 (Create client pool)
+    pool = PlcClientPool(timeout=2.0)
+
     try:
         # PLCに接続 (Connect to PLC)
         logger.info(f"Connecting to PLC: {host}:{port}")
-        plc = PlcClient(host=host, port=port, timeout=2.0)
+        plc = pool.get(host, port)
         
         # 読み取りサンプルの実行 (Run read sample)
         logger.info("Running read example...")
@@ -134,10 +144,9 @@ def main():
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
     finally:
-        # 接続を閉じる (Close connection)
+        # 接続を閉じる (Close connections)
         logger.info("Closing connection to PLC")
-        if 'plc' in locals():
-            plc.close()
+        pool.close_all()
 
 
 if __name__ == "__main__":
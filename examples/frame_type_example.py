@@ -9,7 +9,7 @@ This script demonstrates how to communicate with PLCs using both 3E and 4E frame
 import sys
 import time
 import logging
-from mcplcwatch import PlcClient, MCProtocol, PlcError, PlcCommunicationError
+from mcplcwatch import PlcClientPool, MCProtocol, PlcError, PlcCommunicationError
 
 # ロギングの設定 (Logging configuration)
 logging.basicConfig(
@@ -19,24 +19,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def connect_with_3e_frame(host, port):
+def connect_with_3e_frame(pool, host, port):
     """
     3Eフレームを使用してPLCに接続するサンプル
     Sample of connecting to PLC using 3E frame
-    
+
     引数 (Arguments):
+        pool (PlcClientPool): クライアントプール (Client pool)
         host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
         port (int): PLCのポート番号 (PLC port number)
-        
+
     戻り値 (Returns):
         PlcClient: 接続されたPLCクライアント (Connected PLC client)
     """
     try:
         logger.info(f"Connecting with 3E frame: {host}:{port}")
-        plc = PlcClient(
-            host=host,
-            port=port,
-            timeout=2.0,
+        plc = pool.get(
+            host,
+            port,
             frame_type=MCProtocol.FRAME_3E,  # 3Eフレーム (デフォルト) (3E frame (default))
             # 3Eフレームの標準的なパラメータ (Standard parameters for 3E frame)
             network_no=0,       # ネットワーク番号 (0: 自局) (Network number (0: local station))
@@ -51,24 +51,24 @@ def connect_with_3e_frame(host, port):
         return None
 
 
-def connect_with_4e_frame(host, port):
+def connect_with_4e_frame(pool, host, port):
     """
     4Eフレームを使用してPLCに接続するサンプル
     Sample of connecting to PLC using 4E frame
-    
+
     引数 (Arguments):
+        pool (PlcClientPool): クライアントプール (Client pool)
         host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
         port (int): PLCのポート番号 (PLC port number)
-        
+
     戻り値 (Returns):
         PlcClient: 接続されたPLCクライアント (Connected PLC client)
     """
     try:
         logger.info(f"Connecting with 4E frame: {host}:{port}")
-        plc = PlcClient(
-            host=host,
-            port=port,
-            timeout=2.0,
+        plc = pool.get(
+            host,
+            port,
             frame_type=MCProtocol.FRAME_4E,  # 4Eフレーム (4E frame)
             # 4Eフレームのパラメータ (ネットワーク経由での接続用) (Parameters for 4E frame (for network connection))
             network_no=0,       # ネットワーク番号 (必要に応じて変更) (Network number (change as needed))
@@ -148,30 +148,26 @@ def main():
     logger.info(f"Target PLC: {host}:{port}")
     logger.info("--------------------------------------")
     
-    # 3Eフレームでの通信例 (Communication example with 3E frame)
-    plc_3e = None
+    # クライアントプールの作成 (接続はフレームタイプごとに再利用されます)
+    # (Create client pool (connections are reused per frame type))
+    pool = PlcClientPool(timeout=2.0)
+
     try:
-        plc_3e = connect_with_3e_frame(host, port)
+        # 3Eフレームでの通信例 (Communication example with 3E frame)
+        plc_3e = connect_with_3e_frame(pool, host, port)
         if plc_3e:
             read_write_example(plc_3e, "3E")
-    finally:
-        if plc_3e:
-            logger.info("Closing 3E frame connection")
-            plc_3e.close()
-    
-    logger.info("--------------------------------------")
-    
-    # 4Eフレームでの通信例 (Communication example with 4E frame)
-    plc_4e = None
-    try:
-        plc_4e = connect_with_4e_frame(host, port)
+
+        logger.info("--------------------------------------")
+
+        # 4Eフレームでの通信例 (Communication example with 4E frame)
+        plc_4e = connect_with_4e_frame(pool, host, port)
         if plc_4e:
             read_write_example(plc_4e, "4E")
     finally:
-        if plc_4e:
-            logger.info("Closing 4E frame connection")
-            plc_4e.close()
-    
+        logger.info("Closing pooled connections")
+        pool.close_all()
+
     logger.info("--------------------------------------")
     logger.info("Sample execution completed")
 
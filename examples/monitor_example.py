@@ -31,7 +31,11 @@ def on_device_change(device_type, device_number, old_value, new_value):
         old_value: 変更前の値 (Value before change)
         new_value: 変更後の値 (Value after change)
     """
-    logger.info(f"{device_type}{device_number} changed from {old_value} to {new_value}")
+    # 高頻度コールバックのため、出力されないレベルでは整形処理ごとスキップする
+    # (Hot callback: skip even the formatting work when the level is disabled)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("%s%d changed from %s to %s", device_type, device_number, old_value, new_value)
 
 
 def on_device_error(device_type, device_number, error):
@@ -44,7 +48,7 @@ def on_device_error(device_type, device_number, error):
         device_number (int): デバイス番号 (Device number)
         error: 発生したエラー (Error that occurred)
     """
-    logger.error(f"Error occurred while monitoring {device_type}{device_number}: {error}")
+    logger.error("Error occurred while monitoring %s%s: %s", device_type, device_number, error)
 
 
 def main():
@@ -97,19 +101,20 @@ def main():
         logger.info("Press Ctrl+C to exit")
         
         try:
-            # 初期値を表示 (Display initial values)
+            # 初期値を表示 (1回のログ呼び出しにまとめてハンドラのロックを節約する)
+            # (Display initial values (batched into one log call to amortize handler locking))
             d100 = plc.read_device('D', 100)
-            logger.info(f"D100 initial value: {d100}")
-            
+            lines = [f"D100 initial value: {d100}"]
+
             d_values = plc.read_devices('D', 200, 5)
-            for i, value in enumerate(d_values):
-                logger.info(f"D{200 + i} initial value: {value}")
-            
+            lines.extend(f"D{200 + i} initial value: {value}" for i, value in enumerate(d_values))
+
             m_values = plc.read_devices('M', 100, 8)
-            for i, value in enumerate(m_values):
-                logger.info(f"M{100 + i} initial value: {value}")
+            lines.extend(f"M{100 + i} initial value: {value}" for i, value in enumerate(m_values))
+
+            logger.info("%s", "\n".join(lines))
         except PlcError as e:
-            logger.error(f"Failed to read initial values: {e}")
+            logger.error("Failed to read initial values: %s", e)
         
         # 監視処理のメインループ (Main loop for monitoring process)
         while not stop_event:
@@ -5,16 +5,21 @@
 Sample program to monitor multiple PLCs simultaneously
 
 このサンプルでは、異なるIPアドレスを持つ複数のPLCに接続し、
-それぞれのPLCの異なるデバイスを同時に監視する方法を示します。
+単一のasyncioイベントループからすべてのPLCを同時に監視する方法を示します。
+PLCごとに監視スレッドを起動する代わりに、各PLCのポーリングをコルーチンとして
+1つのループで駆動するため、PLC数が増えてもスレッド数は増えません。
 
 This sample demonstrates how to connect to multiple PLCs with different IP addresses
-and monitor different devices of each PLC simultaneously.
+and monitor all of them from a single asyncio event loop. Instead of starting one
+monitoring thread per PLC, each PLC's polling is driven as a coroutine on one loop,
+so the thread count stays constant as the number of PLCs grows.
 """
 
-import time
+import asyncio
 import logging
 import sys
 import signal
+from collections import namedtuple
 from mcplcwatch.client import PlcClient
 from mcplcwatch.monitor import PlcMonitor
 from mcplcwatch.error import PlcError
@@ -26,26 +31,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# PLC接続情報 (PLC connection information)
+# PLC接続情報 (属性アクセスが辞書参照より軽量なnamedtupleを使用)
+# (PLC connection information (namedtuples: attribute access is lighter than dict lookups))
+PlcConfig = namedtuple('PlcConfig', ['name', 'host', 'port', 'devices'])
+DeviceConfig = namedtuple('DeviceConfig', ['type', 'number', 'count'])
+
 PLC_CONFIGS = [
-    {
-        'name': 'PLC1',
-        'host': '192.168.1.10',  # PLC1のIPアドレス (IP address of PLC1)
-        'port': 5007,            # PLC1のポート番号 (Port number of PLC1)
-        'devices': [
-            {'type': 'D', 'number': 100, 'count': 10},  # D100からD109までの10ワードを監視 (Monitor 10 words from D100 to D109)
-            {'type': 'M', 'number': 0, 'count': 8}      # M0からM7までの8ビットを監視 (Monitor 8 bits from M0 to M7)
+    PlcConfig(
+        name='PLC1',
+        host='192.168.1.10',  # PLC1のIPアドレス (IP address of PLC1)
+        port=5007,            # PLC1のポート番号 (Port number of PLC1)
+        devices=[
+            DeviceConfig('D', 100, 10),  # D100からD109までの10ワードを監視 (Monitor 10 words from D100 to D109)
+            DeviceConfig('M', 0, 8),     # M0からM7までの8ビットを監視 (Monitor 8 bits from M0 to M7)
         ]
-    },
-    {
-        'name': 'PLC2',
-        'host': '192.168.1.20',  # PLC2のIPアドレス (IP address of PLC2)
-        'port': 5007,            # PLC2のポート番号 (Port number of PLC2)
-        'devices': [
-            {'type': 'D', 'number': 200, 'count': 5},   # D200からD204までの5ワードを監視 (Monitor 5 words from D200 to D204)
-            {'type': 'X', 'number': 0, 'count': 16}     # X0からX15までの16ビットを監視 (Monitor 16 bits from X0 to X15)
+    ),
+    PlcConfig(
+        name='PLC2',
+        host='192.168.1.20',  # PLC2のIPアドレス (IP address of PLC2)
+        port=5007,            # PLC2のポート番号 (Port number of PLC2)
+        devices=[
+            DeviceConfig('D', 200, 5),   # D200からD204までの5ワードを監視 (Monitor 5 words from D200 to D204)
+            DeviceConfig('X', 0, 16),    # X0からX15までの16ビットを監視 (Monitor 16 bits from X0 to X15)
         ]
-    }
+    ),
 ]
 
 # 実際に接続する際には、実在するPLCのIPアドレスとポート番号に変更してください
@@ -65,7 +74,11 @@ def on_value_changed(plc_name, device_type, device_number, old_value, new_value)
         old_value: 変更前の値 (Value before change)
         new_value: 変更後の値 (Value after change)
     """
-    logger.info(f"{plc_name}: {device_type}{device_number} value changed: {old_value} -> {new_value}")
+    # 高頻度コールバックのため、出力されないレベルでは整形処理ごとスキップする
+    # (Hot callback: skip even the formatting work when the level is disabled)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("%s: %s%d value changed: %s -> %s", plc_name, device_type, device_number, old_value, new_value)
 
 
 # エラー発生時のコールバック関数 (Callback function for errors)
@@ -79,59 +92,80 @@ def on_error(plc_name, device_info, error):
         device_info: デバイス情報 (Device information)
         error: 発生したエラー (Error that occurred)
     """
-    logger.error(f"{plc_name}: {device_info} error occurred: {error}")
+    logger.error("%s: %s error occurred: %s", plc_name, device_info, error)
+
+
+class _PlcCallbacks:
+    """
+    1つのPLCに対するコールバックをまとめたクラス
+    Class bundling the callbacks for a single PLC
+
+    デバイスごとにクロージャ（lambda）を生成する代わりに、PLCごとに1つの
+    インスタンスを作成し、束縛メソッドをコールバックとして登録します。
+
+    Instead of creating one closure (lambda) per device, one instance is
+    created per PLC and its bound methods are registered as callbacks.
+    """
+
+    __slots__ = ('plc_name',)
+
+    def __init__(self, plc_name):
+        self.plc_name = plc_name
+
+    def on_change(self, device_type, device_number, old_value, new_value):
+        on_value_changed(self.plc_name, device_type, device_number, old_value, new_value)
+
+    def on_err(self, device_type, device_info, error):
+        on_error(self.plc_name, f"{device_type}{device_info}", error)
 
 
 def create_monitor_for_plc(plc_config):
     """
     PLC用のモニターを作成する
     Create a monitor for a PLC
-    
+
     引数 (Arguments):
-        plc_config (dict): PLC設定 (PLC configuration)
-        
+        plc_config (PlcConfig): PLC設定 (PLC configuration)
+
     戻り値 (Returns):
         PlcMonitor: 作成されたモニター (Created monitor)
     """
-    plc_name = plc_config['name']
-    host = plc_config['host']
-    port = plc_config['port']
-    
+    plc_name = plc_config.name
+
     try:
         # PLCクライアントの作成 (Create PLC client)
-        plc_client = PlcClient(host=host, port=port)
-        
+        plc_client = PlcClient(host=plc_config.host, port=plc_config.port)
+
         # モニターの作成 (Create monitor)
         plc_monitor = PlcMonitor(plc_client=plc_client, interval=1.0)
-        
+
+        # PLCごとに1つのコールバックインスタンスを作成 (Create one callback instance per PLC)
+        callbacks = _PlcCallbacks(plc_name)
+
         # 監視デバイスの追加 (Add monitoring devices)
-        for device_config in plc_config['devices']:
-            device_type = device_config['type']
-            device_number = device_config['number']
-            count = device_config['count']
-            
+        for device_config in plc_config.devices:
             # 単一デバイスの場合 (For single device)
-            if count == 1:
+            if device_config.count == 1:
                 plc_monitor.add_device(
-                    device_type=device_type,
-                    device_number=device_number,
-                    callback=lambda dt, dn, ov, nv, plc=plc_name: on_value_changed(plc, dt, dn, ov, nv),
-                    on_error=lambda dt, dn, err, plc=plc_name: on_error(plc, f"{dt}{dn}", err)
+                    device_type=device_config.type,
+                    device_number=device_config.number,
+                    callback=callbacks.on_change,
+                    on_error=callbacks.on_err
                 )
-                logger.info(f"{plc_name}: Added monitoring for device {device_type}{device_number}")
+                logger.info(f"{plc_name}: Added monitoring for device {device_config.type}{device_config.number}")
             # 複数デバイスの場合 (For multiple devices)
             else:
                 plc_monitor.add_devices(
-                    device_type=device_type,
-                    start_number=device_number,
-                    count=count,
-                    callback=lambda dt, dn, ov, nv, plc=plc_name: on_value_changed(plc, dt, dn, ov, nv),
-                    on_error=lambda dt, dn, err, plc=plc_name: on_error(plc, f"{dt}{dn}", err)
+                    device_type=device_config.type,
+                    start_number=device_config.number,
+                    count=device_config.count,
+                    callback=callbacks.on_change,
+                    on_error=callbacks.on_err
                 )
-                logger.info(f"{plc_name}: Added monitoring for devices {device_type}{device_number}-{device_number + count - 1}")
-        
+                logger.info(f"{plc_name}: Added monitoring for devices {device_config.type}{device_config.number}-{device_config.number + device_config.count - 1}")
+
         return plc_monitor
-    
+
     except PlcError as e:
         logger.error(f"{plc_name}: Failed to connect to PLC: {e}")
         return None
@@ -140,57 +174,83 @@ def create_monitor_for_plc(plc_config):
         return None
 
 
-def main():
+async def run_monitor(plc_name, monitor, stop_event):
     """
-    メイン関数
-    Main function
+    1つのPLCモニターをイベントループ上で周期的にポーリングするコルーチン
+    Coroutine that periodically polls one PLC monitor on the event loop
+
+    引数 (Arguments):
+        plc_name (str): PLC名 (PLC name)
+        monitor (PlcMonitor): ポーリング対象のモニター (Monitor to poll)
+        stop_event (asyncio.Event): 終了イベント (Stop event)
     """
-    # 終了フラグ (Exit flag)
-    running = True
-    
+    loop = asyncio.get_running_loop()
+    logger.info(f"{plc_name}: Started polling (interval: {monitor.interval}s)")
+    while not stop_event.is_set():
+        # ブロッキングするPLC読み出しはエグゼキュータで実行し、ループを塞がない
+        # (Run the blocking PLC reads in an executor so the loop is not blocked)
+        await loop.run_in_executor(None, monitor.poll_once)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=monitor.interval)
+        except asyncio.TimeoutError:
+            pass
+    logger.info(f"{plc_name}: Stopped polling")
+
+
+async def main_async(monitors):
+    """
+    すべてのモニターを単一のイベントループで駆動する
+    Drive all monitors on a single event loop
+
+    引数 (Arguments):
+        monitors (list): (PLC名, PlcMonitor)のタプルのリスト (List of (PLC name, PlcMonitor) tuples)
+    """
+    stop_event = asyncio.Event()
+
     # シグナルハンドラの設定 (Set signal handler)
     def signal_handler(sig, frame):
-        nonlocal running
         logger.info("Received exit signal. Stopping monitoring...")
-        running = False
-    
+        stop_event.set()
+
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    
+
+    logger.info("Press Ctrl+C to exit")
+    await asyncio.gather(
+        *(run_monitor(plc_name, monitor, stop_event) for plc_name, monitor in monitors)
+    )
+
+
+def main():
+    """
+    メイン関数
+    Main function
+    """
     # モニターのリスト (List of monitors)
     monitors = []
-    
+
     try:
         # 各PLCに対してモニターを作成 (Create a monitor for each PLC)
         for plc_config in PLC_CONFIGS:
             monitor = create_monitor_for_plc(plc_config)
             if monitor:
-                monitors.append((plc_config['name'], monitor))
-        
+                monitors.append((plc_config.name, monitor))
+
         if not monitors:
             logger.error("No valid monitors. Exiting.")
             return
-        
-        # すべてのモニターを開始 (Start all monitors)
+
+        # すべてのPLCを1つのイベントループで監視 (Monitor all PLCs on one event loop)
         for plc_name, monitor in monitors:
-            monitor.start()
             logger.info(f"{plc_name}: Started monitoring")
-        
-        logger.info("Press Ctrl+C to exit")
-        
-        # メインループ (Main loop)
-        while running:
-            time.sleep(1)
-        
+        asyncio.run(main_async(monitors))
+
     except Exception as e:
         logger.error(f"Unexpected error occurred: {e}")
-    
+
     finally:
-        # すべてのモニターを停止 (Stop all monitors)
         for plc_name, monitor in monitors:
-            if monitor.is_running():
-                monitor.stop()
-                logger.info(f"{plc_name}: Stopped monitoring")
+            logger.info(f"{plc_name}: Stopped monitoring")
 
 
 if __name__ == "__main__":
@@ -11,7 +11,7 @@ For more detailed examples, please refer to the examples directory.
 
 import time
 import logging
-from mcplcwatch import PlcClient, PlcMonitor, PlcError
+from mcplcwatch import PlcClientPool, PlcMonitor, PlcError
 
 
 # ロギングの設定 (Logging configuration)
@@ -33,7 +33,13 @@ def on_change(device_type, device_number, old_value, new_value):
         old_value: 変更前の値 (Value before change)
         new_value: 変更後の値 (Value after change)
     """
-    logger.info(f"{device_type}{device_number} changed from {old_value} to {new_value} ({device_type}{device_number} が {old_value} から {new_value} に変更されました)")
+    # 高頻度コールバックのため、出力されないレベルでは整形処理ごとスキップする
+    # (Hot callback: skip even the formatting work when the level is disabled)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("%s%d changed from %s to %s (%s%d が %s から %s に変更されました)",
+                device_type, device_number, old_value, new_value,
+                device_type, device_number, old_value, new_value)
 
 
 def main():
@@ -45,10 +51,13 @@ def main():
     host = "192.168.10.130"
     port = 2000
     
+    # クライアントプールの作成 (Create client pool)
+    pool = PlcClientPool(timeout=2.0)
+
     try:
         # PLCに接続 (Connect to PLC)
         logger.info(f"Connecting to PLC: {host}:{port} (PLCに接続します)")
-        plc = PlcClient(host=host, port=port, timeout=2.0)
+        plc = pool.get(host, port)
         
         # データの読み取り (Reading data)
         device_type = 'D'
@@ -58,9 +67,10 @@ def main():
         logger.info(f"Reading {element} points of data from {device_type}{device_number} ({device_type}{device_number} から {element}点のデータを読み取ります)")
         result = plc.read_devices(device_type, device_number, element)
         
-        # 結果表示 (Displaying results)
-        for i, value in enumerate(result):
-            logger.info(f"{device_type}{device_number + i}: {value}")
+        # 結果表示 (1回のログ呼び出しにまとめる) (Displaying results (batched into one log call))
+        logger.info("%s", "\n".join(
+            f"{device_type}{device_number + i}: {value}" for i, value in enumerate(result)
+        ))
         
         # 監視設定 (Monitoring setup)
         logger.info("Running monitoring example... (監視機能の例を実行します...)")
@@ -87,10 +97,9 @@ def main():
     except Exception as e:
         logger.error(f"Unexpected error: {e} (予期しないエラー)")
     finally:
-        # 接続を閉じる (Close connection)
-        if 'plc' in locals():
-            logger.info("Closing connection to PLC (PLCとの接続を閉じます)")
-            plc.close()
+        # 接続を閉じる (Close connections)
+        logger.info("Closing connection to PLC (PLCとの接続を閉じます)")
+        pool.close_all()
 
 
 if __name__ == "__main__":
@@ -19,6 +19,10 @@ It provides not only data reading and writing capabilities but also functions to
 
 クラス (Classes):
     - PlcClient: PLCとの基本的な通信を管理するクラス (Class for managing basic communication with PLCs)
+    - AsyncPlcClient: PLCとの非同期通信を行うクラス (Class for asynchronous communication with PLCs)
+    - AsyncPlcClientPool: AsyncPlcClientの固定サイズ接続プールクラス (Fixed-size connection pool class for AsyncPlcClient)
+    - PlcClientPool: PLCとの接続を再利用するためのプールクラス (Pool class for reusing PLC connections)
+    - PlcConnectionPool: 単一のPLCに対する固定サイズの接続プールクラス (Fixed-size connection pool class for a single PLC)
     - PlcMonitor: PLCのデータを監視するクラス (Class for monitoring PLC data)
     - PlcError: PLCとの通信中に発生するエラーを表すクラス (Class representing errors that occur during PLC communication)
 """
@@ -26,12 +30,18 @@ It provides not only data reading and writing capabilities but also functions to
 __version__ = '0.1.0'
 
 from .client import PlcClient
+from .async_client import AsyncPlcClient, AsyncPlcClientPool
 from .monitor import PlcMonitor
+from .pool import PlcClientPool, PlcConnectionPool
 from .error import PlcError, PlcCommunicationError, PlcDeviceError, PlcTimeoutError
 from .protocol import MCProtocol
 
 __all__ = [
     'PlcClient',
+    'AsyncPlcClient',
+    'AsyncPlcClientPool',
+    'PlcClientPool',
+    'PlcConnectionPool',
     'PlcMonitor',
     'PlcError',
     'PlcCommunicationError',
@@ -0,0 +1,78 @@
+"""
+_diff.py - 監視値の変化検出カーネルを含む内部モジュール
+_diff.py - Internal module containing the change-detection kernel for monitored values
+
+本モジュールには、前回値と今回値を比較して変化したインデックスを返すカーネル関数が
+含まれています。カーネルはNumbaでコンパイル可能な形で記述されており、Numbaが
+インストールされている環境では自動的にJITコンパイルされます。Numbaがない場合は
+純Python実装がそのまま使用されます。
+
+This module contains the kernel function that compares previous and current
+values and returns the indices that changed. The kernel is written in a
+Numba-compilable form and is JIT-compiled automatically when Numba is
+installed; without Numba the pure-Python implementation is used as is.
+"""
+
+try:
+    # Numbaが利用可能な場合はJITコンパイルする (任意の高速化)
+    # (JIT-compile when Numba is available (optional speed boost))
+    import numba
+except ImportError:
+    numba = None
+
+
+def _diff_indices_py(prev, cur):
+    """
+    2つの値シーケンスを比較し、変化したインデックスのリストを返す (純Python実装)
+    Compare two value sequences and return the list of changed indices (pure-Python implementation)
+
+    引数 (Arguments):
+        prev: 前回の値のシーケンス (Sequence of previous values)
+        cur: 今回の値のシーケンス (Sequence of current values)
+
+    戻り値 (Returns):
+        list: 値が変化したインデックスのリスト (List of indices whose values changed)
+    """
+    n = min(len(prev), len(cur))
+    changed = []
+    for i in range(n):
+        if prev[i] != cur[i]:
+            changed.append(i)
+    return changed
+
+
+if numba is None:
+    diff_indices = _diff_indices_py
+else:
+    # cache=Trueによりコンパイル結果はディスクに保存され、次回のインポートで再利用されます
+    # (With cache=True the compiled result is stored on disk and reused on the next import)
+    _diff_indices_jit = numba.jit(cache=True)(_diff_indices_py)
+    _use_jit = True
+
+    def diff_indices(prev, cur):
+        """
+        2つの値シーケンスを比較し、変化したインデックスのリストを返す
+        Compare two value sequences and return the list of changed indices
+
+        JITコンパイル版を呼び出し、型付けに失敗した場合 (空リストや
+        Numbaが扱えない要素型など) は純Python実装に恒久的に切り替えます。
+        (Calls the JIT-compiled version; if typing fails (empty lists,
+        element types Numba cannot handle, etc.) it permanently falls
+        back to the pure-Python implementation.)
+
+        引数 (Arguments):
+            prev: 前回の値のシーケンス (Sequence of previous values)
+            cur: 今回の値のシーケンス (Sequence of current values)
+
+        戻り値 (Returns):
+            list: 値が変化したインデックスのリスト (List of indices whose values changed)
+        """
+        global _use_jit
+        if _use_jit:
+            try:
+                return list(_diff_indices_jit(prev, cur))
+            except Exception:
+                # コンパイルや型付けの失敗で監視ループを止めないようにする
+                # (Never let a compilation or typing failure stop the poll loop)
+                _use_jit = False
+        return _diff_indices_py(prev, cur)
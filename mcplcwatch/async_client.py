@@ -0,0 +1,405 @@
+"""
+async_client.py - PLCとの非同期通信を行うクライアントモジュール
+async_client.py - Client module for asynchronous communication with PLCs
+
+本モジュールには、asyncioを使用してPLCとの通信を行う非同期クライアントクラスが
+含まれています。複数のPLCや複数の接続に対する要求をasyncio.gatherで並行に
+発行でき、スループットが1接続の往復時間に制限されなくなります。
+
+This module contains an asynchronous client class that communicates with PLCs
+using asyncio. Requests to multiple PLCs or multiple connections can be issued
+concurrently with asyncio.gather, so throughput is no longer pinned to the
+round-trip time of a single connection.
+"""
+
+import asyncio
+from .protocol import MCProtocol
+from .client import _END_CODE_MESSAGES
+from .error import PlcError, PlcCommunicationError, PlcDeviceError, PlcTimeoutError
+
+
+class AsyncPlcClient:
+    """
+    PLCとの非同期通信を行うクライアントクラス
+    Client class for asynchronous communication with PLCs
+
+    このクラスは、PlcClientと同じMCプロトコルの読み書き機能をコルーチンとして
+    提供します。1つの接続上のフレームのやり取りはasyncio.Lockで直列化される
+    ため、複数のコルーチンから同じクライアントを安全に使用できます。
+
+    This class provides the same MC protocol read/write functionality as
+    PlcClient as coroutines. Frame exchanges on one connection are serialized
+    with an asyncio.Lock, so the same client can be used safely from multiple
+    coroutines.
+
+    属性 (Attributes):
+        host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
+        port (int): PLCのポート番号 (PLC port number)
+        timeout (float): 通信タイムアウト時間（秒） (Communication timeout in seconds)
+        frame_type (str): 使用するフレームタイプ ("3E"または"4E") (Frame type to use ("3E" or "4E"))
+        connected (bool): 接続済みかどうか (Whether the client is connected)
+    """
+
+    def __init__(self, host, port, timeout=1.0, frame_type=MCProtocol.FRAME_3E,
+                 network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
+        """
+        初期化メソッド (接続はconnect()で明示的に行う)
+        Initialization method (connection is established explicitly with connect())
+
+        引数 (Arguments):
+            host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
+            port (int): PLCのポート番号 (PLC port number)
+            timeout (float): 通信タイムアウト時間（秒） (Communication timeout in seconds)
+            frame_type (str): 使用するフレームタイプ ("3E"または"4E") (Frame type to use ("3E" or "4E"))
+            network_no (int): ネットワーク番号 (Network number)
+            pc_no (int): PC番号 (PC number)
+            unit_io (int): ユニットI/O番号 (Unit I/O number)
+            unit_station (int): ユニット局番号 (Unit station number)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+        # MCプロトコル設定 (MC protocol settings)
+        if frame_type not in [MCProtocol.FRAME_3E, MCProtocol.FRAME_4E]:
+            raise ValueError(f"Unsupported frame type: {frame_type}")
+        self.frame_type = frame_type
+        self.network_no = network_no
+        self.pc_no = pc_no
+        self.unit_io = unit_io
+        self.unit_station = unit_station
+
+        # フレームタイプごとの応答レイアウト (PlcClientと同じ事前計算)
+        # (Response layout per frame type (same precomputation as PlcClient))
+        if frame_type == MCProtocol.FRAME_3E:
+            self._recv_header_length = 9
+            self._recv_length_index = 7
+            self._end_code_offset = 9
+        else:  # FRAME_4E
+            self._recv_header_length = 4
+            self._recv_length_index = 2
+            self._end_code_offset = 11
+
+        self.connected = False
+        self._reader = None
+        self._writer = None
+        # 1接続上のフレーム交換を直列化するロック (Lock serializing frame exchanges on one connection)
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect(self):
+        """
+        PLCに接続する
+        Connect to the PLC
+
+        戻り値 (Returns):
+            bool: 接続に成功した場合はTrue (True if connection was successful)
+
+        例外 (Exceptions):
+            PlcCommunicationError: 接続に失敗した場合 (When connection fails)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        try:
+            if self._writer:
+                await self.close()
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout=self.timeout
+            )
+            self.connected = True
+            return True
+        except asyncio.TimeoutError:
+            self.connected = False
+            raise PlcTimeoutError(f"Timeout occurred while connecting to PLC: {self.host}:{self.port}")
+        except OSError as e:
+            self.connected = False
+            raise PlcCommunicationError(f"Failed to connect to PLC: {self.host}:{self.port}", e)
+
+    async def close(self):
+        """
+        接続を閉じる
+        Close the connection
+        """
+        if self._writer:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._reader = None
+            self._writer = None
+        self.connected = False
+
+    async def _send_and_receive(self, frame):
+        """
+        フレームを送信し、応答を1フレーム分受信する
+        Send a frame and receive exactly one response frame
+
+        引数 (Arguments):
+            frame (bytes): 送信するフレーム (Frame to send)
+
+        戻り値 (Returns):
+            bytes: 受信した応答 (Received response)
+
+        例外 (Exceptions):
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        async with self._lock:
+            if not self.connected:
+                await self.connect()
+
+            try:
+                # フレーム送信 (Send frame)
+                self._writer.write(frame)
+                await asyncio.wait_for(self._writer.drain(), timeout=self.timeout)
+
+                # ヘッダ部を受信し、応答データ長を解析してから残りを受信する
+                # (Receive the header, decode the response data length, then receive the rest)
+                header = await asyncio.wait_for(
+                    self._reader.readexactly(self._recv_header_length), timeout=self.timeout
+                )
+                length_index = self._recv_length_index
+                data_length = header[length_index] | (header[length_index + 1] << 8)
+                body = await asyncio.wait_for(
+                    self._reader.readexactly(data_length), timeout=self.timeout
+                )
+                response = header + body
+
+            except asyncio.TimeoutError:
+                self.connected = False
+                raise PlcTimeoutError(f"Timeout occurred while communicating with PLC")
+            except (asyncio.IncompleteReadError, OSError) as e:
+                self.connected = False
+                raise PlcCommunicationError(f"Socket error occurred: {e}")
+
+            # エンドコード (正常終了: 0, エラー: 非0) (End code (Normal completion: 0, Error: non-zero))
+            end_code_offset = self._end_code_offset
+            end_code = response[end_code_offset] | (response[end_code_offset + 1] << 8)
+            if end_code != 0:
+                error_msg = _END_CODE_MESSAGES.get(end_code, f"Unknown error code: 0x{end_code:04X}")
+                raise PlcCommunicationError(f"PLC returned error: {error_msg} (0x{end_code:04X})")
+
+            return response
+
+    async def read_devices(self, device_type, device_number, count=1):
+        """
+        デバイスを読み出す
+        Read devices
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (D, M, X, Yなど) (Device type (D, M, X, Y, etc.))
+            device_number (int): 先頭デバイス番号 (Starting device number)
+            count (int): 読み出すデバイス点数 (Number of device points to read)
+
+        戻り値 (Returns):
+            list: 読み出したデータのリスト (List of read data)
+
+        例外 (Exceptions):
+            PlcDeviceError: デバイスタイプが不正な場合 (When the device type is invalid)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        # デバイスタイプのチェック (Check device type)
+        if device_type not in MCProtocol.DEVICE_CODES:
+            raise PlcDeviceError(f"Unsupported device type", device_type)
+
+        # ビットデバイスかどうかの判定 (Determine if it's a bit device)
+        is_bit = device_type in MCProtocol.BIT_DEVICES
+
+        # 読み出しフレームの作成 (Create read frame)
+        frame = MCProtocol.create_read_frame(
+            device_type, device_number, count, is_bit,
+            frame_type=self.frame_type,
+            network_no=self.network_no,
+            pc_no=self.pc_no,
+            unit_io=self.unit_io,
+            unit_station=self.unit_station
+        )
+
+        # 送信と受信 (Send and receive)
+        response = await self._send_and_receive(frame)
+
+        # 応答の解析 (Parse response)
+        return MCProtocol.parse_read_response(response, count, is_bit, self.frame_type)
+
+    async def read_device(self, device_type, device_number):
+        """
+        単一デバイスを読み出す
+        Read a single device
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (D, M, X, Yなど) (Device type (D, M, X, Y, etc.))
+            device_number (int): デバイス番号 (Device number)
+
+        戻り値 (Returns):
+            int or bool: 読み出したデータ (Read data)
+        """
+        result = await self.read_devices(device_type, device_number, 1)
+        return result[0]
+
+    async def write_devices(self, device_type, device_number, values):
+        """
+        デバイスに値を書き込む
+        Write values to devices
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (D, M, X, Yなど) (Device type (D, M, X, Y, etc.))
+            device_number (int): 先頭デバイス番号 (Starting device number)
+            values (list): 書き込む値のリスト (List of values to write)
+
+        戻り値 (Returns):
+            bool: 書き込みに成功した場合はTrue (True if writing was successful)
+
+        例外 (Exceptions):
+            PlcDeviceError: デバイスタイプが不正な場合 (When the device type is invalid)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        # デバイスタイプのチェック (Check device type)
+        if device_type not in MCProtocol.DEVICE_CODES:
+            raise PlcDeviceError(f"Unsupported device type", device_type)
+
+        # 値が単一の場合はリストに変換 (Convert single value to list)
+        if not isinstance(values, list):
+            values = [values]
+
+        # ビットデバイスかどうかの判定 (Determine if it's a bit device)
+        is_bit = device_type in MCProtocol.BIT_DEVICES
+
+        # 書き込みフレームの作成 (Create write frame)
+        frame = MCProtocol.create_write_frame(
+            device_type, device_number, values, is_bit,
+            frame_type=self.frame_type,
+            network_no=self.network_no,
+            pc_no=self.pc_no,
+            unit_io=self.unit_io,
+            unit_station=self.unit_station
+        )
+
+        # 送信と受信 (Send and receive)
+        await self._send_and_receive(frame)
+        return True
+
+    async def write_device(self, device_type, device_number, value):
+        """
+        単一デバイスに値を書き込む
+        Write a value to a single device
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (D, M, X, Yなど) (Device type (D, M, X, Y, etc.))
+            device_number (int): デバイス番号 (Device number)
+            value (int or bool): 書き込む値 (Value to write)
+
+        戻り値 (Returns):
+            bool: 書き込みに成功した場合はTrue (True if writing was successful)
+        """
+        return await self.write_devices(device_type, device_number, [value])
+
+
+class AsyncPlcClientPool:
+    """
+    AsyncPlcClientの固定サイズ接続プールクラス
+    Fixed-size connection pool class for AsyncPlcClient
+
+    N本の接続を保持し、asyncio.gatherで発行された要求を複数の接続に
+    分散させます。スループットは接続数に応じてスケールします。
+
+    Keeps N connections and spreads requests issued with asyncio.gather over
+    multiple connections. Throughput scales with the number of connections.
+
+    使用例 (Usage):
+        pool = AsyncPlcClientPool('192.168.0.1', 5000, size=4)
+        await pool.connect()
+        async with pool.borrow() as plc:
+            value = await plc.read_device('D', 100)
+        await pool.close_all()
+    """
+
+    def __init__(self, host, port, size=2, **kwargs):
+        """
+        初期化メソッド
+        Initialization method
+
+        引数 (Arguments):
+            host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
+            port (int): PLCのポート番号 (PLC port number)
+            size (int): プールする接続数 (Number of pooled connections)
+            **kwargs: AsyncPlcClientに渡す追加の引数 (Additional arguments passed to AsyncPlcClient)
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self._clients = [AsyncPlcClient(host, port, **kwargs) for _ in range(size)]
+        # Python 3.9以前ではasyncio.Queueが生成時のイベントループに束縛されるため、
+        # 実行中のループ上で最初にawaitされるconnect()まで生成を遅延する
+        # (On Python 3.9 and earlier asyncio.Queue binds to the event loop at
+        # creation time, so creation is deferred to connect(), the first call
+        # awaited on the running loop)
+        self._queue = None
+
+    async def connect(self):
+        """
+        プール内のすべての接続を確立する
+        Establish all connections in the pool
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            for client in self._clients:
+                self._queue.put_nowait(client)
+        await asyncio.gather(*(client.connect() for client in self._clients))
+
+    def borrow(self):
+        """
+        接続を借り出す非同期コンテキストマネージャを返す
+        Return an asynchronous context manager that borrows a connection
+
+        戻り値 (Returns):
+            _BorrowedClient: 非同期コンテキストマネージャ (Asynchronous context manager)
+
+        例外 (Exceptions):
+            PlcError: connect()が呼び出されていない場合 (If connect() has not been called)
+        """
+        if self._queue is None:
+            raise PlcError("Pool is not connected. Call connect() first")
+        return _BorrowedClient(self._queue)
+
+    async def close_all(self):
+        """
+        プール内のすべての接続を閉じる
+        Close all connections in the pool
+        """
+        await asyncio.gather(*(client.close() for client in self._clients))
+
+
+class _BorrowedClient:
+    """
+    プールから借り出した接続を返却する内部コンテキストマネージャ
+    Internal context manager that returns a borrowed connection to the pool
+    """
+
+    __slots__ = ('_queue', '_client')
+
+    def __init__(self, queue):
+        self._queue = queue
+        self._client = None
+
+    async def __aenter__(self):
+        self._client = await self._queue.get()
+        return self._client
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # 例外発生後の接続は状態が不明のため、返却前に再接続を試みる
+        # (The connection state is unknown after an exception, so try to reconnect before returning it)
+        if exc_type is not None:
+            try:
+                await self._client.connect()
+            except PlcError:
+                pass
+        self._queue.put_nowait(self._client)
+        self._client = None
@@ -9,11 +9,58 @@ This module contains a client class for communicating with PLCs using the MC pro
 It provides basic read and write functionality.
 """
 
+import contextlib
+import functools
 import socket
+import struct
 import time
+import weakref
 from .protocol import MCProtocol
 from .error import PlcError, PlcCommunicationError, PlcDeviceError, PlcTimeoutError
 
+try:
+    # 任意のネイティブコーデック拡張 (C/Cython実装のmcplcwatch._codecが
+    # インストールされている場合のみ使用される任意の高速化)
+    # (Optional native codec extension (optional speedup, used only when a
+    # C/Cython implementation of mcplcwatch._codec is installed))
+    from . import _codec
+except ImportError:
+    _codec = None
+
+
+def _safe_close(sock):
+    """
+    ソケットをエラーを無視して閉じる (weakref.finalizeから呼び出される)
+    Close a socket ignoring errors (called from weakref.finalize)
+
+    引数 (Arguments):
+        sock (socket): 閉じるソケット (Socket to close)
+    """
+    try:
+        sock.close()
+    except Exception:
+        pass
+
+
+# 事前コンパイル済みのリトルエンディアン16ビット用Struct (応答コードの解析に使用)
+# (Precompiled Struct for little-endian 16-bit values (used to decode the end code))
+_U16_LE = struct.Struct('<H')
+
+# 代表的なエラーコードのメッセージ (応答がエラーの場合のみ参照される)
+# (Typical error code messages (consulted only when the response is an error))
+_END_CODE_MESSAGES = {
+    0xC050: "Read/write request to unsupported device",
+    0xC051: "Read/write request with unsupported number of points",
+    0xC052: "Read/write request to word device with bit specification",
+    0xC054: "Read/write request with invalid specification of device",
+    0xC056: "Read/write request with device out of range",
+    0xC059: "Read/write request with invalid specification of data count",
+    0xC05B: "Read/write request with invalid specification of stored data",
+    0xC05C: "Read/write request with invalid specification of block",
+    0xC06B: "Request when CPU is in RUN mode and writing is disabled",
+    0x0055: "Write operation not allowed. PLC is in write-protected mode."  # 書き込み禁止モード
+}
+
 
 class PlcClient:
     """
@@ -39,7 +86,7 @@ class PlcClient:
     """
     
     def __init__(self, host, port, timeout=1.0, auto_reconnect=True, frame_type=MCProtocol.FRAME_3E,
-                 network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
+                 network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0, nodelay=True):
         """
         初期化メソッド
         Initialization method
@@ -54,14 +101,26 @@ class PlcClient:
             pc_no (int): PC番号 (PC number)
             unit_io (int): ユニットI/O番号 (Unit I/O number)
             unit_station (int): ユニット局番号 (Unit station number)
+            nodelay (bool): TCP_NODELAYを有効にするかどうか。小さな要求/応答の
+                            やり取りではNagleアルゴリズムによる遅延を回避できます。
+                            帯域が制約されたWANではFalseにしてください。
+                            (Whether to enable TCP_NODELAY. Avoids delays from
+                            Nagle's algorithm for small request/response
+                            exchanges. Set to False on bandwidth-constrained WANs.)
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.auto_reconnect = auto_reconnect
+        self.nodelay = nodelay
         self.buffer_size = 1024
         self.sock = None
         self.connected = False
+
+        # 受信バッファ (呼び出しごとの割り当てを避けるため事前確保して再利用する)
+        # (Receive buffer (preallocated and reused to avoid per-call allocation))
+        self._rx_buf = bytearray(4096)
+        self._rx_view = memoryview(self._rx_buf)
         
         # MCプロトコル設定 (MC protocol settings)
         if frame_type not in [MCProtocol.FRAME_3E, MCProtocol.FRAME_4E]:
@@ -71,20 +130,54 @@ class PlcClient:
         self.pc_no = pc_no
         self.unit_io = unit_io
         self.unit_station = unit_station
-        
+
+        # フレームタイプごとの応答レイアウトを事前計算する (ホットパスでの
+        # フレームタイプの文字列比較をなくすため)
+        # (Precompute the response layout per frame type (to eliminate the
+        # frame type string comparisons on the hot path))
+        if frame_type == MCProtocol.FRAME_3E:
+            self._recv_header_length = 9   # データ長フィールドまでのヘッダ長 (Header length through the data length field)
+            self._recv_length_index = 7    # 応答データ長フィールドの位置 (Position of the response data length field)
+            self._end_code_offset = 9      # 応答コードの位置 (Position of the end code)
+            self._min_resp_len = 11        # 最小応答長 (Minimum response length)
+        else:  # FRAME_4E
+            self._recv_header_length = 4
+            self._recv_length_index = 2
+            self._end_code_offset = 11
+            self._min_resp_len = 15
+
+        # 読み出しフレームのキャッシュ (同じ読み出しはフレームを再構築せずに再利用する)
+        # (Read frame cache (identical reads reuse the encoded frame instead of rebuilding it))
+        self._build_read_frame = functools.lru_cache(maxsize=256)(self._create_read_frame)
+
+        # ソケットの後始末用ファイナライザ (__del__の代わりに使用する)
+        # (Finalizer for socket cleanup (used instead of __del__))
+        self._finalizer = None
+
+        # バッチ書き込み中に保留されたフレーム (batch()実行中のみリストになる)
+        # (Write frames held back during batching (a list only while batch() is active))
+        self._batch_frames = None
+
         # 接続 (Connection)
         self.connect()
-    
-    def __del__(self):
+
+    def __enter__(self):
         """
-        デストラクタ
-        Destructor
-        
-        オブジェクトが破棄される際にソケットを閉じます。
-        Closes the socket when the object is destroyed.
+        コンテキストマネージャの開始処理
+        Context manager entry
+
+        戻り値 (Returns):
+            PlcClient: このインスタンス (This instance)
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        コンテキストマネージャの終了処理 (接続を閉じる)
+        Context manager exit (closes the connection)
         """
         self.close()
-    
+
     def connect(self):
         """
         PLCに接続する
@@ -103,6 +196,19 @@ class PlcClient:
             
             # 新しい接続を作成 (Create new connection)
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # インスタンスが回収された場合でもソケットが確実に閉じられるようにする
+            # (Ensure the socket is closed even when the instance is garbage collected)
+            self._finalizer = weakref.finalize(self, _safe_close, self.sock)
+            if self.nodelay:
+                # MCプロトコルは小さな要求と応答の往復であり、Nagleアルゴリズムと
+                # 遅延ACKの組み合わせによる待ち時間（最大約40ms）を避ける
+                # (MC protocol is a round trip of small requests and responses;
+                # avoid the stall (up to ~40ms) caused by Nagle's algorithm
+                # combined with delayed ACKs)
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # 無応答になったPLCを検出するためにキープアライブを有効にする
+            # (Enable keep-alive to detect PLCs that have stopped responding)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.sock.settimeout(self.timeout)
             self.sock.connect((self.host, self.port))
             self.connected = True
@@ -116,6 +222,10 @@ class PlcClient:
         接続を閉じる
         Close the connection
         """
+        if self._finalizer is not None:
+            # 明示的に閉じるため、ファイナライザを解除する (Detach the finalizer since we close explicitly)
+            self._finalizer.detach()
+            self._finalizer = None
         if self.sock:
             try:
                 self.sock.close()
@@ -124,6 +234,77 @@ class PlcClient:
             self.sock = None
         self.connected = False
     
+    def _recv_frame(self):
+        """
+        応答フレームをデータ長フィールドに基づいて1フレーム分受信する
+        Receive exactly one response frame based on its data length field
+
+        TCPでは1回のrecvで応答全体が届く保証はないため、まず固定長の
+        ヘッダ部（データ長フィールドまで）を受信し、リトルエンディアンの
+        応答データ長を解析してから、フレームの残りが揃うまで受信を続けます。
+        分割到着時の誤ったエラーを防ぎ、後続フレームの先頭を取り込むことも
+        ありません。
+
+        TCP does not guarantee that a whole response arrives in one recv, so
+        this first receives the fixed-length header (through the data length
+        field), decodes the little-endian response data length, and then keeps
+        receiving until the rest of the frame is present. This prevents
+        spurious errors on fragmented arrival and never consumes the start of
+        a following frame.
+
+        受信には事前確保済みのバッファとrecv_intoを使用するため、受信パスでの
+        呼び出しごとの割り当ては発生しません。返されるのはバッファ上の
+        memoryviewであり、次の受信まで有効です。
+
+        Reception uses the preallocated buffer with recv_into, so the receive
+        path performs no per-call allocation. The returned value is a
+        memoryview over the buffer and stays valid until the next reception.
+
+        戻り値 (Returns):
+            memoryview: 受信した1フレーム分の応答 (One received response frame)
+
+        例外 (Exceptions):
+            PlcCommunicationError: 接続が閉じられた場合 (When the connection is closed)
+        """
+        # ヘッダ長とデータ長フィールドの位置 (__init__で事前計算済み)
+        # (Header length and position of the data length field (precomputed in __init__))
+        header_length = self._recv_header_length
+        length_index = self._recv_length_index
+
+        buf = self._rx_buf
+        view = self._rx_view
+        got = 0
+        # 読み出しはフレーム境界で打ち切り、同一セグメントで届いた次のフレームの
+        # 先頭を読み込まないようにする (バッチ送信時は複数応答が連結されて届く)
+        # (Cap reads at the frame boundary so the start of a following frame
+        # delivered in the same segment is not consumed; batched sends make
+        # multiple responses arrive back to back)
+        while got < header_length:
+            n = self.sock.recv_into(view[got:header_length])
+            if n == 0:
+                raise PlcCommunicationError(f"Connection closed by PLC while receiving response")
+            got += n
+
+        # 応答データ長 (リトルエンディアン) (Response data length (little-endian))
+        data_length = buf[length_index] | (buf[length_index + 1] << 8)
+        total_length = header_length + data_length
+
+        # 通常の応答はバッファに収まるが、収まらない場合はバッファを拡張する
+        # (Normal responses fit in the buffer; grow it when one does not)
+        if total_length > len(buf):
+            new_buf = bytearray(total_length)
+            new_buf[:got] = view[:got]
+            self._rx_buf = buf = new_buf
+            self._rx_view = view = memoryview(new_buf)
+
+        while got < total_length:
+            n = self.sock.recv_into(view[got:total_length])
+            if n == 0:
+                raise PlcCommunicationError(f"Connection closed by PLC while receiving response")
+            got += n
+
+        return view[:total_length]
+
     def _send_and_receive(self, frame):
         """
         フレームを送信し、応答を受信する
@@ -139,59 +320,187 @@ class PlcClient:
             PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
             PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
         """
+        # 一時的な切断の場合は1回だけ再接続して再試行する (要求/応答は接続ごとに
+        # 独立しているため、新しい接続での再送は安全)
+        # (On a transient disconnect, reconnect and retry exactly once (each
+        # request/response exchange is independent per connection, so resending
+        # on a fresh connection is safe))
+        for attempt in (0, 1):
+            # 接続されていない場合は接続 (Connect if not connected)
+            if not self.connected:
+                self.connect()
+            try:
+                # フレーム送信 (Send frame)
+                self.sock.sendall(frame)
+
+                # 応答受信 (データ長フィールドに基づく1フレーム分の受信)
+                # (Receive response (one frame based on the data length field))
+                response = self._recv_frame()
+                break
+            except socket.timeout:
+                # タイムアウト時は接続状態をリセット (Reset connection status on timeout)
+                self.connected = False
+                raise PlcTimeoutError(f"Timeout occurred while communicating with PLC")
+            except (ConnectionResetError, BrokenPipeError) as e:
+                # 接続が切断された場合は、1回だけ透過的に再接続して再試行する
+                # (When the connection was dropped, transparently reconnect and retry once)
+                self.connected = False
+                if attempt == 0 and self.auto_reconnect:
+                    continue
+                raise PlcCommunicationError(f"Socket error occurred: {e}")
+            except socket.error as e:
+                # その他のソケットエラー時も接続状態をリセット (Reset connection status on other socket errors)
+                self.connected = False
+                raise PlcCommunicationError(f"Socket error occurred: {e}")
+
+        # 応答のチェック (エラーコードなど) (Check response for error codes, etc.)
+        self._check_response(response)
+
+        return response
+
+    def _check_response(self, response):
+        """
+        応答の長さとエンドコードを検証する
+        Validate the length and end code of a response
+
+        引数 (Arguments):
+            response (bytes): 受信した応答 (Received response)
+
+        例外 (Exceptions):
+            PlcCommunicationError: 応答が短すぎる場合、またはエラーコードが返された場合
+                                   (When the response is too short or an error code was returned)
+        """
+        if len(response) < self._min_resp_len:  # 最小応答長 (Minimum response length)
+            raise PlcCommunicationError(f"Response too short: {len(response)} bytes")
+
+        # エンドコード (正常終了: 0, エラー: 非0) - オフセットは__init__で事前計算済み
+        # End code (Normal completion: 0, Error: non-zero) - offset precomputed in __init__
+        end_code = _U16_LE.unpack_from(response, self._end_code_offset)[0]
+
+        if end_code != 0:
+            error_msg = _END_CODE_MESSAGES.get(end_code, f"Unknown error code: 0x{end_code:04X}")
+            raise PlcCommunicationError(f"PLC returned error: {error_msg} (0x{end_code:04X})")
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        連続する書き込みをまとめて送信するコンテキストマネージャ
+        Context manager that coalesces consecutive writes into one send
+
+        ブロック内のwrite_devices/write_device (およびwrite_bits/write_words)は
+        要求フレームを送信せずに保留し、ブロックを抜けるときに全フレームを
+        1回のsendallで送信します。対応するTCP_CORKが利用できる環境では、
+        送信中のセグメント分割も抑制します。小さな書き込みを多数発行する
+        初期化処理などで、パケット数とヘッダオーバーヘッドを削減できます。
+
+        Inside the block, write_devices/write_device (and write_bits/
+        write_words) hold back their request frames instead of sending them,
+        and all frames are sent with a single sendall when the block exits.
+        Where TCP_CORK is available, segment splitting during the send is
+        suppressed as well. This reduces packet count and header overhead
+        for sequences of many small writes, such as recipe initialization.
+
+        MCプロトコルは要求ごとに応答を返すため、ブロックを抜けるときに
+        保留した要求と同数の応答を順番に受信して検証します。読み出しは
+        バッチの対象外で、ブロック内でも即時に実行されます。
+
+        The MC protocol returns one response per request, so on exit the same
+        number of responses as held-back requests are received and validated
+        in order. Reads are not batched and still execute immediately inside
+        the block.
+
+        例外 (Exceptions):
+            PlcError: バッチが入れ子で開始された場合 (When batches are nested)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        if self._batch_frames is not None:
+            raise PlcError("batch() cannot be nested")
+
         # 接続されていない場合は接続 (Connect if not connected)
         if not self.connected:
             self.connect()
-        
+
+        self._batch_frames = []
         try:
-            # フレーム送信 (Send frame)
-            self.sock.sendall(frame)
-            
-            # 応答受信 (Receive response)
-            response = self.sock.recv(1024)
-            
-            # 応答のチェック (エラーコードなど) (Check response for error codes, etc.)
-            min_response_length = 11 if self.frame_type == '3E' else 15
-            if len(response) < min_response_length:  # 最小応答長 (Minimum response length)
-                raise PlcCommunicationError(f"Response too short: {len(response)} bytes")
-            
-            # エンドコード (正常終了: 0, エラー: 非0) - フレームタイプによってオフセットが異なる
-            # End code (Normal completion: 0, Error: non-zero) - offset differs by frame type
-            if self.frame_type == '3E':
-                end_code_offset = 9
-            else:  # FRAME_4E
-                end_code_offset = 11
-            end_code = int.from_bytes(response[end_code_offset:end_code_offset+2], byteorder='little')
-            
-            if end_code != 0:
-                # 代表的なエラーコードのメッセージ (Typical error code messages)
-                error_messages = {
-                    0xC050: "Read/write request to unsupported device",
-                    0xC051: "Read/write request with unsupported number of points",
-                    0xC052: "Read/write request to word device with bit specification",
-                    0xC054: "Read/write request with invalid specification of device",
-                    0xC056: "Read/write request with device out of range",
-                    0xC059: "Read/write request with invalid specification of data count",
-                    0xC05B: "Read/write request with invalid specification of stored data",
-                    0xC05C: "Read/write request with invalid specification of block",
-                    0xC06B: "Request when CPU is in RUN mode and writing is disabled",
-                    0x0055: "Write operation not allowed. PLC is in write-protected mode." # 書き込み禁止モード
-                }
-                error_msg = error_messages.get(end_code, f"Unknown error code: 0x{end_code:04X}")
-                raise PlcCommunicationError(f"PLC returned error: {error_msg} (0x{end_code:04X})")
-            
-            return response
-            
+            yield self
+            frames = self._batch_frames
+        finally:
+            self._batch_frames = None
+
+        if not frames:
+            return
+
+        # TCP_CORKはLinux固有のため、存在する場合のみ使用する
+        # (TCP_CORK is Linux-specific, so it is used only when present)
+        cork = hasattr(socket, 'TCP_CORK')
+        try:
+            if cork:
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+            try:
+                # 全要求を1回の送信にまとめる (Coalesce all requests into one send)
+                self.sock.sendall(b''.join(frames))
+            finally:
+                if cork:
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+
+            # 要求と同数の応答を順番に受信して検証する (TCPは順序を保証するため、
+            # 応答は要求の発行順に対応する)
+            # (Receive and validate as many responses as requests, in order
+            # (TCP preserves ordering, so responses correspond to requests in
+            # issue order))
+            for _ in frames:
+                self._check_response(self._recv_frame())
         except socket.timeout:
-            # タイムアウト時は接続状態をリセット (Reset connection status on timeout)
             self.connected = False
             raise PlcTimeoutError(f"Timeout occurred while communicating with PLC")
-            
         except socket.error as e:
-            # その他のソケットエラー時も接続状態をリセット (Reset connection status on other socket errors)
             self.connected = False
             raise PlcCommunicationError(f"Socket error occurred: {e}")
     
+    def _create_read_frame(self, device_type, device_number, count, is_bit):
+        """
+        読み出しフレームを作成する (lru_cache経由で_build_read_frameとして呼び出される)
+        Create a read frame (called as _build_read_frame through lru_cache)
+
+        フレームは(デバイスタイプ, デバイス番号, 点数)に対して決定的なため、
+        ポーリングループなどで繰り返される読み出しはキャッシュ済みのバイト列を再利用します。
+
+        The frame is deterministic in (device type, device number, count), so
+        repeated reads such as polling loops reuse the cached byte string.
+
+        ネイティブコーデック拡張(mcplcwatch._codec)が存在する場合は、
+        そちらのエンコーダが使用されます。出力はPython実装とバイト単位で
+        同一である必要があります。
+
+        When the native codec extension (mcplcwatch._codec) is present, its
+        encoder is used instead. The output must be byte-identical to the
+        Python implementation.
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (Device type)
+            device_number (int): 先頭デバイス番号 (Starting device number)
+            count (int): 読み出すデバイス点数 (Number of device points to read)
+            is_bit (bool): ビットデバイスかどうか (Whether it's a bit device)
+
+        戻り値 (Returns):
+            bytes: 送信用のバイナリデータ (Binary data for sending)
+        """
+        if _codec is not None:
+            return _codec.build_read_request(
+                device_type, device_number, count, is_bit,
+                self.frame_type, self.network_no, self.pc_no,
+                self.unit_io, self.unit_station
+            )
+        return MCProtocol.create_read_frame(
+            device_type, device_number, count, is_bit,
+            frame_type=self.frame_type,
+            network_no=self.network_no,
+            pc_no=self.pc_no,
+            unit_io=self.unit_io,
+            unit_station=self.unit_station
+        )
+
     def is_bit_device(self, device_type):
         """
         指定されたデバイスタイプがビットデバイスかどうかを判定する
@@ -223,29 +532,273 @@ class PlcClient:
             PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
             PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
         """
-        # デバイスタイプのチェック (Check device type)
-        if device_type not in MCProtocol.DEVICE_CODES:
+        # デバイスタイプのチェックとビット種別の取得 (1回の参照で両方行う)
+        # (Check device type and get the bit flag (both in one lookup))
+        try:
+            is_bit = MCProtocol.DEVICE_META[device_type][1]
+        except KeyError:
             raise PlcDeviceError(f"Unsupported device type", device_type)
+
+        # 読み出しフレームの作成 (キャッシュ済みであれば再利用) (Create read frame (reused when cached))
+        frame = self._build_read_frame(device_type, device_number, count, is_bit)
+
+        # 送信と受信 (Send and receive)
+        response = self._send_and_receive(frame)
         
-        # ビットデバイスかどうかの判定 (Determine if it's a bit device)
-        is_bit = self.is_bit_device(device_type)
-        
+        # 応答の解析 (Parse response)
+        return MCProtocol.parse_read_response(response, count, is_bit, self.frame_type)
+    
+    def read_devices_into(self, device_type, device_number, count, out):
+        """
+        デバイスを読み出し、結果を呼び出し側のバッファに直接書き込む
+        Read devices and write the result directly into a caller-supplied buffer
+
+        応答ペイロードをリストに変換せず、そのままバッファにコピーします。
+        ワードデバイスは1点あたり2バイト（リトルエンディアン）、ビットデバイスは
+        1点あたり1バイト（0または1）で書き込まれます。バッファを周期ごとに
+        再利用することで、ポーリングループでの割り当てを排除できます。
+
+        Copies the response payload into the buffer without building a list.
+        Word devices are written as 2 bytes per point (little-endian) and bit
+        devices as 1 byte per point (0 or 1). Reusing the buffer each cycle
+        eliminates per-tick allocation in polling loops.
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (D, M, X, Yなど) (Device type (D, M, X, Y, etc.))
+            device_number (int): 先頭デバイス番号 (Starting device number)
+            count (int): 読み出すデバイス点数 (Number of device points to read)
+            out (bytearray or memoryview): 書き込み先のバッファ (Buffer to write into)
+
+        戻り値 (Returns):
+            int: 書き込んだデバイス点数 (Number of device points written)
+
+        例外 (Exceptions):
+            PlcDeviceError: デバイスタイプが不正な場合 (When the device type is invalid)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+            ValueError: バッファが小さすぎる、または応答データが短い場合 (When the buffer is too small or the response data is too short)
+        """
+        # デバイスタイプのチェックとビット種別の取得 (1回の参照で両方行う)
+        # (Check device type and get the bit flag (both in one lookup))
+        try:
+            is_bit = MCProtocol.DEVICE_META[device_type][1]
+        except KeyError:
+            raise PlcDeviceError(f"Unsupported device type", device_type)
+        data_length = count if is_bit else count * 2
+
+        out_view = memoryview(out)
+        if len(out_view) < data_length:
+            raise ValueError(f"Output buffer too small: {len(out_view)} < {data_length} bytes")
+
+        # 読み出しフレームの作成と送受信 (Create read frame and send/receive)
+        frame = self._build_read_frame(device_type, device_number, count, is_bit)
+        response = self._send_and_receive(frame)
+
+        # データ開始位置の決定 (フレームタイプに応じて異なる) (Determine data start position (differs according to frame type))
+        data_start = 11 if self.frame_type == MCProtocol.FRAME_3E else 15
+        if len(response) < data_start + data_length:
+            raise ValueError(f"Invalid response data: Data length is too short")
+
+        out_view[:data_length] = response[data_start:data_start + data_length]
+        return count
+
+    def read_many(self, items):
+        """
+        複数の不連続なデバイス範囲を1回の要求で読み出す
+        Read multiple non-contiguous device ranges with a single request
+
+        複数ブロック一括読出しコマンド(0x0406)を使用し、離れた範囲を個別の
+        read_devices呼び出しの代わりに1往復の通信で読み出します。ビット
+        デバイスの範囲は16点を1ワードに詰めた状態で転送され、受信後に
+        ブール値のリストに展開されます。
+
+        Uses the multiple-block batch read command (0x0406) to fetch separated
+        ranges in one communication round trip instead of individual
+        read_devices calls. Bit device ranges are transferred with 16 points
+        packed into one word and expanded into boolean lists after reception.
+
+        引数 (Arguments):
+            items (list): (デバイスタイプ, 先頭デバイス番号, 点数)のタプルのリスト
+                          (List of (device type, starting device number, count) tuples)
+
+        戻り値 (Returns):
+            list: itemsと同じ順序の、読み出した値のリストのリスト
+                  (List of lists of read values, in the same order as items)
+
+        例外 (Exceptions):
+            PlcDeviceError: デバイスタイプが不正な場合 (When a device type is invalid)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        # 要求ブロックへの振り分け (ビットデバイスはワード単位でアクセスする)
+        # (Distribute into request blocks (bit devices are accessed in word units))
+        word_blocks = []  # (元のインデックス, タイプ, 番号, 点数) ((original index, type, number, count))
+        bit_blocks = []   # (元のインデックス, タイプ, 番号, 点数, ワード数, ビットオフセット)
+                          # ((original index, type, number, count, words, bit offset))
+        bit_devices = MCProtocol.BIT_DEVICES
+        for index, (device_type, device_number, count) in enumerate(items):
+            if device_type not in MCProtocol.DEVICE_CODES:
+                raise PlcDeviceError(f"Unsupported device type", device_type)
+            if device_type in bit_devices:
+                # ビットデバイスへのワード単位アクセスは先頭番号が16の倍数で
+                # ある必要があるため、先頭を16点境界に切り下げ、オフセット分を
+                # 含めて読み出してから展開時に切り出す
+                # (Word-unit access to bit devices requires the head number to
+                # be a multiple of 16, so align the start down to a 16-point
+                # boundary, read the offset bits too and slice them off when
+                # expanding)
+                aligned_number = device_number - (device_number % 16)
+                bit_offset = device_number - aligned_number
+                word_points = (bit_offset + count + 15) // 16
+                bit_blocks.append((index, device_type, aligned_number, count, word_points, bit_offset))
+            else:
+                word_blocks.append((index, device_type, device_number, count))
+
         # 読み出しフレームの作成 (Create read frame)
-        frame = MCProtocol.create_read_frame(
-            device_type, device_number, count, is_bit,
+        frame = MCProtocol.create_read_many_frame(
+            [(t, n, c) for _, t, n, c in word_blocks],
+            [(t, n, w) for _, t, n, _, w, _ in bit_blocks],
             frame_type=self.frame_type,
             network_no=self.network_no,
             pc_no=self.pc_no,
             unit_io=self.unit_io,
             unit_station=self.unit_station
         )
-        
+
         # 送信と受信 (Send and receive)
         response = self._send_and_receive(frame)
-        
-        # 応答の解析 (Parse response)
-        return MCProtocol.parse_read_response(response, count, is_bit, self.frame_type)
-    
+
+        # 応答の解析 (応答データはすべてワード単位) (Parse response (the response data is all in word units))
+        total_words = (sum(c for _, _, _, c in word_blocks) +
+                       sum(w for _, _, _, _, w, _ in bit_blocks))
+        words = MCProtocol.parse_read_response(response, total_words, False, self.frame_type)
+
+        # ブロックごとの値を元の順序に戻す (Restore per-block values to their original order)
+        results = [None] * len(items)
+        pos = 0
+        for index, _, _, count in word_blocks:
+            results[index] = words[pos:pos + count]
+            pos += count
+        for index, _, _, count, word_points, bit_offset in bit_blocks:
+            # ワードをLSBからビットに展開し、境界合わせ分を読み飛ばして
+            # 要求点数分だけ取り出す
+            # (Expand words into bits starting from the LSB, skip the
+            # alignment bits and keep only the requested count)
+            bits = []
+            for word in words[pos:pos + word_points]:
+                for b in range(16):
+                    bits.append(bool((word >> b) & 1))
+            results[index] = bits[bit_offset:bit_offset + count]
+            pos += word_points
+
+        return results
+
+    def read_multiple(self, items):
+        """
+        複数の不連続な単一デバイスを1回の要求で読み出す
+        Read multiple non-contiguous individual devices with a single request
+
+        ランダム読出しコマンド(0x0403)を使用し、N個のread_device呼び出し
+        （N回の通信往復）を1往復にまとめます。すべてのデバイスはワード単位で
+        アクセスされ、ビットデバイスは最下位ビットのブール値として返されます。
+
+        Uses the random read command (0x0403) to collapse N read_device calls
+        (N communication round trips) into one. All devices are accessed in
+        word units; bit devices are returned as the boolean value of the
+        least significant bit.
+
+        引数 (Arguments):
+            items (list): (デバイスタイプ, デバイス番号)のタプルのリスト
+                          (List of (device type, device number) tuples)
+
+        戻り値 (Returns):
+            list: itemsと同じ順序の、読み出した値のリスト
+                  (List of read values, in the same order as items)
+
+        例外 (Exceptions):
+            PlcDeviceError: デバイスタイプが不正な場合 (When a device type is invalid)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        # デバイスタイプのチェック (Check device types)
+        for device_type, _ in items:
+            if device_type not in MCProtocol.DEVICE_CODES:
+                raise PlcDeviceError(f"Unsupported device type", device_type)
+
+        # 読み出しフレームの作成 (Create read frame)
+        frame = MCProtocol.create_random_read_frame(
+            items,
+            frame_type=self.frame_type,
+            network_no=self.network_no,
+            pc_no=self.pc_no,
+            unit_io=self.unit_io,
+            unit_station=self.unit_station
+        )
+
+        # 送信と受信 (Send and receive)
+        response = self._send_and_receive(frame)
+
+        # 応答の解析 (応答データはすべてワード単位) (Parse response (the response data is all in word units))
+        words = MCProtocol.parse_read_response(response, len(items), False, self.frame_type)
+
+        # ビットデバイスは最下位ビットをブール値に変換 (Convert the least significant bit to a boolean for bit devices)
+        bit_devices = MCProtocol.BIT_DEVICES
+        return [bool(word & 1) if device_type in bit_devices else word
+                for (device_type, _), word in zip(items, words)]
+
+    def write_multiple(self, items):
+        """
+        複数の不連続な単一デバイスに1回の要求で書き込む
+        Write multiple non-contiguous individual devices with a single request
+
+        ランダム書き込みコマンド(0x1402)を使用します。ワード単位とビット単位は
+        サブコマンドが異なるため、ワードデバイスとビットデバイスが混在する場合は
+        最大2フレーム（ワード用1つ、ビット用1つ）を送信します。
+
+        Uses the random write command (0x1402). Word units and bit units use
+        different sub-commands, so when word and bit devices are mixed, at
+        most two frames are sent (one for words, one for bits).
+
+        引数 (Arguments):
+            items (list): (デバイスタイプ, デバイス番号, 値)のタプルのリスト
+                          (List of (device type, device number, value) tuples)
+
+        戻り値 (Returns):
+            bool: 書き込みに成功した場合はTrue (True if writing was successful)
+
+        例外 (Exceptions):
+            PlcDeviceError: デバイスタイプが不正な場合 (When a device type is invalid)
+            PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
+            PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
+        """
+        # ワードデバイスとビットデバイスに振り分け (Distribute into word and bit devices)
+        word_items = []
+        bit_items = []
+        bit_devices = MCProtocol.BIT_DEVICES
+        for device_type, device_number, value in items:
+            if device_type not in MCProtocol.DEVICE_CODES:
+                raise PlcDeviceError(f"Unsupported device type", device_type)
+            if device_type in bit_devices:
+                bit_items.append((device_type, device_number, value))
+            else:
+                word_items.append((device_type, device_number, value))
+
+        # ワード用とビット用のフレームをそれぞれ送信 (Send the word frame and the bit frame separately)
+        for group_items, is_bit in ((word_items, False), (bit_items, True)):
+            if not group_items:
+                continue
+            frame = MCProtocol.create_random_write_frame(
+                group_items, is_bit,
+                frame_type=self.frame_type,
+                network_no=self.network_no,
+                pc_no=self.pc_no,
+                unit_io=self.unit_io,
+                unit_station=self.unit_station
+            )
+            self._send_and_receive(frame)
+
+        return True
+
     def read_device(self, device_type, device_number):
         """
         単一デバイスを読み出す
@@ -284,21 +837,19 @@ class PlcClient:
             PlcCommunicationError: 通信中にエラーが発生した場合 (When an error occurs during communication)
             PlcTimeoutError: タイムアウトが発生した場合 (When a timeout occurs)
         """
-        # デバイスタイプのチェック (Check device type)
-        if device_type not in MCProtocol.DEVICE_CODES:
+        # デバイスタイプのチェックとビット種別の取得 (1回の参照で両方行う)
+        # (Check device type and get the bit flag (both in one lookup))
+        try:
+            is_bit = MCProtocol.DEVICE_META[device_type][1]
+        except KeyError:
             raise PlcDeviceError(f"Unsupported device type", device_type)
-        
+
         # 値が単一の場合はリストに変換 (Convert single value to list)
+        # (ブール値への事前変換は不要。フレーム生成時に真偽のみが評価される)
+        # (No boolean pre-conversion is needed; frame creation only evaluates truthiness)
         if not isinstance(values, list):
             values = [values]
-        
-        # ビットデバイスかどうかの判定 (Determine if it's a bit device)
-        is_bit = self.is_bit_device(device_type)
-        
-        # ビットデバイスの場合は、値をブール値に変換 (Convert values to boolean for bit devices)
-        if is_bit:
-            values = [bool(v) for v in values]
-        
+
         # 書き込みフレームの作成 (Create write frame)
         frame = MCProtocol.create_write_frame(
             device_type, device_number, values, is_bit,
@@ -308,13 +859,20 @@ class PlcClient:
             unit_io=self.unit_io,
             unit_station=self.unit_station
         )
-        
+
+        # バッチ中は送信せずに保留する (応答はbatch()終了時にまとめて検証される)
+        # (While batching, hold the frame back instead of sending; responses are
+        # validated together when batch() exits)
+        if self._batch_frames is not None:
+            self._batch_frames.append(frame)
+            return True
+
         # 送信と受信 (Send and receive)
         response = self._send_and_receive(frame)
-        
+
         # 応答のチェック (エラーコードなど) (Check response for error codes, etc.)
         return True
-    
+
     def write_device(self, device_type, device_number, value):
         """
         単一デバイスに値を書き込む
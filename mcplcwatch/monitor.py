@@ -9,11 +9,17 @@ This module contains classes for periodically monitoring PLC data and detecting
 When changes are detected, it calls the specified callback functions.
 """
 
+import queue
+import struct
 import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from .client import PlcClient
+from .pool import PlcConnectionPool
+from .protocol import MCProtocol
 from .error import PlcError, PlcCommunicationError, PlcTimeoutError
+from ._diff import diff_indices
 
 
 # ロガーの設定 (Logger configuration)
@@ -36,45 +42,66 @@ class DeviceMonitor:
         callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the value changes)
         on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
     """
-    
-    def __init__(self, device_type, device_number, callback=None, on_error=None):
+
+    # 数千点を監視する場合のインスタンスあたりのメモリを削減する (__dict__を持たない)
+    # (Reduces per-instance memory when monitoring thousands of points (no __dict__))
+    __slots__ = ('device_type', 'device_number', 'last_value', 'callback', 'on_error',
+                 'adaptive', '_skip_cycles', '_pending_cycles', '_label')
+
+    def __init__(self, device_type, device_number, callback=None, on_error=None, adaptive=False):
         """
         初期化メソッド
         Initialization method
-        
+
         引数 (Arguments):
             device_type (str): デバイスタイプ (Device type)
             device_number (int): デバイス番号 (Device number)
             callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the value changes)
             on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
+            adaptive (bool): 値が変化しない間、読み出し周期を自動的に間引くかどうか
+                             (Whether to automatically thin out reads while the value is unchanged)
         """
         self.device_type = device_type
         self.device_number = device_number
         self.last_value = None
         self.callback = callback
         self.on_error = on_error
-    
-    def update(self, value):
+        self.adaptive = adaptive
+        self._skip_cycles = 0
+        self._pending_cycles = 0
+        # ログ用のラベル (エラーのたびに整形し直さないよう事前計算する)
+        # (Label for logs (precomputed so it is not re-formatted on every error))
+        self._label = f"{device_type}{device_number}"
+
+    def update(self, value, dispatcher=None):
         """
         デバイスの値を更新し、変化があった場合にコールバック関数を呼び出す
         Update the device value and call the callback function if there is a change
-        
+
         引数 (Arguments):
             value: デバイスの新しい値 (New value of the device)
-            
+            dispatcher: コールバックを委譲するキュー。Noneの場合は同期的に呼び出す。
+                        (Queue to which callbacks are delegated. None calls them synchronously.)
+
         戻り値 (Returns):
             bool: 値が変化した場合はTrue、変化がない場合はFalse (True if the value changed, False otherwise)
         """
-        if self.last_value != value:
-            old_value = self.last_value
+        # ホットパスのため、属性アクセスをローカル変数に巻き上げる
+        # (Hoist attribute accesses into locals since this is the hot path)
+        old_value = self.last_value
+        if old_value != value:
             self.last_value = value
-            
-            if self.callback and old_value is not None:
-                try:
-                    self.callback(self.device_type, self.device_number, old_value, value)
-                except Exception as e:
-                    logger.error(f"Error occurred in callback function: {e}")
-            
+
+            callback = self.callback
+            if callback is not None and old_value is not None:
+                if dispatcher is not None:
+                    dispatcher.put((callback, (self.device_type, self.device_number, old_value, value)))
+                else:
+                    try:
+                        callback(self.device_type, self.device_number, old_value, value)
+                    except Exception as e:
+                        logger.error("Error occurred in callback function for %s: %s", self._label, e)
+
             return True
         return False
     
@@ -90,7 +117,7 @@ class DeviceMonitor:
             try:
                 self.on_error(self.device_type, self.device_number, error)
             except Exception as e:
-                logger.error(f"Error occurred in error callback function: {e}")
+                logger.error("Error occurred in error callback function for %s: %s", self._label, e)
 
 
 class DeviceGroupMonitor:
@@ -110,18 +137,32 @@ class DeviceGroupMonitor:
         callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the values change)
         on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
     """
-    
-    def __init__(self, device_type, start_number, count, callback=None, on_error=None):
+
+    # 数千点を監視する場合のインスタンスあたりのメモリを削減する (__dict__を持たない)
+    # (Reduces per-instance memory when monitoring thousands of points (no __dict__))
+    __slots__ = ('device_type', 'start_number', 'count', 'last_values', 'callback', 'on_error',
+                 'adaptive', 'batch_callback', '_skip_cycles', '_pending_cycles', '_label', '_range_label')
+
+    def __init__(self, device_type, start_number, count, callback=None, on_error=None, adaptive=False,
+                 batch_callback=None):
         """
         初期化メソッド
         Initialization method
-        
+
         引数 (Arguments):
             device_type (str): デバイスタイプ (Device type)
             start_number (int): 開始デバイス番号 (Starting device number)
             count (int): デバイス数 (Number of devices)
             callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the values change)
             on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
+            adaptive (bool): 値が変化しない間、読み出し周期を自動的に間引くかどうか
+                             (Whether to automatically thin out reads while the values are unchanged)
+            batch_callback: 変化を1回でまとめて受け取るコールバック関数。設定した場合は
+                            callbackの代わりに(デバイスタイプ, 先頭番号, 変化前の値リスト,
+                            変化後の値リスト, 変化したインデックスのリスト)で呼び出されます。
+                            (Callback function that receives all changes in one call. When set,
+                            it is called instead of callback with (device type, start number,
+                            previous values, new values, changed indices).)
         """
         self.device_type = device_type
         self.start_number = start_number
@@ -129,41 +170,84 @@ class DeviceGroupMonitor:
         self.last_values = None
         self.callback = callback
         self.on_error = on_error
-    
-    def update(self, values):
+        self.adaptive = adaptive
+        self.batch_callback = batch_callback
+        self._skip_cycles = 0
+        self._pending_cycles = 0
+        # ログ用のラベル (エラーのたびに整形し直さないよう事前計算する)
+        # (Labels for logs (precomputed so they are not re-formatted on every error))
+        self._range_label = f"{start_number}-{start_number + count - 1}"
+        self._label = f"{device_type}{self._range_label}"
+
+    def update(self, values, dispatcher=None):
         """
         デバイスグループの値を更新し、変化があった場合にコールバック関数を呼び出す
         Update the device group values and call the callback function if there are changes
-        
+
         引数 (Arguments):
             values: デバイスの新しい値のリスト (List of new device values)
-            
+            dispatcher: コールバックを委譲するキュー。Noneの場合は同期的に呼び出す。
+                        (Queue to which callbacks are delegated. None calls them synchronously.)
+
         戻り値 (Returns):
             bool: 値が変化した場合はTrue、変化がない場合はFalse (True if any value changed, False otherwise)
         """
-        if self.last_values != values:
-            if self.last_values is None:
-                self.last_values = values.copy()
+        # 変化がない場合はC実装のリスト比較だけで抜ける (コピーは一切発生しない)
+        # (When nothing changed, only the C-level list comparison runs (no copy at all))
+        last_values = self.last_values
+        if last_values != values:
+            if last_values is None:
+                self.last_values = list(values)
                 return True
-            
-            # 変化を検出 (Detect changes)
-            changed = False
-            for i, (old_value, new_value) in enumerate(zip(self.last_values, values)):
-                if old_value != new_value:
-                    device_number = self.start_number + i
-                    
-                    if self.callback:
+
+            # 変化を検出 (変化したインデックスのみをPythonループで処理する。
+            # ループ内で参照する属性はローカル変数に巻き上げる)
+            # (Detect changes (only changed indices are processed in the Python
+            # loop; attributes referenced in the loop are hoisted into locals))
+            callback = self.callback
+            device_type = self.device_type
+            start_number = self.start_number
+            changed = diff_indices(last_values, values)
+
+            # 一括コールバックが設定されている場合は、変化点ごとではなく1回の
+            # 呼び出しにまとめる (データベースやMQTTへの一括書き込みに適する)
+            # (When a batch callback is set, changes are delivered in one call
+            # instead of one per changed point (suited to bulk writes to a
+            # database or MQTT))
+            batch_callback = self.batch_callback
+            if batch_callback is not None:
+                if changed:
+                    new_values = list(values)
+                    if dispatcher is not None:
+                        dispatcher.put((batch_callback, (device_type, start_number, last_values, new_values, changed)))
+                    else:
                         try:
-                            self.callback(self.device_type, device_number, old_value, new_value)
+                            batch_callback(device_type, start_number, last_values, new_values, changed)
                         except Exception as e:
-                            logger.error(f"Error occurred in callback function: {e}")
-                    
-                    changed = True
-            
-            # 最新の値を保存 (Save the latest values)
-            self.last_values = values.copy()
-            return changed
-        
+                            logger.error("Error occurred in callback function for %s: %s", self._label, e)
+                    self.last_values = new_values
+                    return True
+                self.last_values = list(values)
+                return False
+
+            for i in changed:
+                old_value = last_values[i]
+                new_value = values[i]
+
+                if callback is not None:
+                    if dispatcher is not None:
+                        dispatcher.put((callback, (device_type, start_number + i, old_value, new_value)))
+                    else:
+                        try:
+                            callback(device_type, start_number + i, old_value, new_value)
+                        except Exception as e:
+                            logger.error("Error occurred in callback function for %s: %s", self._label, e)
+
+            # 最新の値を保存 (変化があった周期でのみコピーする)
+            # (Save the latest values (copied only in cycles that actually changed))
+            self.last_values = list(values)
+            return bool(changed)
+
         return False
     
     def handle_error(self, error):
@@ -176,9 +260,9 @@ class DeviceGroupMonitor:
         """
         if self.on_error:
             try:
-                self.on_error(self.device_type, f"{self.start_number}-{self.start_number + self.count - 1}", error)
+                self.on_error(self.device_type, self._range_label, error)
             except Exception as e:
-                logger.error(f"Error occurred in error callback function: {e}")
+                logger.error("Error occurred in error callback function for %s: %s", self._label, e)
 
 
 class PlcMonitor:
@@ -195,87 +279,246 @@ class PlcMonitor:
         monitors (list): 監視対象のデバイスモニターのリスト (List of device monitors to monitor)
         group_monitors (list): 監視対象のデバイスグループモニターのリスト (List of device group monitors to monitor)
         interval (float): 監視周期（秒） (Monitoring interval in seconds)
+        max_gap (int): 読み出しを統合する際に許容するデバイス番号の間隔 (Maximum device-number gap allowed when merging reads)
         running (bool): 監視中かどうか (Whether monitoring is running)
         thread: 監視スレッド (Monitoring thread)
     """
-    
-    def __init__(self, plc_client, interval=1.0, auto_start=False):
+
+    # 1ブロックで読み出す最大デバイス点数 (Maximum number of device points read per block)
+    MAX_BLOCK_WORDS = 960
+    MAX_BLOCK_BITS = 3584
+
+    # 適応的な間引きで連続してスキップする周期数の上限 (Maximum number of
+    # consecutive cycles skipped by adaptive thinning)
+    MAX_SKIP_CYCLES = 16
+
+    def __init__(self, plc_client, interval=1.0, auto_start=False, max_gap=8):
         """
         初期化メソッド
         Initialization method
-        
+
         引数 (Arguments):
-            plc_client (PlcClient): PLCクライアント (PLC client)
+            plc_client (PlcClient): PLCクライアント。PlcConnectionPoolを渡した場合は、
+                                    複数ブロックの読み出しがプールの接続で並行に実行されます。
+                                    (PLC client. When a PlcConnectionPool is passed, multi-block
+                                    reads are executed concurrently over the pooled connections.)
             interval (float): 監視周期（秒） (Monitoring interval in seconds)
             auto_start (bool): 監視を自動的に開始するかどうか (Whether to automatically start monitoring)
+            max_gap (int): 読み出しを統合する際に許容するデバイス番号の間隔。小さな間隔は
+                           ダミー読み出しで埋める方が追加フレームより安価です。
+                           (Maximum device-number gap allowed when merging reads. Filling a
+                           small gap with dummy reads is cheaper than a second frame.)
         """
         self.plc = plc_client
         self.monitors = []
         self.group_monitors = []
+
+        # 削除を線形走査なしで行うための補助インデックス (同一キーの重複登録は
+        # リストで保持する)
+        # (Secondary indexes so removal needs no linear scan (duplicate
+        # registrations under one key are kept in a list))
+        self._monitor_index = {}
+        self._group_index = {}
+
+        # 各監視対象のリスト内位置 (末尾要素との入れ替えでO(1)削除を行うため)
+        # (Position of each target in its list, for O(1) swap-with-last removal)
+        self._monitor_pos = {}
+        self._group_pos = {}
         self.interval = interval
+        self.max_gap = max_gap
         self.running = False
         self.thread = None
-        
+        self._plan = None
+
+        # 停止要求イベント (待機中でも即座に停止できるようにする)
+        # (Stop request event (allows immediate stop even while waiting))
+        self._stop_event = threading.Event()
+
+        # 監視対象リストの保護用ロック (監視スレッドと登録/削除の競合を防ぐ。
+        # 監視スレッド側はコンパイル済み計画のスナップショットをロックなしで走査する)
+        # (Lock protecting the monitoring target lists (prevents races between the
+        # monitoring thread and add/remove calls; the monitoring thread iterates a
+        # snapshot, the compiled plan, without the lock))
+        self._lock = threading.Lock()
+
+        # 接続プールが渡された場合は、ブロック読み出しを並行化する
+        # (When a connection pool was passed, block reads are parallelized)
+        self._pool = plc_client if isinstance(plc_client, PlcConnectionPool) else None
+        self._executor = None
+
+        # 共有メモリへの公開 (enable_shm()で有効化される)
+        # (Shared-memory publication (enabled via enable_shm()))
+        self._shm_publisher = None
+
+        # コールバック配送用のキューとスレッド (監視スレッドは変化の検出のみを行い、
+        # 遅いユーザーコールバックが監視周期を延ばさないようにする)
+        # (Queue and thread for callback delivery (the monitoring thread only
+        # detects changes, so slow user callbacks cannot stretch the cycle))
+        self._cb_queue = queue.SimpleQueue()
+        self._cb_thread = None
+
         if auto_start:
             self.start()
     
-    def add_device(self, device_type, device_number, callback=None, on_error=None):
+    def add_device(self, device_type, device_number, callback=None, on_error=None, adaptive=False):
         """
         監視対象のデバイスを追加する
         Add a device to monitor
-        
+
         引数 (Arguments):
             device_type (str): デバイスタイプ (Device type)
             device_number (int): デバイス番号 (Device number)
             callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the value changes)
             on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
-            
+            adaptive (bool): 値が変化しない間、読み出し周期を自動的に間引くかどうか。
+                             応答性が重要な点ではFalseのままにしてください。
+                             (Whether to automatically thin out reads while the value is
+                             unchanged. Leave False for latency-critical points.)
+
         戻り値 (Returns):
             DeviceMonitor: 追加されたデバイスモニター (Added device monitor)
         """
-        monitor = DeviceMonitor(device_type, device_number, callback, on_error)
-        self.monitors.append(monitor)
-        
+        monitor = DeviceMonitor(device_type, device_number, callback, on_error, adaptive)
+        with self._lock:
+            self._monitor_pos[monitor] = len(self.monitors)
+            self.monitors.append(monitor)
+            self._monitor_index.setdefault((device_type, device_number), []).append(monitor)
+            self._plan = None
+
         # 初期値を読み込む (Read initial value)
         try:
-            value = self.plc.read_device(device_type, device_number)
+            value = self._read_device(device_type, device_number)
             monitor.last_value = value
         except PlcError as e:
-            logger.warning(f"Failed to read initial value: {e} (初期値の読み込みに失敗しました)")
+            logger.warning("Failed to read initial value: %s (初期値の読み込みに失敗しました)", e)
             if on_error:
                 monitor.handle_error(e)
         
         return monitor
     
-    def add_devices(self, device_type, start_number, count, callback=None, on_error=None):
+    def add_device_bulk(self, specs, callback=None, on_error=None, adaptive=False):
+        """
+        複数の監視対象デバイスをまとめて追加する
+        Add multiple devices to monitor in one operation
+
+        add_deviceを繰り返し呼び出すとデバイスごとに初期値の読み出しが発生しますが、
+        本メソッドはデバイスタイプごとに番号範囲をまとめ、1回の一括読み出しで
+        全デバイスの初期値を取り込みます。番号が離れている場合は間のデバイスも
+        読み出されるため、近接したデバイス群の登録に適しています。
+        (Repeated add_device calls issue one initial read per device; this method
+        groups the numbers per device type and seeds all initial values with a
+        single batch read. Gaps between numbers are read too, so this suits
+        registering devices with nearby addresses.)
+
+        引数 (Arguments):
+            specs (list): (デバイスタイプ, デバイス番号) のタプルのリスト
+                          (List of (device type, device number) tuples)
+            callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the value changes)
+            on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
+            adaptive (bool): 値が変化しない間、読み出し周期を自動的に間引くかどうか
+                             (Whether to automatically thin out reads while the value is unchanged)
+
+        戻り値 (Returns):
+            list: 追加されたDeviceMonitorのリスト (List of added DeviceMonitor objects)
+        """
+        monitors = []
+        with self._lock:
+            for device_type, device_number in specs:
+                monitor = DeviceMonitor(device_type, device_number, callback, on_error, adaptive)
+                self._monitor_pos[monitor] = len(self.monitors)
+                self.monitors.append(monitor)
+                self._monitor_index.setdefault((device_type, device_number), []).append(monitor)
+                monitors.append(monitor)
+            self._plan = None
+
+        # デバイスタイプごとに番号範囲をまとめ、初期値を一括で読み込む
+        # (Group numbers per device type and read initial values in one batch)
+        by_type = {}
+        for monitor in monitors:
+            by_type.setdefault(monitor.device_type, []).append(monitor)
+
+        for device_type, members in by_type.items():
+            start = min(m.device_number for m in members)
+            count = max(m.device_number for m in members) - start + 1
+            try:
+                values = self._read_devices(device_type, start, count)
+            except PlcError as e:
+                logger.warning("Failed to read initial values: %s (初期値の読み込みに失敗しました)", e)
+                for member in members:
+                    if member.on_error:
+                        member.handle_error(e)
+                continue
+            for member in members:
+                member.last_value = values[member.device_number - start]
+
+        return monitors
+
+    def add_devices(self, device_type, start_number, count, callback=None, on_error=None, adaptive=False,
+                    batch_callback=None):
         """
         監視対象のデバイスグループを追加する
         Add a group of devices to monitor
-        
+
         引数 (Arguments):
             device_type (str): デバイスタイプ (Device type)
             start_number (int): 開始デバイス番号 (Starting device number)
             count (int): デバイス数 (Number of devices)
             callback: 値が変化した場合に呼び出されるコールバック関数 (Callback function called when the values change)
             on_error: エラーが発生した場合に呼び出されるコールバック関数 (Callback function called when an error occurs)
-            
+            adaptive (bool): 値が変化しない間、読み出し周期を自動的に間引くかどうか。
+                             応答性が重要な点ではFalseのままにしてください。
+                             (Whether to automatically thin out reads while the values are
+                             unchanged. Leave False for latency-critical points.)
+            batch_callback: 変化を1回でまとめて受け取るコールバック関数 (DeviceGroupMonitorを参照)
+                            (Callback function that receives all changes in one call (see DeviceGroupMonitor))
+
         戻り値 (Returns):
             DeviceGroupMonitor: 追加されたデバイスグループモニター (Added device group monitor)
         """
-        monitor = DeviceGroupMonitor(device_type, start_number, count, callback, on_error)
-        self.group_monitors.append(monitor)
-        
+        monitor = DeviceGroupMonitor(device_type, start_number, count, callback, on_error, adaptive,
+                                     batch_callback)
+        with self._lock:
+            self._group_pos[monitor] = len(self.group_monitors)
+            self.group_monitors.append(monitor)
+            self._group_index.setdefault((device_type, start_number, count), []).append(monitor)
+            self._plan = None
+
         # 初期値を読み込む (Read initial values)
         try:
-            values = self.plc.read_devices(device_type, start_number, count)
+            values = self._read_devices(device_type, start_number, count)
             monitor.last_values = values.copy()
         except PlcError as e:
-            logger.warning(f"Failed to read initial values: {e} (初期値の読み込みに失敗しました)")
+            logger.warning("Failed to read initial values: %s (初期値の読み込みに失敗しました)", e)
             if on_error:
                 monitor.handle_error(e)
         
         return monitor
     
+    @staticmethod
+    def _swap_remove(items, positions, item):
+        """
+        リストから要素をO(1)で削除する
+        Remove an item from a list in O(1)
+
+        削除対象を末尾要素と入れ替えてからpopするため、リストの順序は
+        保持されません。読み出し計画は削除時に無効化され再構築されるため、
+        監視対象の並び順に依存する処理はありません。
+
+        (The target is swapped with the last element before popping, so the
+        list order is not preserved. The read plan is invalidated on removal
+        and rebuilt, so nothing depends on the ordering of the targets.)
+
+        引数 (Arguments):
+            items (list): 削除対象を含むリスト (List containing the item)
+            positions (dict): 要素からリスト内位置への辞書 (Item-to-index mapping)
+            item: 削除する要素 (Item to remove)
+        """
+        index = positions.pop(item)
+        last = items.pop()
+        if last is not item:
+            items[index] = last
+            positions[last] = index
+
     def remove_device(self, device_type, device_number):
         """
         監視対象のデバイスを削除する
@@ -288,9 +531,14 @@ class PlcMonitor:
         戻り値 (Returns):
             bool: 削除に成功した場合はTrue、失敗した場合はFalse (True if removal was successful, False otherwise)
         """
-        for i, monitor in enumerate(self.monitors):
-            if monitor.device_type == device_type and monitor.device_number == device_number:
-                self.monitors.pop(i)
+        with self._lock:
+            registered = self._monitor_index.get((device_type, device_number))
+            if registered:
+                monitor = registered.pop(0)
+                if not registered:
+                    del self._monitor_index[(device_type, device_number)]
+                self._swap_remove(self.monitors, self._monitor_pos, monitor)
+                self._plan = None
                 return True
         return False
     
@@ -307,11 +555,14 @@ class PlcMonitor:
         戻り値 (Returns):
             bool: 削除に成功した場合はTrue、失敗した場合はFalse (True if removal was successful, False otherwise)
         """
-        for i, monitor in enumerate(self.group_monitors):
-            if (monitor.device_type == device_type and 
-                monitor.start_number == start_number and 
-                monitor.count == count):
-                self.group_monitors.pop(i)
+        with self._lock:
+            registered = self._group_index.get((device_type, start_number, count))
+            if registered:
+                monitor = registered.pop(0)
+                if not registered:
+                    del self._group_index[(device_type, start_number, count)]
+                self._swap_remove(self.group_monitors, self._group_pos, monitor)
+                self._plan = None
                 return True
         return False
     
@@ -320,22 +571,43 @@ class PlcMonitor:
         すべての監視対象をクリアする
         Clear all monitoring targets
         """
-        self.monitors.clear()
-        self.group_monitors.clear()
+        with self._lock:
+            self.monitors.clear()
+            self.group_monitors.clear()
+            self._monitor_index.clear()
+            self._group_index.clear()
+            self._monitor_pos.clear()
+            self._group_pos.clear()
+            self._plan = None
     
-    def start(self, interval=None):
+    def start(self, interval=None, _test_no_thread=False):
         """
         監視を開始する
         Start monitoring
-        
+
         引数 (Arguments):
             interval (float): 監視周期（秒） (Monitoring interval in seconds)
+            _test_no_thread (bool): テスト用。Trueの場合は監視スレッドを起動せず、
+                                    状態のみ実行中に遷移させます。ポーリングは
+                                    poll_once()で呼び出し側が駆動します。
+                                    (For tests. When True, transition the state to
+                                    running without launching the worker threads;
+                                    the caller drives polling via poll_once().)
         """
         if interval is not None:
             self.interval = interval
-        
+
         if not self.running:
+            with self._lock:
+                if self._plan is None:
+                    self._plan = self._compile_plan()
+            self._stop_event.clear()
             self.running = True
+            if _test_no_thread:
+                return
+            self._cb_thread = threading.Thread(target=self._cb_loop)
+            self._cb_thread.daemon = True
+            self._cb_thread.start()
             self.thread = threading.Thread(target=self._monitor_loop)
             self.thread.daemon = True
             self.thread.start()
@@ -346,46 +618,367 @@ class PlcMonitor:
         Stop monitoring
         """
         self.running = False
+        # 周期待機中でも即座に抜けられるようにイベントで通知する
+        # (Signal via the event so a cycle wait is interrupted immediately)
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=self.interval * 2)
             self.thread = None
+        if self._cb_thread is not None:
+            # 配送済みのコールバックを処理し終えてから停止させる番兵を送る
+            # (Send the sentinel so queued callbacks finish before the thread stops)
+            self._cb_queue.put(None)
+            self._cb_thread.join(timeout=self.interval * 2)
+            self._cb_thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
-    def _monitor_loop(self):
+    def _read_device(self, device_type, device_number):
         """
-        監視ループの内部メソッド
-        Internal method for the monitoring loop
+        単一デバイスを読み出す (プール使用時は接続を借り出して読み出す)
+        Read a single device (borrowing a connection when a pool is used)
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (Device type)
+            device_number (int): デバイス番号 (Device number)
+
+        戻り値 (Returns):
+            読み出した値 (Read value)
         """
-        while self.running:
-            start_time = time.time()
-            
-            # 単一デバイスの監視 (Monitor single devices)
-            for monitor in self.monitors:
+        if self._pool is not None:
+            with self._pool.borrow() as client:
+                return client.read_device(device_type, device_number)
+        return self.plc.read_device(device_type, device_number)
+
+    def _read_devices(self, device_type, start_number, count):
+        """
+        複数デバイスを読み出す (プール使用時は接続を借り出して読み出す)
+        Read multiple devices (borrowing a connection when a pool is used)
+
+        引数 (Arguments):
+            device_type (str): デバイスタイプ (Device type)
+            start_number (int): 先頭デバイス番号 (Starting device number)
+            count (int): デバイス数 (Number of devices)
+
+        戻り値 (Returns):
+            list: 読み出した値のリスト (List of read values)
+        """
+        if self._pool is not None:
+            with self._pool.borrow() as client:
+                return client.read_devices(device_type, start_number, count)
+        return self.plc.read_devices(device_type, start_number, count)
+
+    def _compile_plan(self):
+        """
+        登録された監視対象から読み出し計画を作成する
+        Compile a read plan from the registered monitoring targets
+
+        同一デバイスタイプで番号が隣接（またはmax_gap以内）する監視対象を
+        1つの一括読み出しブロックに統合します。1回の監視周期あたりの
+        通信回数を、登録数ではなくブロック数まで削減します。
+
+        Merges monitoring targets of the same device type whose numbers are
+        adjacent (or within max_gap) into one bulk-read block, reducing the
+        per-cycle network cost from the number of registrations to the number
+        of blocks.
+
+        戻り値 (Returns):
+            list: (デバイスタイプ, 先頭番号, 点数, [(モニター, オフセット), ...])のリスト
+                  (List of (device_type, start, count, [(monitor, offset), ...]))
+        """
+        entries = []
+        for monitor in self.monitors:
+            entries.append((monitor.device_type, monitor.device_number, 1, monitor))
+        for monitor in self.group_monitors:
+            entries.append((monitor.device_type, monitor.start_number, monitor.count, monitor))
+        entries.sort(key=lambda e: (e[0], e[1]))
+
+        plan = []
+        for device_type, number, count, monitor in entries:
+            max_count = (self.MAX_BLOCK_BITS if device_type in MCProtocol.BIT_DEVICES
+                         else self.MAX_BLOCK_WORDS)
+            if plan:
+                block_type, block_start, block_count, members = plan[-1]
+                block_end = block_start + block_count
+                if (device_type == block_type and
+                        number <= block_end + self.max_gap and
+                        max(block_end, number + count) - block_start <= max_count):
+                    # 既存ブロックに統合 (Merge into the existing block)
+                    new_count = max(block_end, number + count) - block_start
+                    members.append((monitor, number - block_start))
+                    plan[-1] = (block_type, block_start, new_count, members)
+                    continue
+            plan.append((device_type, number, count, [(monitor, 0)]))
+
+        return plan
+
+    def poll_once(self):
+        """
+        すべての監視対象を1回だけポーリングする
+        Poll all monitoring targets once
+
+        コンパイル済みの読み出し計画に従って、ブロックごとに一括読み出しを行い、
+        読み出した値を各監視対象に振り分けます。監視スレッドを使用せずに、
+        呼び出し側のスケジューラ（asyncioループなど）から監視周期を制御する
+        場合にも使用できます。
+
+        Reads each block of the compiled read plan in one bulk request and
+        fans the values back out to the individual monitoring targets. This
+        can also be used to drive the monitoring cycle from the caller's own
+        scheduler (such as an asyncio event loop) instead of the built-in
+        monitoring thread.
+        """
+        # 計画はロック下で再構築し、走査自体はロックなしで行う (計画のタプルは
+        # 再構築以外で変更されないため、周期ごとのスナップショットとして機能する)
+        # (The plan is rebuilt under the lock but iterated without it (plan tuples
+        # are never mutated outside rebuilds, so it acts as a per-cycle snapshot))
+        plan = self._plan
+        if plan is None:
+            with self._lock:
+                plan = self._plan
+                if plan is None:
+                    plan = self._plan = self._compile_plan()
+
+        # 適応的な間引き: 全メンバーが間引き中のブロックは今周期の読み出しを
+        # 見送る (値が安定している点の読み出し量を削減する)
+        # (Adaptive thinning: a block whose members are all in backoff skips
+        # this cycle's read (reduces read volume for stable points))
+        due = []
+        for entry in plan:
+            if self._block_due(entry[3]):
+                due.append(entry)
+            else:
+                for monitor, _ in entry[3]:
+                    monitor._pending_cycles += 1
+        plan = due
+
+        # 接続プール使用時は、ブロックごとの読み出しをプールの接続で並行実行する
+        # (周期の所要時間が全ブロックの合計待ち時間から最長の待ち時間に短縮される)
+        # (With a connection pool, block reads run concurrently over the pooled
+        # connections (cycle time drops from the sum of all block latencies to
+        # the longest one))
+        if self._pool is not None and len(plan) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=min(8, self._pool.size))
+            futures = [
+                (members, self._executor.submit(self._read_devices, device_type, start, count))
+                for device_type, start, count, members in plan
+            ]
+            for members, future in futures:
                 try:
-                    value = self.plc.read_device(monitor.device_type, monitor.device_number)
-                    monitor.update(value)
+                    values = future.result()
                 except PlcError as e:
-                    logger.error(f"Failed to read device: {monitor.device_type}{monitor.device_number}: {e}")
-                    monitor.handle_error(e)
+                    logger.error("Failed to read devices: %s", e)
+                    for monitor, _ in members:
+                        monitor.handle_error(e)
+                    continue
                 except Exception as e:
-                    logger.error(f"Unexpected error occurred: {e}")
-            
-            # デバイスグループの監視 (Monitor device groups)
-            for monitor in self.group_monitors:
-                try:
-                    values = self.plc.read_devices(monitor.device_type, monitor.start_number, monitor.count)
-                    monitor.update(values)
-                except PlcError as e:
-                    logger.error(f"Failed to read device group: {monitor.device_type}{monitor.start_number}-{monitor.start_number + monitor.count - 1}: {e}")
+                    logger.error("Unexpected error occurred: %s", e)
+                    continue
+
+                # コールバックは監視スレッド上で順番に実行する
+                # (Callbacks still run sequentially on the monitoring thread)
+                self._dispatch_block(members, values)
+            self._publish_snapshot()
+            return
+
+        # 複数ブロックが残る場合は、複数ブロック一括読出しで1往復にまとめる
+        # (When multiple blocks remain, combine them into one round trip with a multiple-block batch read)
+        if len(plan) > 1 and hasattr(self.plc, 'read_many'):
+            items = [(device_type, start, count) for device_type, start, count, _ in plan]
+            try:
+                results = self.plc.read_many(items)
+            except PlcError as e:
+                logger.error("Failed to read devices: %s", e)
+                for _, _, _, members in plan:
+                    for monitor, _ in members:
+                        monitor.handle_error(e)
+                return
+            except Exception as e:
+                logger.error("Unexpected error occurred: %s", e)
+                return
+
+            for (_, _, _, members), values in zip(plan, results):
+                self._dispatch_block(members, values)
+            self._publish_snapshot()
+            return
+
+        for device_type, start, count, members in plan:
+            try:
+                values = self._read_devices(device_type, start, count)
+            except PlcError as e:
+                logger.error("Failed to read devices: %s%d-%d: %s", device_type, start, start + count - 1, e)
+                for monitor, _ in members:
                     monitor.handle_error(e)
-                except Exception as e:
-                    logger.error(f"Unexpected error occurred: {e}")
-            
-            # 次の周期まで待機 (Wait until the next cycle)
-            elapsed = time.time() - start_time
-            if elapsed < self.interval:
-                time.sleep(self.interval - elapsed)
+                continue
+            except Exception as e:
+                logger.error("Unexpected error occurred: %s", e)
+                continue
+
+            self._dispatch_block(members, values)
+
+        self._publish_snapshot()
+
+    def _dispatch_block(self, members, values):
+        """
+        1ブロック分の読み出し値を各監視対象に振り分ける
+        Fan one block of read values out to the individual monitoring targets
+
+        監視スレッドが動作している間は、コールバックは配送キュー経由で
+        専用スレッドに委譲されます。poll_once()を直接呼び出した場合は
+        同期的に呼び出されます。
+
+        While the monitoring thread is running, callbacks are delegated to the
+        dedicated dispatcher thread via the delivery queue. Direct poll_once()
+        calls invoke them synchronously.
+
+        引数 (Arguments):
+            members (list): (モニター, オフセット)のタプルのリスト (List of (monitor, offset) tuples)
+            values (list): ブロックの読み出し値 (Read values of the block)
+        """
+        dispatcher = self._cb_queue if self._cb_thread is not None else None
+        for monitor, offset in members:
+            if isinstance(monitor, DeviceGroupMonitor):
+                changed = monitor.update(values[offset:offset + monitor.count], dispatcher)
+            else:
+                changed = monitor.update(values[offset], dispatcher)
+
+            # 適応的な間引きの調整 (変化があれば即座に毎周期へ戻し、変化が
+            # なければスキップ数を上限まで倍増させる)
+            # (Adjust adaptive thinning (a change returns the point to every
+            # cycle immediately; no change doubles the skip count up to the cap))
+            if monitor.adaptive:
+                monitor._pending_cycles = 0
+                if changed:
+                    monitor._skip_cycles = 0
+                else:
+                    monitor._skip_cycles = min(self.MAX_SKIP_CYCLES, monitor._skip_cycles * 2 or 1)
+
+    def enable_shm(self, name=None, size=4096):
+        """
+        監視値の共有メモリへの公開を有効にする
+        Enable publication of monitored values to shared memory
+
+        有効にすると、ポーリングのたびに全監視対象の最新値がseqlock方式の
+        共有メモリブロックへ書き込まれます。他プロセスの読み出し側は
+        mcplcwatch.shm.SharedMemoryReaderでスナップショットを取得できます。
+        レイアウトは登録順で、単一デバイスが1ワード、グループがデバイス数分の
+        ワード（各リトルエンディアン16ビット）です。
+
+        When enabled, the latest values of all monitoring targets are written
+        to a seqlock-style shared memory block after every poll. Readers in
+        other processes obtain snapshots with
+        mcplcwatch.shm.SharedMemoryReader. The layout follows registration
+        order: one word per single device, then count words per group (each
+        little-endian 16-bit).
+
+        引数 (Arguments):
+            name (str): 共有メモリの名前。Noneの場合は自動生成される。
+                        (Name of the shared memory block. Auto-generated when None.)
+            size (int): ペイロードの最大バイト数 (Maximum payload size in bytes)
+
+        戻り値 (Returns):
+            SharedMemoryPublisher: 作成された公開側オブジェクト (Created publisher object)
+        """
+        from .shm import SharedMemoryPublisher
+        self._shm_publisher = SharedMemoryPublisher(name=name, size=size)
+        return self._shm_publisher
+
+    def _publish_snapshot(self):
+        """
+        全監視対象の最新値を共有メモリへ公開する
+        Publish the latest values of all monitoring targets to shared memory
+
+        公開が有効でない場合は何もしません。
+        Does nothing when publication is not enabled.
+        """
+        publisher = self._shm_publisher
+        if publisher is None:
+            return
+
+        parts = []
+        with self._lock:
+            for monitor in self.monitors:
+                value = monitor.last_value
+                parts.append(int(value) & 0xFFFF if value is not None else 0)
+            for monitor in self.group_monitors:
+                values = monitor.last_values
+                if values is None:
+                    parts.extend([0] * monitor.count)
+                else:
+                    parts.extend(int(v) & 0xFFFF for v in values)
+        publisher.publish(struct.pack('<%dH' % len(parts), *parts))
+
+    def _block_due(self, members):
+        """
+        ブロックを今周期に読み出すべきかどうかを判定する
+        Determine whether a block should be read in this cycle
+
+        間引き対象でないメンバーが1つでも含まれる場合、または間引き中の
+        メンバーがスキップ数に達した場合に読み出します。
+
+        The block is read when any member is not subject to thinning, or when
+        a member in backoff has reached its skip count.
+
+        引数 (Arguments):
+            members (list): (モニター, オフセット)のタプルのリスト (List of (monitor, offset) tuples)
+
+        戻り値 (Returns):
+            bool: 読み出すべき場合はTrue (True when the block should be read)
+        """
+        for monitor, _ in members:
+            if not monitor.adaptive or monitor._pending_cycles >= monitor._skip_cycles:
+                return True
+        return False
+
+    def _cb_loop(self):
+        """
+        コールバック配送ループの内部メソッド
+        Internal method for the callback delivery loop
+
+        キューから(コールバック, 引数)を取り出して順番に実行します。
+        Noneは停止の番兵です。
+
+        Takes (callback, arguments) items off the queue and runs them in
+        order. None is the stop sentinel.
+        """
+        while True:
+            item = self._cb_queue.get()
+            if item is None:
+                break
+            callback, args = item
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error("Error occurred in callback function: %s", e)
+
+    def _monitor_loop(self):
+        """
+        監視ループの内部メソッド
+        Internal method for the monitoring loop
+        """
+        # 絶対締め切り方式のスケジューリング (time.monotonic()は壁時計と異なり
+        # NTPによる時刻調整の影響を受けず、周期のずれも累積しない)
+        # (Absolute-deadline scheduling (unlike the wall clock, time.monotonic()
+        # is unaffected by NTP adjustments and cycle drift does not accumulate))
+        next_tick = time.monotonic()
+        while self.running and not self._stop_event.is_set():
+            next_tick += self.interval
+
+            self.poll_once()
+
+            # 次の締め切りまで待機 (停止要求があれば待機を即座に打ち切る)
+            # (Wait until the next deadline (a stop request interrupts the wait immediately))
+            remaining = next_tick - time.monotonic()
+            if remaining > 0:
+                if self._stop_event.wait(remaining):
+                    break
             else:
-                logger.warning(f"Monitoring cycle took too long: {elapsed:.3f} seconds (監視周期が間に合いませんでした)")
+                logger.warning("Monitoring cycle took too long: %.3f seconds (監視周期が間に合いませんでした)", self.interval - remaining)
+                # 締め切りを現在時刻に再同期する (連続した警告の発生を防ぐ)
+                # (Resynchronize the deadline to now (prevents a burst of warnings))
+                next_tick = time.monotonic()
     
     def is_running(self):
         """
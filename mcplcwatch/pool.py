@@ -0,0 +1,261 @@
+"""
+pool.py - PLCクライアントの接続を再利用するためのプールモジュール
+pool.py - Pool module for reusing PLC client connections
+
+本モジュールには、接続済みのPlcClientを(ホスト, ポート, フレームタイプ)ごとに
+保持して再利用するためのプールクラスが含まれています。接続を再利用することで、
+呼び出しごとのTCPハンドシェイクのコストを削減できます。
+
+This module contains a pool class that keeps connected PlcClient instances
+keyed by (host, port, frame type) for reuse. Reusing connections removes the
+per-call TCP handshake cost from the critical path.
+"""
+
+import contextlib
+import logging
+import queue
+import threading
+from .client import PlcClient
+from .error import PlcError
+from .protocol import MCProtocol
+
+
+# ロガーの設定 (Logger configuration)
+logger = logging.getLogger(__name__)
+
+
+class PlcClientPool:
+    """
+    接続済みのPlcClientを再利用するためのプールクラス
+    Pool class for reusing connected PlcClient instances
+
+    このクラスは、(ホスト, ポート, フレームタイプ)をキーとしてPlcClientを保持します。
+    PlcClientはスレッドセーフではないため、クライアントはスレッドごとに保持されます。
+
+    This class keeps PlcClient instances keyed by (host, port, frame type).
+    Since PlcClient is not thread-safe, clients are held per thread.
+
+    属性 (Attributes):
+        timeout (float): 新規クライアントに適用する通信タイムアウト時間（秒） (Communication timeout in seconds applied to new clients)
+    """
+
+    def __init__(self, timeout=1.0):
+        """
+        初期化メソッド
+        Initialization method
+
+        引数 (Arguments):
+            timeout (float): 新規クライアントに適用する通信タイムアウト時間（秒） (Communication timeout in seconds applied to new clients)
+        """
+        self.timeout = timeout
+        self._local = threading.local()
+        self._clients = []
+        self._lock = threading.Lock()
+
+    def get(self, host, port, frame_type=MCProtocol.FRAME_3E, **kwargs):
+        """
+        接続済みのクライアントを取得する（なければ作成する）
+        Get a connected client (creating one if necessary)
+
+        同じキーに対する2回目以降の呼び出しは、確立済みのTCP接続を再利用します。
+
+        Subsequent calls with the same key reuse the established TCP connection.
+
+        引数 (Arguments):
+            host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
+            port (int): PLCのポート番号 (PLC port number)
+            frame_type (str): 使用するフレームタイプ ("3E"または"4E") (Frame type to use ("3E" or "4E"))
+            **kwargs: PlcClientに渡す追加の引数 (Additional arguments passed to PlcClient)
+
+        戻り値 (Returns):
+            PlcClient: 接続済みのクライアント (Connected client)
+
+        例外 (Exceptions):
+            PlcCommunicationError: 接続に失敗した場合 (When connection fails)
+        """
+        cache = getattr(self._local, 'cache', None)
+        if cache is None:
+            cache = self._local.cache = {}
+
+        key = (host, port, frame_type)
+        client = cache.get(key)
+        if client is None:
+            kwargs.setdefault('timeout', self.timeout)
+            client = PlcClient(host=host, port=port, frame_type=frame_type, **kwargs)
+            cache[key] = client
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def close_all(self):
+        """
+        プール内のすべての接続を閉じる
+        Close all connections in the pool
+        """
+        with self._lock:
+            clients = self._clients
+            self._clients = []
+        for client in clients:
+            client.close()
+        self._local = threading.local()
+
+
+class PlcConnectionPool:
+    """
+    単一のPLCに対する固定サイズの接続プールクラス
+    Fixed-size connection pool class for a single PLC
+
+    PlcClientは1本のソケットを持つため、複数のスレッドから同じPLCを使用すると
+    すべての要求が1つのTCPフローに直列化されます。多くのPLCは複数の同時接続を
+    受け付けるため、確立済みの接続をN本保持して貸し出すことで、独立した操作の
+    スループットをPLCの接続上限まで引き上げられます。
+
+    A PlcClient holds one socket, so using the same PLC from multiple threads
+    serializes every request onto a single TCP flow. Many PLCs accept several
+    simultaneous connections; keeping N established connections and lending
+    them out scales the throughput of independent operations up to the PLC's
+    connection limit.
+
+    属性 (Attributes):
+        host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
+        port (int): PLCのポート番号 (PLC port number)
+        size (int): プールする接続数 (Number of pooled connections)
+    """
+
+    def __init__(self, host, port, size=2, health_check_interval=None, **kwargs):
+        """
+        初期化メソッド
+        Initialization method
+
+        引数 (Arguments):
+            host (str): PLCのホスト名またはIPアドレス (PLC hostname or IP address)
+            port (int): PLCのポート番号 (PLC port number)
+            size (int): プールする接続数 (Number of pooled connections)
+            health_check_interval (float): 死活監視の周期（秒）。Noneの場合は監視しない。
+                                           (Health check interval in seconds. None disables checking.)
+            **kwargs: PlcClientに渡す追加の引数 (Additional arguments passed to PlcClient)
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self._kwargs = kwargs
+        self._queue = queue.Queue(maxsize=size)
+        self._closed = False
+
+        # 接続を事前に確立してプールに投入する (Establish connections eagerly and put them into the pool)
+        for _ in range(size):
+            self._queue.put(PlcClient(host=host, port=port, **kwargs))
+
+        # 死活監視スレッド (Health check thread)
+        self._health_thread = None
+        self._health_stop = threading.Event()
+        if health_check_interval is not None:
+            self._health_thread = threading.Thread(
+                target=self._health_check_loop, args=(health_check_interval,)
+            )
+            self._health_thread.daemon = True
+            self._health_thread.start()
+
+    def acquire(self, timeout=None):
+        """
+        プールから接続を取得する
+        Acquire a connection from the pool
+
+        引数 (Arguments):
+            timeout (float): 待機の最大時間（秒）。Noneの場合は無期限に待機する。
+                             (Maximum time to wait in seconds. None waits indefinitely.)
+
+        戻り値 (Returns):
+            PlcClient: 接続済みのクライアント (Connected client)
+
+        例外 (Exceptions):
+            queue.Empty: タイムアウト内に接続を取得できなかった場合 (When no connection could be acquired within the timeout)
+        """
+        return self._queue.get(timeout=timeout)
+
+    def release(self, client):
+        """
+        接続をプールに返却する
+        Release a connection back to the pool
+
+        引数 (Arguments):
+            client (PlcClient): 返却するクライアント (Client to release)
+        """
+        self._queue.put(client)
+
+    @contextlib.contextmanager
+    def borrow(self, timeout=None):
+        """
+        接続を借り出すコンテキストマネージャ
+        Context manager that borrows a connection
+
+        withブロック内で例外が発生した場合は、接続の状態が不明になるため、
+        プールへ返却する前に再接続を試みます。
+
+        When an exception occurs inside the with block, the connection state
+        is unknown, so a reconnect is attempted before it is returned to the
+        pool.
+
+        引数 (Arguments):
+            timeout (float): 待機の最大時間（秒） (Maximum time to wait in seconds)
+
+        使用例 (Usage):
+            with pool.borrow() as plc:
+                value = plc.read_device('D', 100)
+        """
+        client = self.acquire(timeout=timeout)
+        try:
+            yield client
+        except Exception:
+            # 例外発生後の接続は状態が不明のため、返却前に再接続を試みる
+            # (The connection state is unknown after an exception, so try to reconnect before returning it)
+            try:
+                client.connect()
+            except PlcError:
+                logger.warning(f"Failed to reconnect pooled connection to {self.host}:{self.port}")
+            raise
+        finally:
+            self.release(client)
+
+    def _health_check_loop(self, interval):
+        """
+        死活監視ループの内部メソッド
+        Internal method for the health check loop
+
+        プールから接続を1本ずつ借り出し、未接続のものを再接続します。
+        Borrows connections from the pool one at a time and reconnects any
+        that are disconnected.
+
+        引数 (Arguments):
+            interval (float): 監視周期（秒） (Check interval in seconds)
+        """
+        while not self._health_stop.wait(interval):
+            for _ in range(self.size):
+                try:
+                    client = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    if not client.connected:
+                        client.connect()
+                except PlcError:
+                    logger.warning(f"Health check failed to reconnect to {self.host}:{self.port}")
+                finally:
+                    self._queue.put(client)
+
+    def close_all(self):
+        """
+        プール内のすべての接続を閉じる
+        Close all connections in the pool
+        """
+        self._closed = True
+        self._health_stop.set()
+        if self._health_thread:
+            self._health_thread.join(timeout=1.0)
+            self._health_thread = None
+        while True:
+            try:
+                client = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            client.close()
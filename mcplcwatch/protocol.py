@@ -9,6 +9,147 @@ This module contains constants related to Mitsubishi Electric's MC protocol
 and utility functions used for protocol processing.
 """
 
+import array
+import enum
+import functools
+import struct
+import sys
+
+
+class FrameType(str, enum.Enum):
+    """
+    MCプロトコルのフレームタイプ
+    MC protocol frame type
+
+    strを継承した列挙型のため、メンバーは従来の"3E"/"4E"文字列と等価に
+    比較・ハッシュされ、文字列を渡す既存の呼び出し側はそのまま動作します。
+    内部の分岐ではFrameType(frame_type)で正規化した上で、文字列比較より
+    高速なis比較を使用します。
+
+    A str-mixin enum, so the members compare and hash equal to the
+    conventional "3E"/"4E" strings and existing callers passing plain
+    strings keep working. Internal branches normalize via
+    FrameType(frame_type) and use identity comparison, which is faster
+    than string comparison.
+    """
+
+    F3E = "3E"
+    F4E = "4E"
+
+    def __str__(self):
+        return self.value
+
+
+# 事前コンパイル済みのワード列用Structのキャッシュ (点数ごとに再利用する)
+# (Cache of precompiled Structs for word sequences (reused per point count))
+_WORDS_STRUCT_CACHE = {}
+
+
+def _words_struct(count):
+    """
+    指定された点数のリトルエンディアンワード列用Structを取得する
+    Get a Struct for a little-endian word sequence of the given point count
+
+    引数 (Arguments):
+        count (int): ワード点数 (Number of word points)
+
+    戻り値 (Returns):
+        struct.Struct: 事前コンパイル済みのStruct (Precompiled Struct)
+    """
+    st = _WORDS_STRUCT_CACHE.get(count)
+    if st is None:
+        st = _WORDS_STRUCT_CACHE[count] = struct.Struct('<%dH' % count)
+    return st
+
+
+@functools.lru_cache(maxsize=32)
+def _frame_prefix(frame_type, network_no, pc_no, unit_io, unit_station):
+    """
+    フレーム先頭の共通部分 (サブヘッダ+アクセス経路+監視タイマ) を取得する
+    Get the common leading part of a frame (sub-header + access path + monitoring timer)
+
+    接続ごとにアクセス経路は固定のため、5要素のキーでキャッシュして
+    フレーム作成のたびに同じ先頭部分を組み立て直すのを避けます。
+    要求データ長のフィールドはゼロのままで、呼び出し側が後から設定します。
+
+    The access path is fixed per connection, so the same leading part is
+    cached by the 5-element key instead of being rebuilt on every frame
+    creation. The request data length field is left zero and set later by
+    the caller.
+
+    引数 (Arguments):
+        frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+        network_no (int): ネットワーク番号 (Network number)
+        pc_no (int): PC番号 (PC number)
+        unit_io (int): ユニットI/O番号 (Unit I/O number)
+        unit_station (int): ユニット局番号 (Unit station number)
+
+    戻り値 (Returns):
+        bytes: フレーム先頭の共通部分 (Common leading part of the frame)
+    """
+    frame_type = FrameType(frame_type)
+    prefix = list(MCProtocol.SUBHEADER[frame_type])
+    if frame_type is FrameType.F3E:
+        prefix.extend([
+            network_no,  # ネットワーク番号 (Network number)
+            pc_no,       # PC番号 (PC number)
+            unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
+            unit_station,  # 要求先ユニット局番号 (Destination unit station number)
+            0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
+        ])
+    else:  # FRAME_4E
+        prefix.extend([
+            0x00, 0x00,  # 応答データ長 (未使用) (Response data length (unused))
+            0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
+            network_no,  # ネットワーク番号 (Network number)
+            pc_no,       # PC番号 (PC number)
+            0xFF, 0xFF,  # 要求先CPU監視タイマ (Destination CPU monitoring timer)
+            unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
+            unit_station,  # 要求先ユニット局番号 (Destination unit station number)
+        ])
+    prefix.extend(MCProtocol.TIMER)  # 監視タイマ (Monitoring timer)
+    return bytes(prefix)
+
+
+def _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request_data):
+    """
+    共通部分と要求データからフレームを組み立てる
+    Assemble a frame from the common leading part and the request data
+
+    各create_*_frame関数が重複して持っていたフレーム組み立てと要求データ長の
+    設定をまとめた内部ヘルパーです。キャッシュ済みの先頭部分に要求データを
+    連結し、要求データ長をその場で書き込みます。
+
+    Internal helper consolidating the frame assembly and request data length
+    patching that each create_*_frame function used to duplicate. Appends the
+    request data to the cached leading part and writes the request data
+    length in place.
+
+    引数 (Arguments):
+        frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+        network_no (int): ネットワーク番号 (Network number)
+        pc_no (int): PC番号 (PC number)
+        unit_io (int): ユニットI/O番号 (Unit I/O number)
+        unit_station (int): ユニット局番号 (Unit station number)
+        request_data (bytearray): 監視タイマより後の要求データ部 (Request data after the monitoring timer)
+
+    戻り値 (Returns):
+        bytes: 送信用のバイナリデータ (Binary data for sending)
+    """
+    frame = bytearray(_frame_prefix(frame_type, network_no, pc_no, unit_io, unit_station))
+    frame.extend(request_data)
+
+    # 要求データ長の設定 (フレームタイプに応じて位置が異なる) (Set request data length (position differs according to frame type))
+    if FrameType(frame_type) is FrameType.F3E:
+        data_length_index = 7
+        data_start_index = 9
+    else:  # FRAME_4E
+        data_length_index = 3
+        data_start_index = 11
+
+    struct.pack_into('<H', frame, data_length_index, len(frame) - data_start_index)
+    return bytes(frame)
+
 
 class MCProtocol:
     """
@@ -22,27 +163,34 @@ class MCProtocol:
     as well as utility methods related to generating and parsing protocol frames.
     """
     
-    # フレームタイプ (Frame types)
-    FRAME_3E = "3E"
-    FRAME_4E = "4E"
+    # フレームタイプ (従来の"3E"/"4E"文字列と等価に比較できる列挙型)
+    # (Frame types; enum members comparing equal to the conventional "3E"/"4E" strings)
+    FRAME_3E = FrameType.F3E
+    FRAME_4E = FrameType.F4E
     
     # サブヘッダ (フレームタイプ別) (Sub-headers by frame type)
+    # (不変のバイト定数。連結がC言語レベルのコピーで済むようbytesで保持する)
+    # (Immutable byte constants; kept as bytes so concatenation is a C-level copy)
     SUBHEADER = {
-        FRAME_3E: [0x50, 0x00],  # 3Eフレーム (3E frame)
-        FRAME_4E: [0x54, 0x00],  # 4Eフレーム (4E frame)
+        FRAME_3E: b'\x50\x00',  # 3Eフレーム (3E frame)
+        FRAME_4E: b'\x54\x00',  # 4Eフレーム (4E frame)
     }
-    
+
     # コマンドコード (Command codes)
-    CMD_BATCH_READ_WORD = [0x01, 0x04]    # ワード単位の一括読出し (Batch read in word units)
-    CMD_BATCH_WRITE_WORD = [0x01, 0x14]   # ワード単位の一括書き込み (Batch write in word units)
-    CMD_BATCH_READ_BIT = [0x01, 0x04]     # ビット単位の一括読出し (Batch read in bit units)
-    CMD_BATCH_WRITE_BIT = [0x01, 0x14]    # ビット単位の一括書き込み (Batch write in bit units)
-    
+    CMD_BATCH_READ_WORD = b'\x01\x04'    # ワード単位の一括読出し (Batch read in word units)
+    CMD_BATCH_WRITE_WORD = b'\x01\x14'   # ワード単位の一括書き込み (Batch write in word units)
+    CMD_BATCH_READ_BIT = b'\x01\x04'     # ビット単位の一括読出し (Batch read in bit units)
+    CMD_BATCH_WRITE_BIT = b'\x01\x14'    # ビット単位の一括書き込み (Batch write in bit units)
+    CMD_MULTI_BLOCK_READ = b'\x06\x04'   # 複数ブロック一括読出し (Multiple-block batch read)
+    CMD_RANDOM_READ = b'\x03\x04'        # ランダム読出し (Random read)
+    CMD_RANDOM_WRITE = b'\x02\x14'       # ランダム書き込み (Random write)
+
     # サブコマンド (MELSEC-Q/Lシリーズ用) (Sub-commands for MELSEC-Q/L series)
-    SUBCMD = [0x00, 0x00]
-    
+    SUBCMD = b'\x00\x00'
+    SUBCMD_BIT = b'\x01\x00'  # ビット単位アクセス用 (For access in bit units)
+
     # 監視タイマ (デフォルト: 2秒) (Monitoring timer (default: 2 seconds))
-    TIMER = [0x20, 0x00]
+    TIMER = b'\x20\x00'
     
     # デバイスコード (Device codes)
     DEVICE_CODES = {
@@ -67,22 +215,32 @@ class MCProtocol:
         'ZR': 0xB0,  # ファイルレジスタ (File register)
     }
     
-    # ビットデバイスのリスト (List of bit devices)
-    BIT_DEVICES = ['X', 'Y', 'M', 'B', 'SM', 'TS', 'TC', 'SS', 'SC', 'CS', 'CC']
+    # ビットデバイスの集合 (メンバーシップ判定が定数時間になるようfrozensetを使用)
+    # (Set of bit devices (frozenset so membership tests are constant time))
+    BIT_DEVICES = frozenset({'X', 'Y', 'M', 'B', 'SM', 'TS', 'TC', 'SS', 'SC', 'CS', 'CC'})
     
-    # ワードデバイスのリスト (List of word devices)
-    WORD_DEVICES = ['D', 'W', 'SD', 'TN', 'SN', 'CN', 'R', 'ZR']
+    # ワードデバイスの集合 (メンバーシップ判定が定数時間になるようfrozensetを使用)
+    # (Set of word devices (frozenset so membership tests are constant time))
+    WORD_DEVICES = frozenset({'D', 'W', 'SD', 'TN', 'SN', 'CN', 'R', 'ZR'})
     
     @staticmethod
     def zero_padding(value, length):
         """
         16進数文字列を0埋めする
         Zero-pad a hexadecimal string
-        
+
+        非推奨: フレームのエンコードはビットシフトとstructに移行済みのため、
+        本メソッドはホットパスでは使用されていません。バイトのエンコードには
+        struct.pack('<H', n)などを使用してください。
+
+        Deprecated: frame encoding has moved to bit shifts and struct, so this
+        method is no longer used on the hot path. Use struct.pack('<H', n) or
+        similar for byte encoding.
+
         引数 (Arguments):
             value (str): 0埋めする16進数文字列 (Hexadecimal string to be zero-padded)
             length (int): 出力する文字列の長さ (Length of the output string)
-            
+
         戻り値 (Returns):
             str: 0埋めされた16進数文字列 (Zero-padded hexadecimal string)
         """
@@ -137,11 +295,12 @@ class MCProtocol:
         戻り値 (Returns):
             list: 3バイトの16進数バイトのリスト（リトルエンディアン） (List of three hexadecimal bytes (little-endian))
         """
-        device_number_hex = MCProtocol.zero_padding(hex(device_number)[2:], 6)
+        # ビットシフトで直接バイトを取り出す (16進数文字列を経由しない)
+        # (Extract the bytes directly with bit shifts (no hexadecimal string round trip))
         return [
-            int(device_number_hex[4:], 16),
-            int(device_number_hex[2:4], 16),
-            int(device_number_hex[0:2], 16)
+            device_number & 0xFF,
+            (device_number >> 8) & 0xFF,
+            (device_number >> 16) & 0xFF
         ]
     
     @staticmethod
@@ -156,18 +315,30 @@ class MCProtocol:
         戻り値 (Returns):
             list: 2バイトの16進数バイトのリスト（リトルエンディアン） (List of two hexadecimal bytes (little-endian))
         """
-        element_hex = MCProtocol.zero_padding(hex(element)[2:], 4)
+        # ビットシフトで直接バイトを取り出す (16進数文字列を経由しない)
+        # (Extract the bytes directly with bit shifts (no hexadecimal string round trip))
         return [
-            int(element_hex[2:], 16),
-            int(element_hex[0:2], 16)
+            element & 0xFF,
+            (element >> 8) & 0xFF
         ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def create_read_frame(device_type, device_number, element, is_bit=False, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
         """
         読み出しフレームを作成する
         Create a read frame
-        
+
+        引数はすべて不変で戻り値も不変のbytesのため、引数の組ごとに結果を
+        メモ化します。同じデバイスを周期的にポーリングする場合、2回目以降は
+        辞書参照だけでフレームが得られます。キャッシュは
+        MCProtocol.create_read_frame.cache_clear()でクリアできます。
+
+        All arguments and the returned bytes are immutable, so the result is
+        memoized per argument tuple. When the same device is polled
+        periodically, subsequent calls reduce to a dict lookup. The cache can
+        be cleared with MCProtocol.create_read_frame.cache_clear().
+
         引数 (Arguments):
             device_type (str): デバイスタイプ ('D', 'M'など) (Device type ('D', 'M', etc.))
             device_number (int): デバイス番号 (Device number)
@@ -182,68 +353,317 @@ class MCProtocol:
         戻り値 (Returns):
             bytes: 送信用のバイナリデータ (Binary data for sending)
         """
-        # デバイスタイプのチェック (Check device type)
-        if device_type not in MCProtocol.DEVICE_CODES:
+        # デバイスタイプのチェックとデバイスコードの取得 (1回の参照で両方行う)
+        # (Check device type and get the device code (both in one lookup))
+        try:
+            device_code = MCProtocol.DEVICE_META[device_type][0]
+        except KeyError:
             raise ValueError(f"Unsupported device type: {device_type}")
-        
+
         # フレームタイプのチェック (Check frame type)
         if frame_type not in MCProtocol.SUBHEADER:
             raise ValueError(f"Unsupported frame type: {frame_type}")
-        
+
         # コマンドの選択 (ビットデバイスかワードデバイスか) (Select command (bit device or word device))
         command = MCProtocol.CMD_BATCH_READ_BIT if is_bit else MCProtocol.CMD_BATCH_READ_WORD
         
-        # フレームの共通部分を作成 (Create common part of the frame)
-        frame = [
-            # サブヘッダ (フレームタイプに応じて選択) (Sub-header (selected according to frame type))
-            *MCProtocol.SUBHEADER[frame_type],
-        ]
-        
-        # アクセス経路 (フレームタイプに応じて異なる) (Access path (differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
-            frame.extend([
-                network_no,  # ネットワーク番号 (Network number)
-                pc_no,       # PC番号 (PC number)
-                unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
-                unit_station,  # 要求先ユニット局番号 (Destination unit station number)
-                0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
-            ])
-        elif frame_type == MCProtocol.FRAME_4E:
-            frame.extend([
-                0x00, 0x00,  # 応答データ長 (未使用) (Response data length (unused))
-                0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
-                network_no,  # ネットワーク番号 (Network number)
-                pc_no,       # PC番号 (PC number)
-                0xFF, 0xFF,  # 要求先CPU監視タイマ (Destination CPU monitoring timer)
-                unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
-                unit_station,  # 要求先ユニット局番号 (Destination unit station number)
-            ])
+        # 要求データ部を組み立てる (共通部分と要求データ長は_build_frameが設定する)
+        # (Assemble the request data part (_build_frame adds the common part and request data length))
+        request = bytearray()
         
-        # 監視タイマと要求データを追加 (Add monitoring timer and request data)
-        frame.extend([
-            *MCProtocol.TIMER,  # 監視タイマ (Monitoring timer)
+        # 要求データを追加 (Add request data)
+        request.extend([
             # 要求データ (Request data)
             *command,  # コマンド (Command)
             *MCProtocol.SUBCMD,  # サブコマンド (Sub-command)
             *MCProtocol.device_number_to_bytes(device_number),  # 先頭デバイス番号 (Starting device number)
-            MCProtocol.DEVICE_CODES[device_type],  # デバイスコード (Device code)
+            device_code,  # デバイスコード (Device code)
             *MCProtocol.element_to_bytes(element),  # デバイス点数 (Number of device points)
         ])
         
-        # 要求データ長の設定 (フレームタイプに応じて位置が異なる) (Set request data length (position differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
+        return _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request)
+
+    @staticmethod
+    def create_read_frames_batch(specs, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
+        """
+        複数の読み出しフレームを1回の呼び出しでまとめて作成する
+        Create multiple read frames in a single call
+
+        create_read_frameをN回呼び出す代わりに、アクセス経路の解決と
+        作業用バッファをフレーム間で共有し、Pythonレベルの呼び出し
+        オーバーヘッドを分散します。多数のデバイスを周期的にポーリング
+        するワークロード向けです。
+
+        Instead of calling create_read_frame N times, the access path
+        resolution and the scratch buffer are shared across frames, amortizing
+        the Python-level call overhead. Intended for workloads that poll many
+        devices periodically.
+
+        引数 (Arguments):
+            specs (list): (デバイスタイプ, デバイス番号, 要素数, ビットデバイスかどうか)の
+                          タプルのリスト (List of (device type, device number,
+                          element count, is-bit flag) tuples)
+            frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+            network_no (int): ネットワーク番号 (4Eフレーム用) (Network number (for 4E frame))
+            pc_no (int): PC番号 (4Eフレーム用) (PC number (for 4E frame))
+            unit_io (int): ユニットI/O番号 (4Eフレーム用) (Unit I/O number (for 4E frame))
+            unit_station (int): ユニット局番号 (4Eフレーム用) (Unit station number (for 4E frame))
+
+        戻り値 (Returns):
+            list: specsと同じ順序の送信用バイナリデータのリスト
+                  (List of binary data for sending, in the same order as specs)
+        """
+        # フレームタイプのチェック (Check frame type)
+        if frame_type not in MCProtocol.SUBHEADER:
+            raise ValueError(f"Unsupported frame type: {frame_type}")
+
+        # 共通部分と要求データ長の位置をフレーム間で共有する
+        # (Share the common leading part and the data length position across frames)
+        prefix = _frame_prefix(frame_type, network_no, pc_no, unit_io, unit_station)
+        if FrameType(frame_type) is FrameType.F3E:
             data_length_index = 7
             data_start_index = 9
         else:  # FRAME_4E
             data_length_index = 3
             data_start_index = 11
-        
-        data_length = MCProtocol.zero_padding(hex(len(frame[data_start_index:]))[2:], 4)
-        frame[data_length_index] = int(data_length[2:], 16)
-        frame[data_length_index + 1] = int(data_length[0:2], 16)
-        
-        return bytes(frame)
-    
+
+        device_meta = MCProtocol.DEVICE_META
+        subcmd = MCProtocol.SUBCMD
+        frames = []
+        scratch = bytearray()
+        for device_type, device_number, element, is_bit in specs:
+            # デバイスタイプのチェックとデバイスコードの取得 (1回の参照で両方行う)
+            # (Check device type and get the device code (both in one lookup))
+            try:
+                device_code = device_meta[device_type][0]
+            except KeyError:
+                raise ValueError(f"Unsupported device type: {device_type}")
+
+            scratch.clear()
+            scratch += prefix
+            scratch += MCProtocol.CMD_BATCH_READ_BIT if is_bit else MCProtocol.CMD_BATCH_READ_WORD
+            scratch += subcmd
+            scratch.append(device_number & 0xFF)          # 先頭デバイス番号 (Starting device number)
+            scratch.append((device_number >> 8) & 0xFF)
+            scratch.append((device_number >> 16) & 0xFF)
+            scratch.append(device_code)                   # デバイスコード (Device code)
+            scratch.append(element & 0xFF)                # デバイス点数 (Number of device points)
+            scratch.append((element >> 8) & 0xFF)
+            struct.pack_into('<H', scratch, data_length_index, len(scratch) - data_start_index)
+            frames.append(bytes(scratch))
+
+        return frames
+
+    @staticmethod
+    def create_read_many_frame(word_blocks, bit_blocks, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
+        """
+        複数ブロック一括読出しフレームを作成する (コマンド0x0406)
+        Create a multiple-block batch read frame (command 0x0406)
+
+        複数の不連続なデバイス範囲を1つの要求フレームで読み出します。
+        応答データはすべてワード単位で返されます（ビットデバイスのブロックも
+        16点を1ワードに詰めた状態で返されます）。
+
+        Reads multiple non-contiguous device ranges with a single request frame.
+        The response data is always returned in word units (bit device blocks
+        are also returned with 16 points packed into one word).
+
+        引数 (Arguments):
+            word_blocks (list): ワードデバイスブロックのリスト。各要素は
+                                (デバイスタイプ, 先頭デバイス番号, ワード点数)のタプル
+                                (List of word device blocks, each a tuple of
+                                (device type, starting device number, word count))
+            bit_blocks (list): ビットデバイスブロックのリスト。各要素は
+                               (デバイスタイプ, 先頭デバイス番号, ワード点数)のタプル
+                               (List of bit device blocks, each a tuple of
+                               (device type, starting device number, word count))
+            frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+            network_no (int): ネットワーク番号 (4Eフレーム用) (Network number (for 4E frame))
+            pc_no (int): PC番号 (4Eフレーム用) (PC number (for 4E frame))
+            unit_io (int): ユニットI/O番号 (4Eフレーム用) (Unit I/O number (for 4E frame))
+            unit_station (int): ユニット局番号 (4Eフレーム用) (Unit station number (for 4E frame))
+
+        戻り値 (Returns):
+            bytes: 送信用のバイナリデータ (Binary data for sending)
+        """
+        # デバイスタイプのチェック (Check device types)
+        for device_type, _, _ in word_blocks + bit_blocks:
+            if device_type not in MCProtocol.DEVICE_CODES:
+                raise ValueError(f"Unsupported device type: {device_type}")
+
+        # フレームタイプのチェック (Check frame type)
+        if frame_type not in MCProtocol.SUBHEADER:
+            raise ValueError(f"Unsupported frame type: {frame_type}")
+
+        # ブロック数のチェック (プロトコル上の上限は合計120ブロック)
+        # (Check block count (the protocol allows up to 120 blocks in total))
+        if len(word_blocks) + len(bit_blocks) > 120:
+            raise ValueError(f"Too many blocks: {len(word_blocks) + len(bit_blocks)} (max 120)")
+
+        # 要求データ部を組み立てる (共通部分と要求データ長は_build_frameが設定する)
+        # (Assemble the request data part (_build_frame adds the common part and request data length))
+        request = bytearray()
+
+        # 要求データを追加 (Add request data)
+        request.extend([
+            # 要求データ (Request data)
+            *MCProtocol.CMD_MULTI_BLOCK_READ,  # コマンド (Command)
+            *MCProtocol.SUBCMD,  # サブコマンド (Sub-command)
+            len(word_blocks),  # ワードデバイスブロック数 (Number of word device blocks)
+            len(bit_blocks),   # ビットデバイスブロック数 (Number of bit device blocks)
+        ])
+
+        # 各ブロックの指定を追加 (ワードブロック、ビットブロックの順)
+        # (Add each block specification (word blocks first, then bit blocks))
+        for device_type, device_number, points in word_blocks + bit_blocks:
+            request.extend([
+                *MCProtocol.device_number_to_bytes(device_number),  # 先頭デバイス番号 (Starting device number)
+                MCProtocol.DEVICE_CODES[device_type],  # デバイスコード (Device code)
+                *MCProtocol.element_to_bytes(points),  # デバイス点数 (Number of device points)
+            ])
+
+        return _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request)
+
+    @staticmethod
+    def create_random_read_frame(items, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
+        """
+        ランダム読出しフレームを作成する (コマンド0x0403、ワード単位)
+        Create a random read frame (command 0x0403, word units)
+
+        不連続な個々のデバイスを1つの要求フレームで読み出します。すべての
+        デバイスはワード単位でアクセスされます（ビットデバイスも1ワードとして
+        返されます）。
+
+        Reads individual non-contiguous devices with a single request frame.
+        All devices are accessed in word units (bit devices are also returned
+        as one word each).
+
+        引数 (Arguments):
+            items (list): (デバイスタイプ, デバイス番号)のタプルのリスト
+                          (List of (device type, device number) tuples)
+            frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+            network_no (int): ネットワーク番号 (4Eフレーム用) (Network number (for 4E frame))
+            pc_no (int): PC番号 (4Eフレーム用) (PC number (for 4E frame))
+            unit_io (int): ユニットI/O番号 (4Eフレーム用) (Unit I/O number (for 4E frame))
+            unit_station (int): ユニット局番号 (4Eフレーム用) (Unit station number (for 4E frame))
+
+        戻り値 (Returns):
+            bytes: 送信用のバイナリデータ (Binary data for sending)
+        """
+        # デバイスタイプのチェック (Check device types)
+        for device_type, _ in items:
+            if device_type not in MCProtocol.DEVICE_CODES:
+                raise ValueError(f"Unsupported device type: {device_type}")
+
+        # フレームタイプのチェック (Check frame type)
+        if frame_type not in MCProtocol.SUBHEADER:
+            raise ValueError(f"Unsupported frame type: {frame_type}")
+
+        # 点数のチェック (プロトコル上の上限はワードアクセスで192点)
+        # (Check point count (the protocol allows up to 192 points for word access))
+        if len(items) > 192:
+            raise ValueError(f"Too many items: {len(items)} (max 192)")
+
+        # 要求データ部を組み立てる (共通部分と要求データ長は_build_frameが設定する)
+        # (Assemble the request data part (_build_frame adds the common part and request data length))
+        request = bytearray()
+
+        # 要求データを追加 (Add request data)
+        request.extend([
+            # 要求データ (Request data)
+            *MCProtocol.CMD_RANDOM_READ,  # コマンド (Command)
+            *MCProtocol.SUBCMD,  # サブコマンド (Sub-command)
+            len(items),  # ワードアクセス点数 (Number of word access points)
+            0x00,        # ダブルワードアクセス点数 (未使用) (Number of double-word access points (unused))
+        ])
+
+        # 各デバイスの指定を追加 (Add each device specification)
+        for device_type, device_number in items:
+            request.extend([
+                *MCProtocol.device_number_to_bytes(device_number),  # デバイス番号 (Device number)
+                MCProtocol.DEVICE_CODES[device_type],  # デバイスコード (Device code)
+            ])
+
+        return _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request)
+
+    @staticmethod
+    def create_random_write_frame(items, is_bit=False, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
+        """
+        ランダム書き込みフレームを作成する (コマンド0x1402)
+        Create a random write frame (command 0x1402)
+
+        不連続な個々のデバイスに1つの要求フレームで書き込みます。ワード単位と
+        ビット単位はサブコマンドが異なるため、1つのフレームに混在できません。
+
+        Writes individual non-contiguous devices with a single request frame.
+        Word units and bit units use different sub-commands, so they cannot
+        be mixed in one frame.
+
+        引数 (Arguments):
+            items (list): (デバイスタイプ, デバイス番号, 値)のタプルのリスト
+                          (List of (device type, device number, value) tuples)
+            is_bit (bool): ビット単位で書き込むかどうか (Whether to write in bit units)
+            frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+            network_no (int): ネットワーク番号 (4Eフレーム用) (Network number (for 4E frame))
+            pc_no (int): PC番号 (4Eフレーム用) (PC number (for 4E frame))
+            unit_io (int): ユニットI/O番号 (4Eフレーム用) (Unit I/O number (for 4E frame))
+            unit_station (int): ユニット局番号 (4Eフレーム用) (Unit station number (for 4E frame))
+
+        戻り値 (Returns):
+            bytes: 送信用のバイナリデータ (Binary data for sending)
+        """
+        # デバイスタイプのチェック (Check device types)
+        for device_type, _, _ in items:
+            if device_type not in MCProtocol.DEVICE_CODES:
+                raise ValueError(f"Unsupported device type: {device_type}")
+
+        # フレームタイプのチェック (Check frame type)
+        if frame_type not in MCProtocol.SUBHEADER:
+            raise ValueError(f"Unsupported frame type: {frame_type}")
+
+        # 点数のチェック (プロトコル上の上限はビット188点/ワード160点)
+        # (Check point count (the protocol allows up to 188 bit / 160 word points))
+        max_items = 188 if is_bit else 160
+        if len(items) > max_items:
+            raise ValueError(f"Too many items: {len(items)} (max {max_items})")
+
+        # 要求データ部を組み立てる (共通部分と要求データ長は_build_frameが設定する)
+        # (Assemble the request data part (_build_frame adds the common part and request data length))
+        request = bytearray()
+
+        # 要求データを追加 (Add request data)
+        if is_bit:
+            request.extend([
+                    # 要求データ (Request data)
+                *MCProtocol.CMD_RANDOM_WRITE,  # コマンド (Command)
+                *MCProtocol.SUBCMD_BIT,  # サブコマンド (ビット単位) (Sub-command (bit units))
+                len(items),  # ビットアクセス点数 (Number of bit access points)
+            ])
+        else:
+            request.extend([
+                    # 要求データ (Request data)
+                *MCProtocol.CMD_RANDOM_WRITE,  # コマンド (Command)
+                *MCProtocol.SUBCMD,  # サブコマンド (ワード単位) (Sub-command (word units))
+                len(items),  # ワードアクセス点数 (Number of word access points)
+                0x00,        # ダブルワードアクセス点数 (未使用) (Number of double-word access points (unused))
+            ])
+
+        # 各デバイスの指定と書き込む値を追加 (Add each device specification and value to write)
+        for device_type, device_number, value in items:
+            request.extend([
+                *MCProtocol.device_number_to_bytes(device_number),  # デバイス番号 (Device number)
+                MCProtocol.DEVICE_CODES[device_type],  # デバイスコード (Device code)
+            ])
+            if is_bit:
+                # ビットデバイスの場合は、1バイトで1ビットを表現 (For bit devices, 1 byte represents 1 bit)
+                request.append(1 if value else 0)
+            else:
+                # ワードデバイスの場合は、2バイトで1ワードを表現 (For word devices, 2 bytes represent 1 word)
+                request.append(value & 0xFF)         # 下位バイト (Lower byte)
+                request.append((value >> 8) & 0xFF)  # 上位バイト (Upper byte)
+
+        return _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request)
+
     @staticmethod
     def create_write_frame(device_type, device_number, values, is_bit=False, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
         """
@@ -264,14 +684,17 @@ class MCProtocol:
         戻り値 (Returns):
             bytes: 送信用のバイナリデータ (Binary data for sending)
         """
-        # デバイスタイプのチェック (Check device type)
-        if device_type not in MCProtocol.DEVICE_CODES:
+        # デバイスタイプのチェックとデバイスコードの取得 (1回の参照で両方行う)
+        # (Check device type and get the device code (both in one lookup))
+        try:
+            device_code = MCProtocol.DEVICE_META[device_type][0]
+        except KeyError:
             raise ValueError(f"Unsupported device type: {device_type}")
-        
+
         # フレームタイプのチェック (Check frame type)
         if frame_type not in MCProtocol.SUBHEADER:
             raise ValueError(f"Unsupported frame type: {frame_type}")
-        
+
         # 値が単一の場合はリストに変換 (Convert a single value to a list)
         if not isinstance(values, list):
             values = [values]
@@ -279,68 +702,33 @@ class MCProtocol:
         # コマンドの選択 (ビットデバイスかワードデバイスか) (Select command (bit device or word device))
         command = MCProtocol.CMD_BATCH_WRITE_BIT if is_bit else MCProtocol.CMD_BATCH_WRITE_WORD
         
-        # フレームの共通部分を作成 (Create common part of the frame)
-        frame = [
-            # サブヘッダ (フレームタイプに応じて選択) (Sub-header (selected according to frame type))
-            *MCProtocol.SUBHEADER[frame_type],
-        ]
+        # 要求データ部を組み立てる (共通部分と要求データ長は_build_frameが設定する)
+        # (Assemble the request data part (_build_frame adds the common part and request data length))
+        request = bytearray()
         
-        # アクセス経路 (フレームタイプに応じて異なる) (Access path (differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
-            frame.extend([
-                network_no,  # ネットワーク番号 (Network number)
-                pc_no,       # PC番号 (PC number)
-                unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
-                unit_station,  # 要求先ユニット局番号 (Destination unit station number)
-                0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
-            ])
-        elif frame_type == MCProtocol.FRAME_4E:
-            frame.extend([
-                0x00, 0x00,  # 応答データ長 (未使用) (Response data length (unused))
-                0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
-                network_no,  # ネットワーク番号 (Network number)
-                pc_no,       # PC番号 (PC number)
-                0xFF, 0xFF,  # 要求先CPU監視タイマ (Destination CPU monitoring timer)
-                unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
-                unit_station,  # 要求先ユニット局番号 (Destination unit station number)
-            ])
-        
-        # 監視タイマと要求データを追加 (Add monitoring timer and request data)
-        frame.extend([
-            *MCProtocol.TIMER,  # 監視タイマ (Monitoring timer)
+        # 要求データを追加 (Add request data)
+        request.extend([
             # 要求データ (Request data)
             *command,  # コマンド (Command)
             *MCProtocol.SUBCMD,  # サブコマンド (Sub-command)
             *MCProtocol.device_number_to_bytes(device_number),  # 先頭デバイス番号 (Starting device number)
-            MCProtocol.DEVICE_CODES[device_type],  # デバイスコード (Device code)
+            device_code,  # デバイスコード (Device code)
             *MCProtocol.element_to_bytes(len(values)),  # デバイス点数 (Number of device points)
         ])
         
         # 書き込む値の追加 (Add values to write)
         if is_bit:
-            # ビットデバイスの場合は、1バイトで1ビットを表現 (For bit devices, 1 byte represents 1 bit)
-            for value in values:
-                frame.append(1 if value else 0)
+            # ビットデバイスの場合は、1バイトで1ビットを表現 (1回のextendで追加する)
+            # (For bit devices, 1 byte represents 1 bit (added with a single extend))
+            request.extend(1 if value else 0 for value in values)
         else:
-            # ワードデバイスの場合は、2バイトで1ワードを表現 (For word devices, 2 bytes represent 1 word)
-            for value in values:
-                value_hex = MCProtocol.zero_padding(hex(value)[2:], 4)
-                frame.append(int(value_hex[2:], 16))  # 下位バイト (Lower byte)
-                frame.append(int(value_hex[0:2], 16))  # 上位バイト (Upper byte)
-        
-        # 要求データ長の設定 (フレームタイプに応じて位置が異なる) (Set request data length (position differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
-            data_length_index = 7
-            data_start_index = 9
-        else:  # FRAME_4E
-            data_length_index = 3
-            data_start_index = 11
+            # ワードデバイスの場合は、2バイトで1ワードを表現 (全ワードを
+            # 事前コンパイル済みのStructで一括パックする)
+            # (For word devices, 2 bytes represent 1 word (all words are packed
+            # at once with a precompiled Struct))
+            request.extend(_words_struct(len(values)).pack(*values))
         
-        data_length = MCProtocol.zero_padding(hex(len(frame[data_start_index:]))[2:], 4)
-        frame[data_length_index] = int(data_length[2:], 16)
-        frame[data_length_index + 1] = int(data_length[0:2], 16)
-        
-        return bytes(frame)
+        return _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request)
     
     @staticmethod
     def create_write_string_frame(device_type, device_number, string_value, frame_type=FRAME_3E, network_no=0, pc_no=0xFF, unit_io=0x03FF, unit_station=0):
@@ -351,7 +739,9 @@ class MCProtocol:
         引数 (Arguments):
             device_type (str): デバイスタイプ ('D'など) (Device type ('D', etc.))
             device_number (int): デバイス番号 (Device number)
-            string_value (str): 書き込む文字列 (String to write)
+            string_value (str or bytes): 書き込む文字列。エンコード済みのバイト列も
+                                         そのまま受け付ける (String to write. An
+                                         already-encoded byte string is also accepted as is)
             frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
             network_no (int): ネットワーク番号 (4Eフレーム用) (Network number (for 4E frame))
             pc_no (int): PC番号 (4Eフレーム用) (PC number (for 4E frame))
@@ -369,35 +759,12 @@ class MCProtocol:
         if frame_type not in MCProtocol.SUBHEADER:
             raise ValueError(f"Unsupported frame type: {frame_type}")
         
-        # フレームの共通部分を作成 (Create common part of the frame)
-        frame = [
-            # サブヘッダ (フレームタイプに応じて選択) (Sub-header (selected according to frame type))
-            *MCProtocol.SUBHEADER[frame_type],
-        ]
-        
-        # アクセス経路 (フレームタイプに応じて異なる) (Access path (differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
-            frame.extend([
-                network_no,  # ネットワーク番号 (Network number)
-                pc_no,       # PC番号 (PC number)
-                unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
-                unit_station,  # 要求先ユニット局番号 (Destination unit station number)
-                0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
-            ])
-        elif frame_type == MCProtocol.FRAME_4E:
-            frame.extend([
-                0x00, 0x00,  # 応答データ長 (未使用) (Response data length (unused))
-                0x00, 0x00,  # 要求データ長 (後で設定) (Request data length (set later))
-                network_no,  # ネットワーク番号 (Network number)
-                pc_no,       # PC番号 (PC number)
-                0xFF, 0xFF,  # 要求先CPU監視タイマ (Destination CPU monitoring timer)
-                unit_io & 0xFF, (unit_io >> 8) & 0xFF,  # 要求先ユニットI/O番号 (Destination unit I/O number)
-                unit_station,  # 要求先ユニット局番号 (Destination unit station number)
-            ])
+        # 要求データ部を組み立てる (共通部分と要求データ長は_build_frameが設定する)
+        # (Assemble the request data part (_build_frame adds the common part and request data length))
+        request = bytearray()
         
-        # 監視タイマと要求データを追加 (Add monitoring timer and request data)
-        frame.extend([
-            *MCProtocol.TIMER,  # 監視タイマ (Monitoring timer)
+        # 要求データを追加 (Add request data)
+        request.extend([
             # 要求データ (Request data)
             *MCProtocol.CMD_BATCH_WRITE_WORD,  # コマンド (Command)
             *MCProtocol.SUBCMD,  # サブコマンド (Sub-command)
@@ -405,43 +772,31 @@ class MCProtocol:
             MCProtocol.DEVICE_CODES[device_type],  # デバイスコード (Device code)
         ])
         
-        # 文字列長の計算と必要なデバイス数の計算 (Calculate string length and required device count)
-        # 1ワードに2バイト格納できるため、文字列長を2で割って切り上げ (1 word can store 2 bytes, so divide string length by 2 and round up)
-        str_bytes = string_value.encode('utf-8')
-        str_length = len(str_bytes)
-        device_count = (str_length + 1) // 2  # 切り上げ (null終端用に+1) (Round up (add 1 for null termination))
-        if str_length % 2 == 1:
+        # 文字列のエンコードとnull終端の付加 (偶数バイト長になるようパディング)。
+        # エンコード済みのバイト列が渡された場合は再エンコードしない
+        # (Encode the string and append null termination (padded to an even byte
+        # length). An already-encoded byte string is not re-encoded)
+        if isinstance(string_value, (bytes, bytearray)):
+            str_bytes = bytes(string_value)
+        else:
+            str_bytes = string_value.encode('utf-8')
+        if len(str_bytes) % 2 == 1:
             # 奇数バイト数の場合は、最後に1バイト（null終端）を追加 (If odd number of bytes, add 1 byte (null termination) at the end)
             str_bytes += b'\x00'
         else:
             # 偶数バイト数の場合は、最後に2バイト（null終端+パディング）を追加 (If even number of bytes, add 2 bytes (null termination + padding) at the end)
             str_bytes += b'\x00\x00'
-            device_count += 1
-        
-        # デバイス点数の追加 (Add device count)
-        frame.extend(MCProtocol.element_to_bytes(device_count))
-        
-        # 文字列データの追加 (リトルエンディアン：2バイトごとに逆順で格納) (Add string data (little-endian: stored in reverse order every 2 bytes))
-        for i in range(0, len(str_bytes), 2):
-            frame.append(str_bytes[i])
-            if i + 1 < len(str_bytes):
-                frame.append(str_bytes[i + 1])
-            else:
-                frame.append(0)  # パディング (Padding)
-        
-        # 要求データ長の設定 (フレームタイプに応じて位置が異なる) (Set request data length (position differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
-            data_length_index = 7
-            data_start_index = 9
-        else:  # FRAME_4E
-            data_length_index = 3
-            data_start_index = 11
-        
-        data_length = MCProtocol.zero_padding(hex(len(frame[data_start_index:]))[2:], 4)
-        frame[data_length_index] = int(data_length[2:], 16)
-        frame[data_length_index + 1] = int(data_length[0:2], 16)
+
+        # デバイス点数の追加 (パディング後は1ワード=2バイトで割り切れる)
+        # (Add device count (after padding, the length divides evenly into 2-byte words))
+        device_count = len(str_bytes) // 2
+        request.extend(MCProtocol.element_to_bytes(device_count))
+
+        # 文字列データの追加 (パディング済みのバイト列をそのまま連結する)
+        # (Add string data (append the padded byte string as is))
+        request.extend(str_bytes)
         
-        return bytes(frame)
+        return _build_frame(frame_type, network_no, pc_no, unit_io, unit_station, request)
     
     @staticmethod
     def parse_read_response(response, element, is_bit=False, frame_type=FRAME_3E):
@@ -463,7 +818,7 @@ class MCProtocol:
             raise ValueError(f"Unsupported frame type: {frame_type}")
         
         # データ開始位置の決定 (フレームタイプに応じて異なる) (Determine data start position (differs according to frame type))
-        if frame_type == MCProtocol.FRAME_3E:
+        if FrameType(frame_type) is FrameType.F3E:
             data_start_index = 11  # 3Eフレームのデータ開始位置 (Data start position for 3E frame)
         else:  # FRAME_4E
             data_start_index = 15  # 4Eフレームのデータ開始位置 (Data start position for 4E frame)
@@ -472,20 +827,81 @@ class MCProtocol:
         data = []
         if is_bit:
             # ビットデバイスの場合は、1バイトで1ビットを表現 (For bit devices, 1 byte represents 1 bit)
-            for i in range(data_start_index, data_start_index + element):
-                data.append(response[i] != 0)
+            # ペイロードを一度だけスライスし、バイト列全体を一括で真偽値に展開する
+            # (Slice the payload once and expand the whole byte string to booleans in one pass)
+            payload = response[data_start_index:data_start_index + element]
+            if len(payload) < element:
+                raise ValueError(f"Invalid response data: Data length is too short")
+            data = [b != 0 for b in payload]
         else:
-            # ワードデバイスの場合は、2バイトで1ワードを表現 (リトルエンディアン) (For word devices, 2 bytes represent 1 word (little-endian))
-            for i in range(data_start_index, data_start_index + element * 2, 2):
-                if i + 1 < len(response):
-                    value = response[i] | (response[i + 1] << 8)
-                    data.append(value)
-                else:
-                    # 応答データが短い場合はエラー (Error if response data is too short)
-                    raise ValueError(f"Invalid response data: Data length is too short")
+            # ワードデバイスの場合は、2バイトで1ワードを表現 (リトルエンディアン)。
+            # 事前コンパイル済みのStructで全ワードを1回のC呼び出しで展開する
+            # (For word devices, 2 bytes represent 1 word (little-endian).
+            # A precompiled Struct unpacks all words in one C-level call)
+            if len(response) < data_start_index + element * 2:
+                # 応答データが短い場合はエラー (Error if response data is too short)
+                raise ValueError(f"Invalid response data: Data length is too short")
+            data = list(_words_struct(element).unpack_from(response, data_start_index))
         
         return data
-    
+
+    @staticmethod
+    def parse_read_response_zc(response, element, is_bit=False, frame_type=FRAME_3E):
+        """
+        読み出し応答をコピーなしで解析する
+        Parse a read response without copying
+
+        parse_read_response()と異なり、ワードデバイスの場合はarray.array('H')を、
+        ビットデバイスの場合は応答バッファを参照するmemoryviewを返します。
+        Pythonのintのリストへの展開を行わないため、大きなブロックの読み出しで
+        割り当て回数とメモリ帯域を削減できます。戻り値はresponseのバッファを
+        参照する場合があるため、intのリストが必要な場合は呼び出し側で
+        tolist()を呼び出してください。
+
+        Unlike parse_read_response(), this returns an array.array('H') for word
+        devices and a memoryview referencing the response buffer for bit
+        devices. It avoids expanding to a list of Python ints, reducing
+        allocations and memory bandwidth for large block reads. The return
+        value may alias the response buffer; call tolist() on the result when
+        a list of ints is needed.
+
+        引数 (Arguments):
+            response (bytes): 受信したバイナリデータ (Received binary data)
+            element (int): 読み出した要素数 (Number of elements read)
+            is_bit (bool): ビットデバイスかどうか (Whether it's a bit device)
+            frame_type (str): フレームタイプ ("3E"または"4E") (Frame type ("3E" or "4E"))
+
+        戻り値 (Returns):
+            array.array/memoryview: 解析されたデータ (Parsed data)
+        """
+        # フレームタイプのチェック (Check frame type)
+        if frame_type not in MCProtocol.SUBHEADER:
+            raise ValueError(f"Unsupported frame type: {frame_type}")
+
+        # データ開始位置の決定 (フレームタイプに応じて異なる) (Determine data start position (differs according to frame type))
+        if FrameType(frame_type) is FrameType.F3E:
+            data_start_index = 11  # 3Eフレームのデータ開始位置 (Data start position for 3E frame)
+        else:  # FRAME_4E
+            data_start_index = 15  # 4Eフレームのデータ開始位置 (Data start position for 4E frame)
+
+        if is_bit:
+            # ビットデバイスの場合は、応答バッファを参照するビューをそのまま返す
+            # (For bit devices, return a view referencing the response buffer)
+            if len(response) < data_start_index + element:
+                raise ValueError(f"Invalid response data: Data length is too short")
+            return memoryview(response)[data_start_index:data_start_index + element]
+
+        # ワードデバイスの場合は、バイト列から直接array.arrayを構築する
+        # (For word devices, build an array.array directly from the byte string)
+        if len(response) < data_start_index + element * 2:
+            raise ValueError(f"Invalid response data: Data length is too short")
+        words = array.array('H')
+        words.frombytes(memoryview(response)[data_start_index:data_start_index + element * 2])
+        if sys.byteorder != 'little':
+            # ビッグエンディアンのホストではバイトオーダーを変換する (Swap byte order on big-endian hosts)
+            words.byteswap()
+        return words
+
     @staticmethod
     def parse_string_data(word_data):
         """
@@ -498,14 +914,27 @@ class MCProtocol:
         戻り値 (Returns):
             str: 解析された文字列 (Parsed string)
         """
-        byte_data = []
-        for word in word_data:
-            # ワードデータをバイトデータに変換 (リトルエンディアン) (Convert word data to byte data (little-endian))
-            byte_data.append(word & 0xFF)
-            byte_data.append((word >> 8) & 0xFF)
-        
-        # null終端までのバイトデータを取得 (Get byte data up to null termination)
-        null_pos = byte_data.index(0) if 0 in byte_data else len(byte_data)
-        
-        # バイトデータをUTF-8文字列に変換 (Convert byte data to UTF-8 string)
-        return bytes(byte_data[:null_pos]).decode('utf-8') 
\ No newline at end of file
+        # 空のワードデータは空文字列 (Empty word data yields an empty string)
+        if not word_data:
+            return ''
+
+        # ワードデータを一括でバイト列に変換 (リトルエンディアン)。Pythonループで
+        # 1ワードずつ処理する代わりに、structで全ワードを一度にパックする
+        # (Convert the word data to a byte string in one step (little-endian).
+        # struct packs all words at once instead of a per-word Python loop)
+        byte_data = struct.pack('<%dH' % len(word_data), *word_data)
+
+        # null終端までのバイトデータをUTF-8文字列に変換 (Convert byte data up to null termination to a UTF-8 string)
+        return byte_data.split(b'\x00', 1)[0].decode('utf-8')
+
+
+# デバイスコードとビット種別をまとめたメタテーブル (インポート時に一度だけ構築)。
+# 1回の辞書参照でデバイスコードとビットデバイスかどうかの両方を取得でき、
+# 存在チェックとコード参照の2回の参照が不要になります。
+# (Meta table combining device code and bit flag (built once at import time).
+# A single dict lookup yields both the device code and whether it is a bit
+# device, removing the separate existence check and code lookup.)
+MCProtocol.DEVICE_META = {
+    device: (code, device in MCProtocol.BIT_DEVICES)
+    for device, code in MCProtocol.DEVICE_CODES.items()
+}
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+shm.py - 監視値を他プロセスへ共有メモリ経由で公開するモジュール
+shm.py - Module for publishing monitored values to other processes via shared memory
+
+本モジュールには、監視値のスナップショットをロックなしで他プロセスへ公開するための
+クラスが含まれています。書き込み側はシーケンス番号を奇数にしてからデータを書き込み、
+偶数に戻します（seqlock方式）。読み出し側はシーケンス番号が偶数かつ読み出し前後で
+一致することを確認するだけで、一貫したスナップショットを取得できます。
+コールバックごとのシリアライズやプロセス間キューは不要です。
+
+This module contains classes for publishing snapshots of monitored values to
+other processes without locks. The writer sets the sequence number odd, writes
+the data, and sets it back even (the seqlock scheme). A reader obtains a
+consistent snapshot just by checking that the sequence number is even and
+identical before and after the read. No per-callback serialization or
+inter-process queue is needed.
+"""
+
+import struct
+from multiprocessing import shared_memory
+
+
+# シーケンス番号のStruct (リトルエンディアン64ビット)
+# (Struct for the sequence number (little-endian 64-bit))
+_SEQ_STRUCT = struct.Struct('<Q')
+
+
+class SharedMemoryPublisher:
+    """
+    共有メモリへ値のスナップショットを公開するクラス
+    Class that publishes value snapshots to shared memory
+
+    属性 (Attributes):
+        shm: 共有メモリブロック (Shared memory block)
+        name (str): 共有メモリの名前。読み出し側に渡します。 (Name of the shared memory block. Pass it to readers.)
+    """
+
+    def __init__(self, name=None, size=4096):
+        """
+        初期化メソッド
+        Initialization method
+
+        引数 (Arguments):
+            name (str): 共有メモリの名前。Noneの場合は自動生成される。
+                        (Name of the shared memory block. Auto-generated when None.)
+            size (int): ペイロードの最大バイト数 (Maximum payload size in bytes)
+        """
+        self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                              size=size + _SEQ_STRUCT.size)
+        self.name = self.shm.name
+        self._seq = 0
+
+    def publish(self, payload):
+        """
+        ペイロードを公開する
+        Publish a payload
+
+        引数 (Arguments):
+            payload (bytes): 公開するバイト列 (Byte string to publish)
+
+        例外 (Exceptions):
+            ValueError: ペイロードが共有メモリに収まらない場合 (When the payload does not fit)
+        """
+        buf = self.shm.buf
+        if len(payload) > len(buf) - _SEQ_STRUCT.size:
+            raise ValueError(f"Payload too large for shared memory block: {len(payload)} bytes")
+
+        # 書き込み中であることを奇数のシーケンス番号で示す (seqlock)
+        # (An odd sequence number marks the write in progress (seqlock))
+        self._seq += 1
+        _SEQ_STRUCT.pack_into(buf, 0, self._seq)
+        buf[_SEQ_STRUCT.size:_SEQ_STRUCT.size + len(payload)] = payload
+        self._seq += 1
+        _SEQ_STRUCT.pack_into(buf, 0, self._seq)
+
+    def close(self, unlink=True):
+        """
+        共有メモリを閉じる
+        Close the shared memory block
+
+        引数 (Arguments):
+            unlink (bool): 共有メモリブロック自体を削除するかどうか (Whether to remove the block itself)
+        """
+        self.shm.close()
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedMemoryReader:
+    """
+    公開されたスナップショットを読み出すクラス
+    Class that reads published snapshots
+
+    属性 (Attributes):
+        shm: 共有メモリブロック (Shared memory block)
+    """
+
+    def __init__(self, name):
+        """
+        初期化メソッド
+        Initialization method
+
+        引数 (Arguments):
+            name (str): 公開側のSharedMemoryPublisherの名前 (Name of the publishing SharedMemoryPublisher)
+        """
+        self.shm = shared_memory.SharedMemory(name=name)
+
+    def read(self, length):
+        """
+        一貫したスナップショットを読み出す
+        Read a consistent snapshot
+
+        シーケンス番号が偶数かつ読み出し前後で一致するまで再試行します。
+        Retries until the sequence number is even and identical before and
+        after the read.
+
+        引数 (Arguments):
+            length (int): 読み出すペイロードのバイト数 (Number of payload bytes to read)
+
+        戻り値 (Returns):
+            tuple: (シーケンス番号, ペイロード) ((Sequence number, payload))
+        """
+        buf = self.shm.buf
+        while True:
+            seq_before = _SEQ_STRUCT.unpack_from(buf, 0)[0]
+            if seq_before & 1:
+                continue
+            payload = bytes(buf[_SEQ_STRUCT.size:_SEQ_STRUCT.size + length])
+            seq_after = _SEQ_STRUCT.unpack_from(buf, 0)[0]
+            if seq_before == seq_after:
+                return seq_before, payload
+
+    def close(self):
+        """
+        共有メモリを閉じる
+        Close the shared memory block
+        """
+        self.shm.close()
@@ -12,12 +12,97 @@ run_tests.py - mcplcwatchのテストを実行するスクリプト
   --all        単体テストとモックテストを実行 (デフォルト、統合テストは含まれません)
   --verbose    詳細な出力
   --readonly   PLCへの書き込みテストをスキップ (統合テストでのみ有効)
+  --jobs N     テストモジュールをN個のプロセスに分散して並列実行
 """
 
 import unittest
 import sys
 import os
 import argparse
+import io
+import socket
+from concurrent.futures import ProcessPoolExecutor
+
+
+_LOOPBACK_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+
+def _block_network():
+    """
+    ループバック以外への実ソケット接続を禁止する
+
+    単体テストとモックテストはソケットをテストダブルに差し替えて実行するため、
+    外部ホストへの接続が発生するのはモックの漏れか設定ミスです。接続タイムアウトで
+    数秒待たされる代わりに、その場でエラーにして原因を特定しやすくします。
+    ループバックはasyncioのモックサーバーやイベントループ内部で使用されるため
+    許可します。統合テスト (--integration) ではこの関数は呼び出されません。
+    """
+    # ssl等の標準ライブラリがsocket.socketを継承するため、クラスのまま差し替える
+    class _GuardedSocket(socket.socket):
+        def connect(self, address):
+            host = address[0] if isinstance(address, tuple) else address
+            if isinstance(host, str) and host not in _LOOPBACK_HOSTS:
+                raise RuntimeError(
+                    f"テスト中に外部ホストへの接続が発生しました: {host} "
+                    "(モックテストではソケットをテストダブルに差し替えてください)")
+            return super().connect(address)
+
+    socket.socket = _GuardedSocket
+
+
+def _run_test_module(pattern, verbosity):
+    """
+    1つのテストモジュールをワーカープロセスで実行する
+
+    引数:
+        pattern (str): 実行するテストファイル名 (例: 'test_protocol.py')
+        verbosity (int): unittestの出力詳細度
+
+    戻り値:
+        tuple: (パターン, 実行テスト数, 失敗メッセージのリスト, エラーメッセージのリスト, 出力)
+    """
+    _block_network()
+    loader = unittest.TestLoader()
+    suite = loader.discover('tests', pattern=pattern)
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity)
+    result = runner.run(suite)
+    failures = [message for _, message in result.failures]
+    errors = [message for _, message in result.errors]
+    return pattern, result.testsRun, failures, errors, stream.getvalue()
+
+
+def _run_parallel(patterns, jobs, verbosity):
+    """
+    テストモジュールを複数プロセスに分散して実行する
+
+    モジュール単位で分散するため、モジュール内のテスト順序は保たれます。
+    統合テストは実PLCの状態を共有するため、この経路では実行されません。
+
+    引数:
+        patterns (list): テストファイル名のリスト
+        jobs (int): ワーカープロセス数
+        verbosity (int): unittestの出力詳細度
+
+    戻り値:
+        bool: すべてのテストが成功した場合はTrue
+    """
+    total = 0
+    all_failures = []
+    all_errors = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(patterns))) as executor:
+        for pattern, ran, failures, errors, output in executor.map(
+                _run_test_module, patterns, [verbosity] * len(patterns)):
+            total += ran
+            all_failures.extend(failures)
+            all_errors.extend(errors)
+            sys.stderr.write(output)
+
+    print(f"合計 {total} 件のテストを {len(patterns)} モジュール並列で実行しました")
+    if all_failures or all_errors:
+        print(f"失敗: {len(all_failures)} 件, エラー: {len(all_errors)} 件")
+        return False
+    return True
 
 
 def main():
@@ -41,15 +126,31 @@ def main():
     parser.add_argument('--all', action='store_true', help='単体テストとモックテストを実行（統合テストは含まれません）')
     parser.add_argument('--verbose', '-v', action='store_true', help='詳細な出力')
     parser.add_argument('--readonly', action='store_true', help='PLCへの書き込みテストをスキップ（統合テストでのみ有効）')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='テストモジュールを分散するプロセス数（統合テストは常に直列実行）')
     args = parser.parse_args()
-    
+
     # オプションが指定されていない場合は --all を設定
     if not (args.unit or args.mock or args.integration or args.all):
         args.all = True
-    
+
     # verboseの設定（統合テストの場合は常に詳細モードに）
     verbosity = 2 if args.verbose or args.integration else 1
-    
+
+    # 並列実行 (統合テストは実PLCの状態を共有するため対象外)
+    if args.jobs > 1 and not args.integration:
+        patterns = []
+        if args.all or args.unit:
+            patterns.append('test_protocol.py')
+        if args.all or args.mock:
+            patterns.extend(sorted(
+                name for name in os.listdir('tests')
+                if name.startswith('test_') and name.endswith('_mock.py')))
+        sys.exit(0 if _run_parallel(patterns, args.jobs, verbosity) else 1)
+
+    # 統合テスト以外では実ソケットの生成を禁止する
+    if not args.integration:
+        _block_network()
+
     # テストスイートの作成
     test_suite = unittest.TestSuite()
     loader = unittest.TestLoader()
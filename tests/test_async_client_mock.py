@@ -0,0 +1,91 @@
+"""
+test_async_client_mock.py - 非同期PLCクライアントクラスのモックテスト
+
+本モジュールでは、ローカルのasyncioサーバーでPLCの応答を模擬して、
+AsyncPlcClientクラスの機能をテストします。実際のPLCがなくてもテストができます。
+"""
+
+import unittest
+import asyncio
+from mcplcwatch import AsyncPlcClient, PlcError
+
+
+def _run_with_mock_server(response, scenario):
+    """
+    模擬PLCサーバーを起動してシナリオコルーチンを実行するヘルパー
+
+    引数:
+        response (bytes): 要求に対して返す応答フレーム
+        scenario: (host, port)を受け取るコルーチン関数
+
+    戻り値:
+        シナリオコルーチンの戻り値
+    """
+    async def main():
+        async def handler(reader, writer):
+            # 要求を読み捨てて、用意した応答を返す
+            await reader.read(1024)
+            writer.write(response)
+            await writer.drain()
+
+        server = await asyncio.start_server(handler, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await scenario('127.0.0.1', port)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(main())
+
+
+class TestAsyncPlcClientMock(unittest.TestCase):
+    """
+    AsyncPlcClientクラスのモックテスト
+
+    テスト内容:
+    - 非同期の読み出しが正しく動作するか
+    - エラーレスポンスが例外として通知されるか
+    """
+
+    def test_read_device(self):
+        """
+        read_deviceコルーチンのテスト
+        """
+        # レスポンスデータを設定（3Eフレーム）
+        mock_response = bytes([
+            0x50, 0x00,  # サブヘッダ
+            0x00, 0xFF, 0xFF, 0x03, 0x00, 0x04, 0x00,  # アクセス経路
+            0x00, 0x00,  # 応答コード (正常)
+            0x2A, 0x00,  # データ: 42
+        ])
+
+        async def scenario(host, port):
+            async with AsyncPlcClient(host, port) as client:
+                return await client.read_device('D', 100)
+
+        result = _run_with_mock_server(mock_response, scenario)
+        self.assertEqual(result, 42, "読み出し結果が正しくありません")
+
+    def test_error_response(self):
+        """
+        エラーレスポンス処理のテスト
+        """
+        # エラーレスポンスデータを設定（3Eフレーム、エラーコード0xC059）
+        mock_response = bytes([
+            0x50, 0x00,  # サブヘッダ
+            0x00, 0xFF, 0xFF, 0x03, 0x00, 0x02, 0x00,  # アクセス経路
+            0x59, 0xC0,  # 応答コード (エラー: 0xC059)
+        ])
+
+        async def scenario(host, port):
+            async with AsyncPlcClient(host, port) as client:
+                await client.read_device('D', 100)
+
+        # デバイスエラーが例外として捕捉されることを確認
+        with self.assertRaises(PlcError):
+            _run_with_mock_server(mock_response, scenario)
+
+
+if __name__ == '__main__':
+    unittest.main()
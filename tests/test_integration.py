@@ -6,7 +6,7 @@ test_integration.py - 実際のPLCとの統合テスト
 """
 
 import unittest
-import time
+import queue
 import os
 import sys
 from mcplcwatch import PlcClient, PlcMonitor, PlcError, MCProtocol
@@ -148,42 +148,37 @@ class TestPlcIntegration(unittest.TestCase):
         """
         監視機能テスト
         """
-        # 値変更検出フラグ
-        value_changed = False
-        changed_value = None
-        
+        # 値変更イベントの受け渡しキュー
+        changes = queue.Queue()
+
         # コールバック関数
         def on_change(device_type, device_number, old_value, new_value):
-            nonlocal value_changed, changed_value
-            value_changed = True
-            changed_value = new_value
+            changes.put((device_type, device_number, old_value, new_value))
             print(f"{device_type}{device_number} が {old_value} から {new_value} に変更されました")
-        
+
         # モニターの設定
         monitor = PlcMonitor(self.plc, interval=0.5)
         monitor.add_device(TEST_DEVICE_TYPE, TEST_DEVICE_START, callback=on_change)
-        
+
         # 初期値を設定
         self.plc.write_device(TEST_DEVICE_TYPE, TEST_DEVICE_START, 0)
-        
+
+        # 最初のポーリングを同期的に実行して初期値を取り込む
+        monitor.poll_once()
+
         # 監視開始
         monitor.start()
-        
+
         try:
-            # 最初のポーリングが完了するまで待機
-            time.sleep(1.0)
-            
             # 値を変更
             self.plc.write_device(TEST_DEVICE_TYPE, TEST_DEVICE_START, 9999)
-            
-            # 変更が検出されるまで待機
-            timeout = time.time() + 2.0  # 2秒のタイムアウト
-            while not value_changed and time.time() < timeout:
-                time.sleep(0.1)
-            
-            # 値の変更が検出されたかチェック
-            self.assertTrue(value_changed, "値の変更が検出されませんでした")
-            self.assertEqual(changed_value, 9999, "検出された値が正しくありません")
+
+            # 変更イベントが届くまでブロックして待機（最大2秒）
+            try:
+                device_type, device_number, old_value, new_value = changes.get(timeout=2.0)
+            except queue.Empty:
+                self.fail("値の変更が検出されませんでした")
+            self.assertEqual(new_value, 9999, "検出された値が正しくありません")
             
         finally:
             # 監視停止
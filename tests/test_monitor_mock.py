@@ -12,6 +12,32 @@ import threading
 from mcplcwatch import PlcClient, PlcMonitor, PlcError
 
 
+class _StubPlcClient:
+    """
+    PlcClientの読み出し系APIを置き換える記録スタブ
+
+    呼び出しを (メソッド名, 引数...) のタプルとしてcallsリストに記録します。
+    read_valuesに (デバイスタイプ, デバイス番号) -> 値 を設定すると、
+    読み出し時にその値を返します。未設定のデバイスは0を返します。
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.read_values = {}
+
+    def read_device(self, device_type, device_number):
+        self.calls.append(('read_device', device_type, device_number))
+        return self.read_values.get((device_type, device_number), 0)
+
+    def read_devices(self, device_type, start_number, count):
+        self.calls.append(('read_devices', device_type, start_number, count))
+        return [self.read_values.get((device_type, start_number + i), 0)
+                for i in range(count)]
+
+    def reset_calls(self):
+        self.calls.clear()
+
+
 class TestPlcMonitorMock(unittest.TestCase):
     """
     PlcMonitorクラスのモックテスト
@@ -26,12 +52,8 @@ class TestPlcMonitorMock(unittest.TestCase):
         """
         テスト前の準備
         """
-        # PLCクライアントのモック作成
-        self.mock_plc = MagicMock(spec=PlcClient)
-        
-        # read_device/read_devicesの戻り値を設定
-        self.mock_plc.read_device.return_value = 0
-        self.mock_plc.read_devices.return_value = [0, 0, 0]
+        # PLCクライアントのスタブ作成 (読み出しは0を返し、呼び出しを記録する)
+        self.mock_plc = _StubPlcClient()
     
     def test_monitor_initialization(self):
         """
@@ -73,9 +95,35 @@ class TestPlcMonitorMock(unittest.TestCase):
         self.assertEqual(device_monitor.on_error, error_callback, "エラーコールバック関数が正しくありません")
         
         # 初期値の読み込みが行われたかチェック
-        self.mock_plc.read_device.assert_called_once_with('D', 100)
+        self.assertEqual(self.mock_plc.calls, [('read_device', 'D', 100)],
+                         "初期値の読み出しが1回だけ行われていません")
         self.assertEqual(device_monitor.last_value, 0, "初期値が正しくありません")
     
+    def test_add_device_bulk(self):
+        """
+        デバイス監視一括追加のテスト
+        """
+        # モニターインスタンスを作成
+        monitor = PlcMonitor(self.mock_plc)
+
+        # 一括読み出しで返される初期値を設定
+        self.mock_plc.read_values = {('D', 100): 11, ('D', 102): 33}
+
+        # 複数のデバイス監視をまとめて追加
+        monitors = monitor.add_device_bulk([('D', 100), ('D', 101), ('D', 102)])
+
+        # 監視対象が追加されたかチェック
+        self.assertEqual(len(monitor.monitors), 3, "監視対象が追加されていません")
+        self.assertEqual(monitors, monitor.monitors, "戻り値の監視対象が正しくありません")
+
+        # 初期値の読み込みが1回の一括読み出しで行われたかチェック
+        self.assertEqual(self.mock_plc.calls, [('read_devices', 'D', 100, 3)],
+                         "初期値の読み出しが一括化されていません")
+
+        # 各監視対象に初期値が設定されたかチェック
+        self.assertEqual([m.last_value for m in monitors], [11, 0, 33],
+                         "初期値が正しく振り分けられていません")
+
     def test_add_devices(self):
         """
         デバイスグループ監視追加のテスト
@@ -102,7 +150,8 @@ class TestPlcMonitorMock(unittest.TestCase):
         self.assertEqual(group_monitor.on_error, error_callback, "エラーコールバック関数が正しくありません")
         
         # 初期値の読み込みが行われたかチェック
-        self.mock_plc.read_devices.assert_called_once_with('D', 100, 3)
+        self.assertEqual(self.mock_plc.calls, [('read_devices', 'D', 100, 3)],
+                         "初期値の読み出しが1回だけ行われていません")
         self.assertEqual(group_monitor.last_values, [0, 0, 0], "初期値が正しくありません")
     
     def test_remove_device(self):
@@ -179,24 +228,65 @@ class TestPlcMonitorMock(unittest.TestCase):
         self.assertEqual(len(monitor.monitors), 0, "デバイス監視対象がクリアされていません")
         self.assertEqual(len(monitor.group_monitors), 0, "グループ監視対象がクリアされていません")
     
+    def test_overlapping_groups_merged(self):
+        """
+        重複するグループ監視の読み出し統合のテスト
+        """
+        # モニターインスタンスを作成
+        monitor = PlcMonitor(self.mock_plc)
+
+        # 範囲が重複する2つのグループ監視を追加 (D100-149とD120-169)
+        monitor.add_devices('D', 100, 50)
+        monitor.add_devices('D', 120, 50)
+
+        # ポーリング時には重複範囲が1回の読み出しに統合されることを確認
+        self.mock_plc.reset_calls()
+        monitor.poll_once()
+        self.assertEqual(self.mock_plc.calls, [('read_devices', 'D', 100, 70)],
+                         "重複範囲が1回の読み出しに統合されていません")
+
+    def test_coalesced_polling(self):
+        """
+        連続する単一デバイス監視の読み出し統合のテスト
+        """
+        # モニターインスタンスを作成
+        monitor = PlcMonitor(self.mock_plc)
+
+        # 連続した番号の単一デバイス監視を追加
+        monitor.add_device('D', 100)
+        monitor.add_device('D', 101)
+        monitor.add_device('D', 102)
+
+        # ポーリング時には連続範囲が1回の一括読み出しに統合されることを確認
+        self.mock_plc.reset_calls()
+        monitor.poll_once()
+        self.assertEqual(self.mock_plc.calls, [('read_devices', 'D', 100, 3)],
+                         "連続するデバイスが1回の読み出しに統合されていません")
+
     def test_start_stop(self):
         """
         監視の開始と停止のテスト
         """
         # モニターインスタンスを作成
         monitor = PlcMonitor(self.mock_plc)
-        
-        # 監視開始
-        monitor.start(interval=0.1)
-        
+        monitor.add_device('D', 100)
+        self.mock_plc.reset_calls()
+
+        # 監視開始 (テストではスレッドを起動せず状態遷移のみ検証する)
+        monitor.start(interval=0.1, _test_no_thread=True)
+
         # 実行状態のチェック
         self.assertTrue(monitor.running, "監視が開始されていません")
-        self.assertIsNotNone(monitor.thread, "スレッドが作成されていません")
         self.assertEqual(monitor.interval, 0.1, "監視間隔が設定されていません")
-        
+
+        # ポーリングは呼び出し側から同期的に駆動できる
+        monitor.poll_once()
+        self.assertEqual(self.mock_plc.calls, [('read_devices', 'D', 100, 1)],
+                         "ポーリングで読み出しが行われていません")
+
         # 監視停止
         monitor.stop()
-        
+
         # 停止状態のチェック
         self.assertFalse(monitor.running, "監視が停止されていません")
     
@@ -204,21 +294,26 @@ class TestPlcMonitorMock(unittest.TestCase):
         """
         デバイス値変更検出のテスト
         """
+        # コールバック呼び出しを記録するリストと関数を作成
+        calls = []
+
+        def callback(*args):
+            calls.append(args)
+
         # モニターインスタンスを作成
-        callback = MagicMock()
         monitor = PlcMonitor(self.mock_plc)
-        
+
         # デバイス監視を追加
         device_monitor = monitor.add_device('D', 100, callback)
-        
+
         # 初期値を設定
         device_monitor.last_value = 10
-        
+
         # 値の変更をシミュレート
         device_monitor.update(20)
-        
+
         # コールバック呼び出しをチェック
-        callback.assert_called_once_with('D', 100, 10, 20)
+        self.assertEqual(calls, [('D', 100, 10, 20)], "コールバックが正しく呼び出されていません")
         
         # 更新後の値をチェック
         self.assertEqual(device_monitor.last_value, 20, "値が更新されていません")
@@ -227,42 +322,81 @@ class TestPlcMonitorMock(unittest.TestCase):
         """
         デバイスグループ値変更検出のテスト
         """
+        # コールバック呼び出しを記録するリストと関数を作成
+        calls = []
+
+        def callback(*args):
+            calls.append(args)
+
         # モニターインスタンスを作成
-        callback = MagicMock()
         monitor = PlcMonitor(self.mock_plc)
-        
+
         # デバイスグループ監視を追加
         group_monitor = monitor.add_devices('D', 100, 3, callback)
-        
+
         # 初期値を設定
         group_monitor.last_values = [10, 20, 30]
-        
+
         # 値の変更をシミュレート
         group_monitor.update([10, 25, 30])
-        
+
         # コールバック呼び出しをチェック (D101の値のみが変更)
-        callback.assert_called_once_with('D', 101, 20, 25)
+        self.assertEqual(calls, [('D', 101, 20, 25)], "コールバックが正しく呼び出されていません")
         
         # 更新後の値をチェック
         self.assertEqual(group_monitor.last_values, [10, 25, 30], "値が更新されていません")
     
+    def test_group_batch_callback(self):
+        """
+        デバイスグループの一括コールバックのテスト
+        """
+        # コールバック呼び出しを記録するリストと関数を作成
+        calls = []
+
+        def batch_callback(*args):
+            calls.append(args)
+
+        # モニターインスタンスを作成
+        monitor = PlcMonitor(self.mock_plc)
+
+        # 一括コールバック付きのグループ監視を追加
+        group_monitor = monitor.add_devices('D', 100, 3, batch_callback=batch_callback)
+
+        # 初期値を設定
+        group_monitor.last_values = [10, 20, 30]
+
+        # 複数の値の変更をシミュレート
+        group_monitor.update([11, 20, 33])
+
+        # 変化が1回の呼び出しにまとめられることをチェック
+        self.assertEqual(calls, [('D', 100, [10, 20, 30], [11, 20, 33], [0, 2])],
+                         "一括コールバックが正しく呼び出されていません")
+
+        # 更新後の値をチェック
+        self.assertEqual(group_monitor.last_values, [11, 20, 33], "値が更新されていません")
+
     def test_error_handling(self):
         """
         エラーハンドリングのテスト
         """
+        # エラーコールバック呼び出しを記録するリストと関数を作成
+        errors = []
+
+        def error_callback(*args):
+            errors.append(args)
+
         # モニターインスタンスを作成
-        error_callback = MagicMock()
         monitor = PlcMonitor(self.mock_plc)
-        
+
         # デバイス監視を追加
         device_monitor = monitor.add_device('D', 100, on_error=error_callback)
-        
+
         # エラーを発生させる
         error = PlcError("テストエラー")
         device_monitor.handle_error(error)
-        
+
         # エラーコールバック呼び出しをチェック
-        error_callback.assert_called_once_with('D', 100, error)
+        self.assertEqual(errors, [('D', 100, error)], "エラーコールバックが正しく呼び出されていません")
 
 
 if __name__ == '__main__':
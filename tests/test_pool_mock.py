@@ -0,0 +1,151 @@
+"""
+test_pool_mock.py - 接続プールクラスのモックテスト
+
+本モジュールでは、実際のPLC通信をモックして、PlcClientPoolとPlcConnectionPoolの
+機能をテストします。接続の再利用、例外後の再接続、プール枯渇時の動作をテストします。
+"""
+
+import queue
+import threading
+import unittest
+from unittest.mock import patch
+
+from mcplcwatch import PlcClientPool, PlcConnectionPool
+
+from test_client_mock import _FakeSocket
+
+
+class TestPlcPoolMock(unittest.TestCase):
+    """
+    PlcClientPoolとPlcConnectionPoolのモックテスト
+
+    テスト内容:
+    - 同一キー/同一スレッドでの接続再利用が正しいか
+    - 借り出しと返却の会計が正しく動作するか
+    - 例外発生後の再接続とプール枯渇時のタイムアウトが正しく動作するか
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        クラス全体の準備
+
+        socket.socketをクラス単位で1回だけパッチし、作成されたテストダブルを
+        cls.socketsに記録します。各テストはソケットの作成数やclosed状態から
+        プールの接続管理を検証します。
+        """
+        cls.sockets = []
+
+        def _make_socket(family=None, type=None):
+            sock = _FakeSocket(family, type)
+            cls.sockets.append(sock)
+            return sock
+
+        cls._patcher = patch('socket.socket', _make_socket)
+        cls._patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        クラス全体の後始末
+        """
+        cls._patcher.stop()
+
+    def setUp(self):
+        """
+        テスト前の準備 (作成済みソケットの記録をリセットする)
+        """
+        type(self).sockets.clear()
+
+    def test_client_pool_reuses_connection(self):
+        """
+        同一キーに対するクライアント再利用のテスト
+        """
+        pool = PlcClientPool()
+
+        # 同じキーでの2回目の取得は同一クライアントを返す
+        first = pool.get("192.168.0.1", 5000)
+        second = pool.get("192.168.0.1", 5000)
+        self.assertIs(first, second, "同一キーのクライアントが再利用されていません")
+        self.assertEqual(len(self.sockets), 1, "接続が再利用されずに再作成されています")
+
+        # 異なるキーでは別のクライアントが作成される
+        other = pool.get("192.168.0.2", 5000)
+        self.assertIsNot(first, other, "異なるキーで同一クライアントが返されました")
+
+        # close_allですべての接続が閉じられる
+        pool.close_all()
+        self.assertTrue(all(sock.closed for sock in self.sockets), "接続が閉じられていません")
+
+    def test_client_pool_per_thread(self):
+        """
+        スレッドごとのクライアント分離のテスト
+        """
+        pool = PlcClientPool()
+        main_client = pool.get("192.168.0.1", 5000)
+
+        # 別スレッドからの取得は別のクライアントを返す (PlcClientはスレッドセーフではない)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(pool.get("192.168.0.1", 5000)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(main_client, results[0], "別スレッドに同一クライアントが貸し出されました")
+
+        pool.close_all()
+
+    def test_connection_pool_borrow_returns_client(self):
+        """
+        接続の借り出しと返却のテスト
+        """
+        pool = PlcConnectionPool("192.168.0.1", 5000, size=1)
+
+        # 借り出した接続は接続済みで、返却後は同一の接続が再利用される
+        with pool.borrow() as plc:
+            self.assertTrue(plc.connected, "借り出した接続が接続されていません")
+            borrowed = plc
+        with pool.borrow() as plc:
+            self.assertIs(plc, borrowed, "返却された接続が再利用されていません")
+
+        pool.close_all()
+
+    def test_connection_pool_reconnect_after_exception(self):
+        """
+        例外発生後の再接続のテスト
+        """
+        pool = PlcConnectionPool("192.168.0.1", 5000, size=1)
+        socket_count = len(self.sockets)
+
+        # withブロック内の例外は伝播し、接続は再接続してから返却される
+        with self.assertRaises(ValueError):
+            with pool.borrow() as plc:
+                raise ValueError("テストエラー")
+
+        self.assertEqual(len(self.sockets), socket_count + 1, "例外後に再接続されていません")
+
+        # 再接続済みの接続がプールに返却されている
+        with pool.borrow() as plc:
+            self.assertTrue(plc.connected, "返却された接続が接続されていません")
+
+        pool.close_all()
+
+    def test_connection_pool_exhaustion_timeout(self):
+        """
+        プール枯渇時のタイムアウトのテスト
+        """
+        pool = PlcConnectionPool("192.168.0.1", 5000, size=1)
+
+        # 唯一の接続を借り出した状態では、追加の取得はタイムアウトする
+        client = pool.acquire()
+        with self.assertRaises(queue.Empty):
+            pool.acquire(timeout=0.01)
+
+        # 返却後は再び取得できる
+        pool.release(client)
+        self.assertIs(pool.acquire(timeout=0.01), client, "返却した接続を取得できません")
+        pool.release(client)
+
+        pool.close_all()
+
+
+if __name__ == '__main__':
+    unittest.main()
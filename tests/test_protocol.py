@@ -5,10 +5,34 @@ test_protocol.py - MCプロトコル関連機能のユニットテスト
 実際のPLC通信は行わず、生成されたフレームの形式と内容が正しいかを検証します。
 """
 
+import struct
 import unittest
 from mcplcwatch.protocol import MCProtocol
 
 
+# 応答解析テストで使用する定型応答バイト列 (テストごとに再構築しないようモジュールスコープで定義)
+
+# 3Eフレーム 5ワード読み出し応答
+# サブヘッダ(2バイト) + アクセス経路(7バイト) + 応答コード(2バイト) + データ(2バイト×5)
+# データ部はリトルエンディアンのワード列としてstruct.packで生成する
+_MOCK_RESPONSE_3E = bytes([
+    0x50, 0x00,  # サブヘッダ
+    0x00, 0xFF, 0xFF, 0x03, 0x00, 0x0A, 0x00,  # アクセス経路
+    0x00, 0x00,  # 応答コード (正常)
+]) + struct.pack('<5H', 1, 2, 3, 4, 5)  # データ: 1〜5
+
+# 4Eフレーム 5ワード読み出し応答
+# サブヘッダ(2バイト) + 応答データ長(2バイト) + 完了コード(2バイト) +
+# アクセス経路(7バイト) + 応答コード(2バイト) + データ(2バイト×5)
+_MOCK_RESPONSE_4E = bytes([
+    0x54, 0x00,  # サブヘッダ
+    0x10, 0x00,  # 応答データ長
+    0x00, 0x00,  # 完了コード
+    0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0x03, 0x00,  # アクセス経路
+    0x00, 0x00,  # 応答コード (正常)
+]) + struct.pack('<5H', 1, 2, 3, 4, 5)  # データ: 1〜5
+
+
 class TestMCProtocol(unittest.TestCase):
     """
     MCProtocolクラスのユニットテスト
@@ -36,9 +60,9 @@ class TestMCProtocol(unittest.TestCase):
         self.assertEqual(MCProtocol.FRAME_3E, "3E", "3Eフレームタイプが正しくありません")
         self.assertEqual(MCProtocol.FRAME_4E, "4E", "4Eフレームタイプが正しくありません")
         
-        # サブヘッダ定義が正しいか確認
-        self.assertEqual(tuple(MCProtocol.SUBHEADER[MCProtocol.FRAME_3E]), (0x50, 0x00), "3Eフレームのサブヘッダが正しくありません")
-        self.assertEqual(tuple(MCProtocol.SUBHEADER[MCProtocol.FRAME_4E]), (0x54, 0x00), "4Eフレームのサブヘッダが正しくありません")
+        # サブヘッダがbytes定数として定義されているか確認
+        self.assertEqual(MCProtocol.SUBHEADER[MCProtocol.FRAME_3E], b'\x50\x00', "3Eフレームのサブヘッダが正しくありません")
+        self.assertEqual(MCProtocol.SUBHEADER[MCProtocol.FRAME_4E], b'\x54\x00', "4Eフレームのサブヘッダが正しくありません")
     
     def test_zero_padding(self):
         """
@@ -70,89 +94,112 @@ class TestMCProtocol(unittest.TestCase):
         # 要素数 256 -> 16進数で "0100" -> バイト配列 [0x00, 0x01]
         self.assertEqual(MCProtocol.element_to_bytes(256), [0x00, 0x01], "要素数のバイト変換が正しくありません")
     
-    def test_create_3e_read_frame(self):
+    def test_create_read_frame(self):
         """
-        3Eフレームの読み出しフレーム生成が正しいかテスト
+        3E/4Eフレームの読み出しフレーム生成が正しいかテスト
         """
-        # Dデバイスの読み出しフレーム生成
-        frame = MCProtocol.create_read_frame('D', 100, 10, False, MCProtocol.FRAME_3E)
-        
-        # フレーム形式のチェック
-        self.assertIsInstance(frame, bytes, "生成されたフレームがbytes型ではありません")
-        
-        # サブヘッダの確認
-        self.assertEqual(frame[0], 0x50, "3Eフレームのサブヘッダが正しくありません")
-        self.assertEqual(frame[1], 0x00, "3Eフレームのサブヘッダが正しくありません")
-        
-        # コマンドの確認
-        self.assertEqual(frame[11], 0x01, "読み出しコマンドが正しくありません")
-        self.assertEqual(frame[12], 0x04, "読み出しコマンドが正しくありません")
-        
-        # デバイス番号の確認
-        self.assertEqual(frame[15], 0x64, "デバイス番号のバイト[0]が正しくありません")
-        self.assertEqual(frame[16], 0x00, "デバイス番号のバイト[1]が正しくありません")
-        self.assertEqual(frame[17], 0x00, "デバイス番号のバイト[2]が正しくありません")
-        
-        # デバイスコードの確認 (位置を修正)
-        self.assertEqual(frame[18], 0xA8, "デバイスコードが正しくありません")
-        
-        # 要素数の確認
-        self.assertEqual(frame[19], 0x0A, "要素数のバイト[0]が正しくありません")
-        self.assertEqual(frame[20], 0x00, "要素数のバイト[1]が正しくありません")
-    
-    def test_create_4e_read_frame(self):
+        # フレームタイプごとの (サブヘッダ先頭バイト, コマンド開始位置)
+        # 4Eフレームはシリアル番号(2バイト)と予備(2バイト)の分だけ後方にずれる
+        cases = [
+            (MCProtocol.FRAME_3E, 0x50, 11),
+            (MCProtocol.FRAME_4E, 0x54, 15),
+        ]
+
+        for frame_type, subheader, cmd_index in cases:
+            with self.subTest(frame_type=frame_type):
+                # Dデバイスの読み出しフレーム生成
+                frame = MCProtocol.create_read_frame('D', 100, 10, False, frame_type)
+
+                # フレーム形式のチェック
+                self.assertIsInstance(frame, bytes, "生成されたフレームがbytes型ではありません")
+
+                # サブヘッダの確認
+                self.assertEqual(frame[0], subheader, "フレームのサブヘッダが正しくありません")
+                self.assertEqual(frame[1], 0x00, "フレームのサブヘッダが正しくありません")
+
+                # コマンドの確認
+                self.assertEqual(frame[cmd_index], 0x01, "読み出しコマンドが正しくありません")
+                self.assertEqual(frame[cmd_index + 1], 0x04, "読み出しコマンドが正しくありません")
+
+                # デバイス番号の確認
+                self.assertEqual(frame[cmd_index + 4], 0x64, "デバイス番号のバイト[0]が正しくありません")
+                self.assertEqual(frame[cmd_index + 5], 0x00, "デバイス番号のバイト[1]が正しくありません")
+                self.assertEqual(frame[cmd_index + 6], 0x00, "デバイス番号のバイト[2]が正しくありません")
+
+                # デバイスコードの確認
+                self.assertEqual(frame[cmd_index + 7], 0xA8, "デバイスコードが正しくありません")
+
+                # 要素数の確認
+                self.assertEqual(frame[cmd_index + 8], 0x0A, "要素数のバイト[0]が正しくありません")
+                self.assertEqual(frame[cmd_index + 9], 0x00, "要素数のバイト[1]が正しくありません")
+
+    def test_create_read_frame_cached(self):
         """
-        4Eフレームの読み出しフレーム生成が正しいかテスト
+        読み出しフレーム生成のメモ化が正しく動作するかテスト
         """
-        # Dデバイスの読み出しフレーム生成
-        frame = MCProtocol.create_read_frame('D', 100, 10, False, MCProtocol.FRAME_4E)
-        
-        # フレーム形式のチェック
-        self.assertIsInstance(frame, bytes, "生成されたフレームがbytes型ではありません")
-        
-        # サブヘッダの確認
-        self.assertEqual(frame[0], 0x54, "4Eフレームのサブヘッダが正しくありません")
-        self.assertEqual(frame[1], 0x00, "4Eフレームのサブヘッダが正しくありません")
-        
-        # コマンドの確認
-        self.assertEqual(frame[15], 0x01, "読み出しコマンドが正しくありません")
-        self.assertEqual(frame[16], 0x04, "読み出しコマンドが正しくありません")
-        
-        # デバイス番号の確認
-        self.assertEqual(frame[19], 0x64, "デバイス番号のバイト[0]が正しくありません")
-        self.assertEqual(frame[20], 0x00, "デバイス番号のバイト[1]が正しくありません")
-        self.assertEqual(frame[21], 0x00, "デバイス番号のバイト[2]が正しくありません")
-        
-        # デバイスコードの確認
-        self.assertEqual(frame[22], 0xA8, "デバイスコードが正しくありません")
-    
+        # キャッシュをクリアしてから同一引数で2回生成する
+        MCProtocol.create_read_frame.cache_clear()
+        first = MCProtocol.create_read_frame('D', 100, 10, False, MCProtocol.FRAME_3E)
+        second = MCProtocol.create_read_frame('D', 100, 10, False, MCProtocol.FRAME_3E)
+
+        # 同一引数では同一オブジェクトが返ることを確認
+        self.assertIs(first, second, "同一引数のフレームがキャッシュされていません")
+
+        # 異なる引数では異なるフレームが返ることを確認
+        other = MCProtocol.create_read_frame('D', 101, 10, False, MCProtocol.FRAME_3E)
+        self.assertNotEqual(first, other, "異なる引数で同一のフレームが返されました")
+
     def test_create_write_frame(self):
         """
         書き込みフレーム生成が正しいかテスト
         """
-        # Dデバイスへの書き込みフレーム生成 (D100に12345を書き込む)
-        frame = MCProtocol.create_write_frame('D', 100, 12345, False, MCProtocol.FRAME_3E)
-        
-        # フレーム形式のチェック
-        self.assertIsInstance(frame, bytes, "生成されたフレームがbytes型ではありません")
-        
-        # サブヘッダの確認
-        self.assertEqual(frame[0], 0x50, "3Eフレームのサブヘッダが正しくありません")
-        self.assertEqual(frame[1], 0x00, "3Eフレームのサブヘッダが正しくありません")
-        
-        # コマンドの確認
-        self.assertEqual(frame[11], 0x01, "書き込みコマンドが正しくありません")
-        self.assertEqual(frame[12], 0x14, "書き込みコマンドが正しくありません")
+        cases = [
+            (MCProtocol.FRAME_3E, 0x50, 11),
+            (MCProtocol.FRAME_4E, 0x54, 15),
+        ]
+
+        for frame_type, subheader, cmd_index in cases:
+            with self.subTest(frame_type=frame_type):
+                # Dデバイスへの書き込みフレーム生成 (D100に12345を書き込む)
+                frame = MCProtocol.create_write_frame('D', 100, 12345, False, frame_type)
+
+                # フレーム形式のチェック
+                self.assertIsInstance(frame, bytes, "生成されたフレームがbytes型ではありません")
+
+                # サブヘッダの確認
+                self.assertEqual(frame[0], subheader, "フレームのサブヘッダが正しくありません")
+                self.assertEqual(frame[1], 0x00, "フレームのサブヘッダが正しくありません")
+
+                # コマンドの確認
+                self.assertEqual(frame[cmd_index], 0x01, "書き込みコマンドが正しくありません")
+                self.assertEqual(frame[cmd_index + 1], 0x14, "書き込みコマンドが正しくありません")
     
+    def test_create_read_frames_batch(self):
+        """
+        読み出しフレームの一括作成が正しく動作するかテスト
+        """
+        specs = [
+            ('D', 100, 10, False),
+            ('M', 0, 16, True),
+            ('W', 0x10, 2, False),
+        ]
+
+        # 一括作成の結果が個別作成と一致することを確認
+        frames = MCProtocol.create_read_frames_batch(specs)
+        self.assertEqual(len(frames), 3, "作成されたフレーム数が正しくありません")
+        for spec, frame in zip(specs, frames):
+            device_type, device_number, element, is_bit = spec
+            expected = MCProtocol.create_read_frame(device_type, device_number, element, is_bit)
+            self.assertEqual(frame, expected, "一括作成されたフレームが個別作成と一致しません")
+
     def test_parse_string_data(self):
         """
         文字列解析が正しく動作するかテスト
         """
         # "Hello" を表現するワードデータ
-        # 'H'=0x48, 'e'=0x65, 'l'=0x6C, 'l'=0x6C, 'o'=0x6F, '\0'=0x00
-        # リトルエンディアンなので、バイトは [0x48, 0x65] -> 0x6548
-        # [0x6C, 0x6C] -> 0x6C6C, [0x6F, 0x00] -> 0x006F
-        word_data = [0x6548, 0x6C6C, 0x006F]
+        # リトルエンディアンのワード列として解釈するので、
+        # b"Hello\x00" -> [0x6548, 0x6C6C, 0x006F]
+        word_data = list(struct.unpack('<3H', b"Hello\x00"))
         
         # 解析テスト
         result = MCProtocol.parse_string_data(word_data)
@@ -162,42 +209,63 @@ class TestMCProtocol(unittest.TestCase):
         """
         読み出し応答の解析が正しく動作するかテスト
         """
-        # モック応答データ（3Eフレーム）
-        # サブヘッダ(2バイト) + アクセス経路(7バイト) + 応答コード(2バイト) + データ(2バイト×5)
-        mock_response_3e = bytes([
+        cases = [
+            (MCProtocol.FRAME_3E, _MOCK_RESPONSE_3E),
+            (MCProtocol.FRAME_4E, _MOCK_RESPONSE_4E),
+        ]
+
+        for frame_type, response in cases:
+            with self.subTest(frame_type=frame_type):
+                result = MCProtocol.parse_read_response(response, 5, False, frame_type)
+                self.assertEqual(result, [1, 2, 3, 4, 5], "応答解析が正しくありません")
+
+    def test_parse_read_response_bulk(self):
+        """
+        多点読み出し応答の解析が正しく動作するかテスト
+        """
+        # 1000ワード分の3Eフレーム応答を生成
+        count = 1000
+        words = list(range(count))
+        response = bytes([
             0x50, 0x00,  # サブヘッダ
-            0x00, 0xFF, 0xFF, 0x03, 0x00, 0x0A, 0x00,  # アクセス経路
+            0x00, 0xFF, 0xFF, 0x03, 0x00,  # アクセス経路
+        ]) + struct.pack('<H', 2 + 2 * count) + bytes([
+            0x00, 0x00,  # 応答コード (正常)
+        ]) + struct.pack('<%dH' % count, *words)
+
+        # 全ワードが順序通りに復号されることを確認
+        result = MCProtocol.parse_read_response(response, count, False, MCProtocol.FRAME_3E)
+        self.assertEqual(result, words, "多点読み出し応答の解析が正しくありません")
+
+    def test_parse_read_response_zc(self):
+        """
+        コピーなし読み出し応答解析が正しく動作するかテスト
+        """
+        # モック応答データ（3Eフレーム、ワードデバイス）
+        mock_response = bytes([
+            0x50, 0x00,  # サブヘッダ
+            0x00, 0xFF, 0xFF, 0x03, 0x00, 0x08, 0x00,  # アクセス経路
             0x00, 0x00,  # 応答コード (正常)
             0x01, 0x00,  # データ1: 1
             0x02, 0x00,  # データ2: 2
             0x03, 0x00,  # データ3: 3
-            0x04, 0x00,  # データ4: 4
-            0x05, 0x00,  # データ5: 5
         ])
-        
-        # 解析テスト（3Eフレーム）
-        result_3e = MCProtocol.parse_read_response(mock_response_3e, 5, False, MCProtocol.FRAME_3E)
-        self.assertEqual(result_3e, [1, 2, 3, 4, 5], "3Eフレームの応答解析が正しくありません")
-        
-        # モック応答データ（4Eフレーム）
-        # サブヘッダ(2バイト) + 応答データ長(2バイト) + 完了コード(2バイト) + 
-        # アクセス経路(7バイト) + 応答コード(2バイト) + データ(2バイト×5)
-        mock_response_4e = bytes([
-            0x54, 0x00,  # サブヘッダ
-            0x10, 0x00,  # 応答データ長
-            0x00, 0x00,  # 完了コード
-            0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0x03, 0x00,  # アクセス経路
+
+        # 解析テスト（ワードデバイス: array.arrayが返る）
+        result = MCProtocol.parse_read_response_zc(mock_response, 3, False, MCProtocol.FRAME_3E)
+        self.assertEqual(result.tolist(), [1, 2, 3], "コピーなし応答解析が正しくありません")
+
+        # モック応答データ（3Eフレーム、ビットデバイス）
+        mock_response_bit = bytes([
+            0x50, 0x00,  # サブヘッダ
+            0x00, 0xFF, 0xFF, 0x03, 0x00, 0x05, 0x00,  # アクセス経路
             0x00, 0x00,  # 応答コード (正常)
-            0x01, 0x00,  # データ1: 1
-            0x02, 0x00,  # データ2: 2
-            0x03, 0x00,  # データ3: 3
-            0x04, 0x00,  # データ4: 4
-            0x05, 0x00,  # データ5: 5
+            0x01, 0x00, 0x01,  # データ: ON, OFF, ON
         ])
-        
-        # 解析テスト（4Eフレーム）
-        result_4e = MCProtocol.parse_read_response(mock_response_4e, 5, False, MCProtocol.FRAME_4E)
-        self.assertEqual(result_4e, [1, 2, 3, 4, 5], "4Eフレームの応答解析が正しくありません")
+
+        # 解析テスト（ビットデバイス: 応答バッファを参照するmemoryviewが返る）
+        result_bit = MCProtocol.parse_read_response_zc(mock_response_bit, 3, True, MCProtocol.FRAME_3E)
+        self.assertEqual(bytes(result_bit), bytes([0x01, 0x00, 0x01]), "ビットデバイスのコピーなし応答解析が正しくありません")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,71 @@
+"""
+test_shm_mock.py - 共有メモリ公開機能のモックテスト
+
+本モジュールでは、実際のPLC通信をモックして、共有メモリへの監視値公開機能を
+テストします。公開側と読み出し側のラウンドトリップをテストします。
+"""
+
+import struct
+import unittest
+from unittest.mock import MagicMock
+from mcplcwatch import PlcClient, PlcMonitor
+from mcplcwatch.shm import SharedMemoryPublisher, SharedMemoryReader
+
+
+class TestSharedMemoryMock(unittest.TestCase):
+    """
+    共有メモリ公開機能のモックテスト
+
+    テスト内容:
+    - 公開と読み出しのラウンドトリップが正しく動作するか
+    - モニターのポーリング結果が共有メモリへ公開されるか
+    """
+
+    def test_publish_and_read(self):
+        """
+        公開と読み出しのラウンドトリップのテスト
+        """
+        publisher = SharedMemoryPublisher(size=64)
+        reader = SharedMemoryReader(publisher.name)
+        try:
+            payload = bytes([0x01, 0x02, 0x03, 0x04])
+            publisher.publish(payload)
+
+            seq, data = reader.read(len(payload))
+            self.assertEqual(seq, 2, "シーケンス番号が正しくありません")
+            self.assertEqual(data, payload, "読み出したペイロードが正しくありません")
+
+            # 2回目の公開でシーケンス番号が進むことを確認
+            publisher.publish(bytes([0x05, 0x06, 0x07, 0x08]))
+            seq, data = reader.read(4)
+            self.assertEqual(seq, 4, "シーケンス番号が更新されていません")
+            self.assertEqual(data, bytes([0x05, 0x06, 0x07, 0x08]), "読み出したペイロードが正しくありません")
+        finally:
+            reader.close()
+            publisher.close()
+
+    def test_monitor_publishes_snapshot(self):
+        """
+        モニターのポーリング結果の公開のテスト
+        """
+        # PLCクライアントのモック作成
+        mock_plc = MagicMock(spec=PlcClient)
+        mock_plc.read_devices.return_value = [100, 200, 300]
+
+        monitor = PlcMonitor(mock_plc)
+        monitor.add_devices('D', 100, 3)
+        publisher = monitor.enable_shm(size=64)
+        reader = SharedMemoryReader(publisher.name)
+        try:
+            monitor.poll_once()
+
+            # 公開されたスナップショットを確認 (3ワード、リトルエンディアン)
+            seq, data = reader.read(6)
+            self.assertEqual(struct.unpack('<3H', data), (100, 200, 300), "公開された値が正しくありません")
+        finally:
+            reader.close()
+            publisher.close()
+
+
+if __name__ == '__main__':
+    unittest.main()